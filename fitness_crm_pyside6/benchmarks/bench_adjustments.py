@@ -0,0 +1,78 @@
+# benchmarks/bench_adjustments.py
+"""Порівняння ланцюжка PIL ImageEnhance з однопрохідним adjust_rgb.
+
+Запуск з папки fitness_crm_pyside6:
+    python -m benchmarks.bench_adjustments [ширина] [висота] [повтори]
+"""
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageEnhance
+
+from utils.image_processor import adjust_rgb
+
+
+# (яскравість, контраст, насиченість, різкість) — як коефіцієнти ImageEnhance
+CASES = {
+    'яскравість': (1.2, 1.0, 1.0, 1.0),
+    'яскр.+контраст': (1.1, 1.3, 1.0, 1.0),
+    'колір (3 корекції)': (1.1, 1.2, 1.4, 1.0),
+    'всі 4 корекції': (1.1, 1.2, 1.4, 1.8),
+}
+
+
+def make_photo(width: int, height: int) -> Image.Image:
+    """Синтетичне фото: плавні градієнти + шум (схоже на реальний JPEG)"""
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    base = np.stack([x / width * 200, y / height * 180, (x + y) / (width + height) * 220], axis=-1)
+    noise = np.random.default_rng(0).normal(0, 12, base.shape)
+    return Image.fromarray(np.clip(base + noise + 20, 0, 255).astype(np.uint8), 'RGB')
+
+
+def pil_chain(image: Image.Image, brightness, contrast, saturation, sharpness) -> np.ndarray:
+    """Поточний підхід: окремий повний прохід ImageEnhance на кожну корекцію + tobytes"""
+    img = image.copy()
+    if brightness != 1.0:
+        img = ImageEnhance.Brightness(img).enhance(brightness)
+    if contrast != 1.0:
+        img = ImageEnhance.Contrast(img).enhance(contrast)
+    if saturation != 1.0:
+        img = ImageEnhance.Color(img).enhance(saturation)
+    if sharpness != 1.0:
+        img = ImageEnhance.Sharpness(img).enhance(sharpness)
+    data = img.convert('RGB').tobytes('raw', 'RGB')
+    return np.frombuffer(data, dtype=np.uint8).reshape(image.height, image.width, 3)
+
+
+def best_time(func, repeats: int) -> float:
+    """Найкращий час з кількох запусків (мс)"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    height = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    image = make_photo(width, height)
+    pixels = np.asarray(image)
+    out = np.empty_like(pixels)
+
+    print(f"📐 Зображення {width}x{height}, найкращий з {repeats} запусків")
+    print(f"{'корекції':<22}{'PIL, мс':>10}{'NumPy, мс':>12}{'прискорення':>14}{'макс. різниця':>16}")
+    for name, factors in CASES.items():
+        pil_ms = best_time(lambda: pil_chain(image, *factors), repeats)
+        fused_ms = best_time(lambda: adjust_rgb(pixels, *factors, out=out), repeats)
+        diff = np.abs(pil_chain(image, *factors).astype(np.int16) - out.astype(np.int16))
+        print(f"{name:<22}{pil_ms:>10.1f}{fused_ms:>12.1f}{pil_ms / fused_ms:>13.1f}x"
+              f"{int(diff.max()):>10} (сер. {diff.mean():.2f})")
+
+
+if __name__ == "__main__":
+    main()
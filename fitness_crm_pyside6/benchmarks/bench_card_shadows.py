@@ -0,0 +1,83 @@
+# benchmarks/bench_card_shadows.py
+"""Порівняння QGraphicsDropShadowEffect з кешованими nine-patch тінями PhotoCard.
+
+Запуск з папки fitness_crm_pyside6 (без дисплея — QT_QPA_PLATFORM=offscreen):
+    python -m benchmarks.bench_card_shadows [карток] [повтори]
+"""
+import contextlib
+import io
+import sys
+import time
+
+from PySide6.QtWidgets import QApplication, QGridLayout, QWidget
+
+from ui.widgets import card_shadow
+from ui.widgets.card_shadow import CARD_SHADOW, CARD_SHADOW_HOVER
+
+
+COLUMNS = 4
+
+
+def build_grid(count: int, cached: bool) -> QWidget:
+    """Сітка з count карток PhotoCard з вибраним способом тіні"""
+    from ui.widgets.photo_card import PhotoCard
+
+    card_shadow.USE_CACHED_SHADOWS = cached
+    container = QWidget()
+    layout = QGridLayout(container)
+    layout.setSpacing(25)
+    # PhotoCard друкує налагоджувальні рядки при створенні
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(count):
+            client = {'id': f'bench-{i}', 'first_name': 'Клієнт', 'last_name': str(i), 'phone': '+380000000000'}
+            layout.addWidget(PhotoCard(client), i // COLUMNS, i % COLUMNS)
+    container.adjustSize()
+    return container
+
+
+def best_time(func, repeats: int) -> float:
+    """Найкращий час з кількох запусків (мс)"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def toggle_hover(container: QWidget):
+    """Наведення на кожну картку: зміна тіні + рендер картки"""
+    from ui.widgets.photo_card import PhotoCard
+
+    for card in container.findChildren(PhotoCard):
+        card._set_shadow_spec(CARD_SHADOW_HOVER)
+        card.grab()
+        card._set_shadow_spec(CARD_SHADOW)
+        card.grab()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"🃏 {count} карток PhotoCard, найкращий з {repeats} запусків")
+    print(f"{'тінь':<26}{'рендер сітки, мс':>18}{'наведення, мс':>16}")
+    results = {}
+    for name, cached in (('QGraphicsDropShadowEffect', False), ('кешований nine-patch', True)):
+        container = build_grid(count, cached)
+        container.grab()  # прогрів: стилі, шрифти, заготовки тіней
+        render_ms = best_time(container.grab, repeats)
+        hover_ms = best_time(lambda: toggle_hover(container), repeats)
+        results[cached] = render_ms
+        print(f"{name:<26}{render_ms:>18.1f}{hover_ms:>16.1f}")
+        container.deleteLater()
+        app.processEvents()
+
+    print(f"⚡ Прискорення рендеру: {results[False] / results[True]:.1f}x")
+    card_shadow.USE_CACHED_SHADOWS = True
+
+
+if __name__ == "__main__":
+    main()
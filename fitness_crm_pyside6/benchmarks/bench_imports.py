@@ -0,0 +1,107 @@
+# benchmarks/bench_imports.py
+"""Бюджет часу імпорту: старт програми та відкриття діалогу редагування клієнта.
+
+1. python -X importtime для модулів головного вікна — загальний час та найдорожчі модулі.
+2. Відкриття EditClientDialog у «холодному» процесі: лінивий режим (лише видима вкладка)
+   проти створення всіх восьми вкладок одразу (LAZY_TABS = False).
+
+Запуск з папки fitness_crm_pyside6:
+    python -m benchmarks.bench_imports [повтори] [топ_модулів]
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+DIALOG_RE = re.compile(r'dialog_ms=([\d.]+) all_tabs_ms=([\d.]+)')
+APP_PACKAGES = ('ui', 'models', 'utils', 'config', 'analytics')
+
+DIALOG_SCRIPT = """
+import contextlib, io, sys, time
+sys.path.insert(0, '.')
+from PySide6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+with contextlib.redirect_stdout(io.StringIO()):
+    import ui.main_window  # Модулі, що вже завантажені на момент відкриття діалогу
+
+    start = time.perf_counter()
+    from ui.dialogs.edit_client import main_dialog
+    main_dialog.LAZY_TABS = sys.argv[1] == 'lazy'
+    dialog = main_dialog.EditClientDialog({'id': 'bench', 'first_name': 'Клієнт', 'surname': 'Тест'})
+    dialog_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for index in range(dialog.tab_widget.count()):
+        dialog.tab_widget.setCurrentIndex(index)
+    all_tabs_ms = (time.perf_counter() - start) * 1000
+print(f"dialog_ms={dialog_ms:.1f} all_tabs_ms={all_tabs_ms:.1f}")
+"""
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env['PYTHONIOENCODING'] = 'utf-8'
+    return env
+
+
+def import_times(module: str):
+    """-X importtime для module: {модуль: (власний, накопичений) мкс} та загальний час у мс"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=PROJECT_DIR, env=_env(), capture_output=True, text=True, encoding='utf-8')
+    times = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = int(match.group(1)), int(match.group(2)), match.group(3), match.group(4)
+        times[name] = (self_us, cumulative_us)
+        if len(indent) == 1:  # Модулі верхнього рівня
+            total_us += cumulative_us
+    return times, total_us / 1000
+
+
+def dialog_open(mode: str):
+    """Час відкриття діалогу та обходу всіх вкладок у свіжому процесі (мс)"""
+    result = subprocess.run([sys.executable, '-c', DIALOG_SCRIPT, mode], cwd=PROJECT_DIR, env=_env(),
+                            capture_output=True, text=True, encoding='utf-8', timeout=120)
+    match = DIALOG_RE.search(result.stdout)
+    if match is None:
+        raise RuntimeError(f"Немає результату вимірювання:\n{result.stdout[-2000:]}\n{result.stderr[-2000:]}")
+    return float(match.group(1)), float(match.group(2))
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+
+    runs = [import_times('ui.main_window') for _ in range(repeats)]
+    times = runs[-1][0]
+    print(f"📦 Імпорт ui.main_window: медіана {statistics.median(run[1] for run in runs):.0f} мс з {repeats} запусків")
+
+    app_modules = sorted((item for item in times.items() if item[0].split('.')[0] in APP_PACKAGES),
+                         key=lambda item: item[1][1], reverse=True)[:top]
+    print(f"{'модуль програми':<50}{'власний, мс':>14}{'разом, мс':>12}")
+    for name, (self_us, cumulative_us) in app_modules:
+        print(f"{name:<50}{self_us / 1000:>14.1f}{cumulative_us / 1000:>12.1f}")
+
+    for heavy in ('PIL.Image', 'webbrowser', 'ui.dialogs.photo_compare', 'ui.dialogs.edit_client.physical_tab_new'):
+        print(f"   {heavy:<47}{'імпортується при старті' if heavy in times else 'за потреби'}")
+
+    print()
+    print(f"🪟 Відкриття EditClientDialog, медіана з {repeats} процесів")
+    print(f"{'режим':<22}{'відкриття, мс':>16}{'всі вкладки, мс':>18}")
+    for name, mode in (('всі вкладки одразу', 'eager'), ('лінивий', 'lazy')):
+        results = [dialog_open(mode) for _ in range(repeats)]
+        print(f"{name:<22}{statistics.median(r[0] for r in results):>16.1f}"
+              f"{statistics.median(r[1] for r in results):>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
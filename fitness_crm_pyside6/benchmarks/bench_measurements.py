@@ -0,0 +1,95 @@
+# benchmarks/bench_measurements.py
+"""Запити історії замірів: діапазон дат та агреговані точки для графіка одного клієнта.
+
+Тимчасова БД (робоча не змінюється) з N клієнтами, у кожного — щотижневі заміри
+всіх показників за кілька років. Час запитів вимірюється з індексом (client_id, date)
+та після його видалення (повне сканування таблиці).
+
+Запуск з папки fitness_crm_pyside6:
+    python -m benchmarks.bench_measurements [клієнтів] [років] [повтори]
+"""
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlmodel import SQLModel
+
+from models import measurement_history
+from models.client import Client
+from models.measurement import Measurement
+
+
+def make_database(path: str, clients: int, years: int):
+    """БД з клієнтами та щотижневими замірами всіх показників"""
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine, tables=[Client.__table__, Measurement.__table__])
+    metrics = list(measurement_history.SNAPSHOT_FIELDS.values())
+    first_day = date.today() - timedelta(weeks=52 * years)
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO clients(id, first_name, last_name, is_active, created_at, updated_at) "
+            "VALUES (?, 'Клієнт', ?, 1, '2020-01-01', '2020-01-01')",
+            [(f'bench-{i:05d}', str(i)) for i in range(clients)])
+        for week in range(52 * years):
+            measured_on = (first_day + timedelta(weeks=week)).isoformat()
+            connection.exec_driver_sql(
+                f"INSERT INTO {measurement_history.TABLE}(client_id, date, metric, value, recorded_at) "
+                "VALUES (?, ?, ?, ?, '2020-01-01')",
+                [(f'bench-{i:05d}', measured_on, metric, 50 + (i + week + index) % 40)
+                 for i in range(clients) for index, metric in enumerate(metrics)])
+    return engine
+
+
+def median_time(func, repeats: int) -> float:
+    """Медіана часу виконання (мс)"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    workspace = tempfile.mkdtemp(prefix='fitness-measurements-')
+    try:
+        engine = make_database(os.path.join(workspace, 'bench.db'), clients, years)
+        client_id = f'bench-{clients // 2:05d}'
+        last_year = date.today() - timedelta(days=365)
+        queries = {
+            'вся історія (всі показники)': lambda c: measurement_history.history(c, client_id),
+            'вага за останній рік': lambda c: measurement_history.history(c, client_id, ['weight'], last_year),
+            'останні значення': lambda c: measurement_history.latest(c, client_id),
+            'графік: 120 точок, 11 показників': lambda c: measurement_history.downsample(c, client_id),
+            'графік ваги по місяцях': lambda c: measurement_history.downsample(c, client_id, ['weight'], period='month'),
+        }
+
+        with engine.connect() as connection:
+            rows = connection.exec_driver_sql(f"SELECT count(*) FROM {measurement_history.TABLE}").scalar()
+            indexed = {name: median_time(lambda: query(connection), repeats) for name, query in queries.items()}
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX ix_measurements_client_date")
+        with engine.connect() as connection:
+            scanned = {name: median_time(lambda: query(connection), max(1, repeats // 10)) for name, query in queries.items()}
+
+        print(f"📏 {rows} рядків історії: {clients} клієнтів × {years} р. щотижневих замірів, медіана")
+        print(f"{'запит одного клієнта':<36}{'з індексом, мс':>16}{'без індексу, мс':>18}")
+        for name in queries:
+            print(f"{name:<36}{indexed[name]:>16.2f}{scanned[name]:>18.1f}")
+        engine.dispose()
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
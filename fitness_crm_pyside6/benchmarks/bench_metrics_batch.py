@@ -0,0 +1,105 @@
+# benchmarks/bench_metrics_batch.py
+"""Скалярний FitnessCalculator.calculate_all_metrics у циклі проти векторизованого calculate_metrics_batch.
+
+Синтетична вибірка з пропусками (None) у кожному стовпці; результати порівнюються
+поелементно (None ↔ NaN), розбіжності округлення показуються окремо.
+
+Запуск з папки fitness_crm_pyside6:
+    python -m benchmarks.bench_metrics_batch [рядків] [повтори]
+"""
+import sys
+import time
+
+import numpy as np
+
+from utils.calculations import ACTIVITY_MULTIPLIERS, FitnessCalculator, get_metric_graph
+from utils.metrics_batch import HR_ZONES, calculate_metrics_batch, metric_columns
+
+
+# Стовпець пакетного результату → як дістати те саме значення зі скалярного calculate_all_metrics
+SCALAR_VALUES = {
+    'bmi': lambda m: m['bmi'],
+    'body_fat_percentage': lambda m: m['body_fat_percentage'],
+    'ideal_weight': lambda m: m['ideal_weight'],
+    'bmr': lambda m: m['bmr'],
+    'daily_calories': lambda m: m['daily_calories'],
+    'daily_calories_weight_loss': lambda m: m['daily_calories_detailed'] and m['daily_calories_detailed']['weight_loss'],
+    'daily_calories_weight_gain': lambda m: m['daily_calories_detailed'] and m['daily_calories_detailed']['weight_gain'],
+    'water_intake': lambda m: m['water_intake'],
+    'muscle_mass_kg': lambda m: m['muscle_mass'] and m['muscle_mass']['mass_kg'],
+    'muscle_percentage': lambda m: m['muscle_mass'] and m['muscle_mass']['percentage'],
+    'max_hr': lambda m: m['hr_zones'] and m['hr_zones']['max_hr'],
+}
+for _zone in HR_ZONES:
+    SCALAR_VALUES[f'hr_{_zone}_low'] = lambda m, z=_zone: m['hr_zones'] and int(m['hr_zones'][z]['range'].split(' - ')[0])
+    SCALAR_VALUES[f'hr_{_zone}_high'] = lambda m, z=_zone: m['hr_zones'] and int(m['hr_zones'][z]['range'].split(' - ')[1])
+
+
+def make_rows(count: int, seed: int = 0):
+    """Рядки як у calculate_all_metrics: реалістичні значення з одним знаком після коми та ~5% пропусків"""
+    rng = np.random.default_rng(seed)
+    weight = np.round(rng.uniform(40, 150, count), 1)
+    height = np.round(rng.uniform(140, 210, count), 1)
+    age = rng.integers(14, 90, count)
+    hr_rest = rng.integers(40, 110, count)
+    genders = rng.choice(['Чоловік', 'Жінка', 'male', 'female'], count)
+    activities = rng.choice(list(ACTIVITY_MULTIPLIERS), count)
+    missing = rng.random((5, count)) < 0.05
+
+    rows = []
+    for i in range(count):
+        rows.append({
+            'weight': None if missing[0, i] else float(weight[i]),
+            'height': None if missing[1, i] else float(height[i]),
+            'age': None if missing[2, i] else int(age[i]),
+            'gender': None if missing[3, i] else str(genders[i]),
+            'activity_level': str(activities[i]),
+            'hr_rest': None if missing[4, i] else int(hr_rest[i]),
+        })
+    return rows
+
+
+def best_time(func, repeats: int):
+    """Найкращий час з кількох запусків (мс) та результат останнього"""
+    times = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, result
+
+
+def scalar_all(rows):
+    get_metric_graph().clear()  # Без пам'яті результатів з попереднього повтору
+    return [FitnessCalculator.calculate_all_metrics(row) for row in rows]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    rows = make_rows(count)
+    scalar_ms, scalar = best_time(lambda: scalar_all(rows), repeats)
+    columns_ms, columns = best_time(lambda: metric_columns(rows), repeats)
+    batch_ms, batch = best_time(lambda: calculate_metrics_batch(columns), repeats)
+
+    print(f"📊 {count} рядків, найкращий з {repeats} запусків")
+    print(f"{'скалярний цикл':<34}{scalar_ms:>10.1f} мс")
+    print(f"{'рядки → стовпці (metric_columns)':<34}{columns_ms:>10.1f} мс")
+    print(f"{'calculate_metrics_batch':<34}{batch_ms:>10.1f} мс   прискорення {scalar_ms / batch_ms:.0f}x")
+    print()
+    print(f"{'показник':<30}{'збіг':>10}{'розбіжн.':>10}{'макс. різниця':>15}")
+    for name, extract in SCALAR_VALUES.items():
+        expected = np.array([np.nan if (value := extract(metrics)) is None else value for metrics in scalar],
+                            dtype=np.float64)
+        actual = batch[name]
+        same = (expected == actual) | (np.isnan(expected) & np.isnan(actual))
+        missing_mismatch = np.isnan(expected) != np.isnan(actual)
+        diff = np.nanmax(np.abs(expected - actual)) if not same.all() else 0.0
+        print(f"{name:<30}{int(same.sum()):>10}{int((~same).sum()):>10}{diff:>15.4g}"
+              f"{'   ❌ пропуски не збігаються' if missing_mismatch.any() else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/bench_photo_compare.py
+"""Кадр панелі порівняння фото: зум, пан та слайдер на піраміді з тайлами.
+
+Синтетичне фото зберігається у тимчасову папку, панель PhotoDisplayWidget
+показує його у вікні без екрана (offscreen). Час — на одну подію, як її бачить
+користувач; пам'ять — піраміда з кешу проти повнорозмірного оригіналу.
+
+Запуск з папки fitness_crm_pyside6 (без дисплея — QT_QPA_PLATFORM=offscreen):
+    python -m benchmarks.bench_photo_compare [ширина] [висота] [кроків]
+"""
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt
+from PySide6.QtGui import QMouseEvent, QWheelEvent
+from PySide6.QtWidgets import QApplication
+
+from ui.widgets.photo_display import PhotoDisplayWidget
+from utils.image_loader import get_image_loader
+
+
+def make_photo(path: str, width: int, height: int):
+    """Синтетичне фото: плавні градієнти + шум"""
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    base = np.stack([x / width * 200, y / height * 180, (x + y) / (width + height) * 220], axis=-1)
+    noise = np.random.default_rng(0).normal(0, 12, base.shape)
+    Image.fromarray(np.clip(base + noise + 20, 0, 255).astype(np.uint8), 'RGB').save(path, quality=90)
+
+
+def median_ms(times) -> float:
+    return statistics.median(times) * 1000
+
+
+def main():
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    height = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    steps = int(sys.argv[3]) if len(sys.argv) > 3 else 30
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    workspace = tempfile.mkdtemp(prefix='fitness-compare-')
+    try:
+        photo_path = os.path.join(workspace, 'photo.jpg')
+        make_photo(photo_path, width, height)
+
+        widget = PhotoDisplayWidget(photo_path)
+        widget.resize(480, 640)
+        widget.show()
+        while widget._pyramid is None:
+            get_image_loader().wait_for_done(20)
+            app.processEvents()
+
+        center = QPointF(widget.width() * 0.4, widget.height() * 0.4)
+        zoom = []
+        for _ in range(steps):
+            event = QWheelEvent(center, widget.mapToGlobal(center), QPoint(), QPoint(0, 120),
+                                Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                                Qt.ScrollPhase.NoScrollPhase, False)
+            start = time.perf_counter()
+            widget.wheelEvent(event)
+            zoom.append(time.perf_counter() - start)
+        zoomed_scale = widget._scale
+
+        pan = []
+        for _ in range(steps):
+            widget._dragging = True
+            widget._drag_start_pos = QPointF(100, 100)
+            event = QMouseEvent(QEvent.Type.MouseMove, QPointF(106, 104), widget.mapToGlobal(QPointF(106, 104)),
+                                Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+            start = time.perf_counter()
+            widget.mouseMoveEvent(event)
+            pan.append(time.perf_counter() - start)
+
+        widget._auto_fit_photo()
+        slider = []
+        for value in range(-50, 50, 100 // steps or 1):
+            start = time.perf_counter()
+            widget.set_brightness(value)
+            widget._apply_preview_adjustments()
+            slider.append(time.perf_counter() - start)
+
+        pyramid = widget._pyramid
+        print(f"📐 Фото {width}x{height}, панель {widget.width()}x{widget.height()}, медіана з {steps} подій")
+        print(f"{'зум коліщатком (до x' + format(zoomed_scale, '.2f') + ')':<32}{median_ms(zoom):>8.1f} мс")
+        print(f"{'пан при зумі':<32}{median_ms(pan):>8.1f} мс")
+        print(f"{'слайдер яскравості (вписане)':<32}{median_ms(slider):>8.1f} мс")
+        print(f"піраміда: {len(pyramid.levels)} рівнів, {pyramid.nbytes / 2 ** 20:.0f} МБ "
+              f"(оригінал RGB888 — {pyramid.levels[0].sizeInBytes() / 2 ** 20:.0f} МБ)")
+        widget.deleteLater()
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_startup.py
+"""Час запуску: лінивий старт (за замовчуванням) проти старого блокуючого (--eager).
+
+Кожен запуск — окремий процес main.py --startup-report у тимчасовій копії проєкту
+(робоча БД не змінюється). Вимірюється час до першого відмальовування вікна
+та до появи всіх клієнтів у сітці.
+
+Запуск з папки fitness_crm_pyside6:
+    python -m benchmarks.bench_startup [клієнтів] [повтори]
+"""
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+REPORT_RE = re.compile(r'first_paint_ms=([\d.]+) clients_ms=([\d.]+) clients=(\d+)')
+
+SEED_SCRIPT = """
+import sys
+sys.path.insert(0, '.')
+from models.client_repository import get_client_repository
+
+repository = get_client_repository()
+with repository.batch():
+    for i in range(int(sys.argv[1])):
+        repository.save({'id': f'bench-{i:05d}', 'first_name': 'Клієнт', 'surname': str(i),
+                         'phone': '+380000000000', 'notes': 'x' * 2000})
+"""
+
+
+def make_workspace(clients: int) -> Path:
+    """Копія проєкту з порожньою БД, заповненою синтетичними клієнтами"""
+    workspace = Path(tempfile.mkdtemp(prefix='fitness-startup-'))
+    shutil.copytree(PROJECT_DIR, workspace, dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns('__pycache__', 'database', 'logs', 'clients', 'trash'))
+    subprocess.run([sys.executable, '-c', SEED_SCRIPT, str(clients)], cwd=workspace, env=_env(),
+                   check=True, stdout=subprocess.DEVNULL)
+    return workspace
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env['PYTHONIOENCODING'] = 'utf-8'
+    return env
+
+
+def run_once(workspace: Path, eager: bool):
+    """Один запуск main.py; повертає (перше відмальовування, клієнти завантажені) у мс"""
+    command = [sys.executable, 'main.py', '--startup-report'] + (['--eager'] if eager else [])
+    result = subprocess.run(command, cwd=workspace, env=_env(), capture_output=True,
+                            text=True, encoding='utf-8', timeout=120)
+    match = REPORT_RE.search(result.stdout)
+    if match is None:
+        raise RuntimeError(f"Немає звіту про запуск:\n{result.stdout[-2000:]}\n{result.stderr[-2000:]}")
+    return float(match.group(1)), float(match.group(2))
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    workspace = make_workspace(clients)
+    try:
+        print(f"🚀 Запуск з {clients} клієнтами, медіана з {repeats} запусків")
+        print(f"{'режим':<12}{'перше відмальовування, мс':>28}{'клієнти в сітці, мс':>22}")
+        run_once(workspace, eager=False)  # прогрів: кеш файлової системи, .pyc
+        medians = {}
+        for name, eager in (('--eager', True), ('лінивий', False)):
+            runs = [run_once(workspace, eager) for _ in range(repeats)]
+            paint_ms = statistics.median(run[0] for run in runs)
+            clients_ms = statistics.median(run[1] for run in runs)
+            medians[eager] = paint_ms
+            print(f"{name:<12}{paint_ms:>28.1f}{clients_ms:>22.1f}")
+        print(f"⚡ Вікно з'являється на {medians[True] - medians[False]:.0f} мс раніше")
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 
 from . import config
 from .logger import fitness_logger, get_app_logger, get_ui_logger, get_db_logger, get_api_logger
-from .database import engine, get_session, init_db
+from .database import engine, ensure_db, get_session, init_db
 
 __all__ = [
     'config',
@@ -13,6 +13,7 @@ __all__ = [
     'get_db_logger',
     'get_api_logger',
     'engine',
+    'ensure_db',
     'get_session', 
     'init_db'
 ]
@@ -16,8 +16,14 @@ LOGS_DIR = BASE_DIR / "logs"
 DATABASE_DIR.mkdir(exist_ok=True)
 LOGS_DIR.mkdir(exist_ok=True)
 
+# Кодек записів клієнтів у БД: "json", "orjson" або "msgpack" (останні два — опціональні пакети).
+# Після зміни існуючі записи перекодовує: python -m models.client_codec <кодек>
+CLIENT_STORAGE_CODEC = "json"
+
+# Лінивий старт: вікно показується одразу, БД ініціалізується та клієнти зчитуються у фоні
+# (False — старий блокуючий шлях, для порівняння: python main.py --eager --startup-report)
+LAZY_STARTUP = True
+
 # Налаштування вікна
 WINDOW_SIZE = (1200, 800)
 WINDOW_TITLE = f"{APP_NAME} - Система управління клієнтами"
-
-print(f"📁 Конфігурація завантажена: {APP_NAME} v{APP_VERSION}")
\ No newline at end of file
@@ -1,7 +1,12 @@
 # config/database.py
-"""Налаштування бази даних"""
-import os
+"""Налаштування бази даних.
+
+Імпорт модуля лише створює engine (без з'єднання). Таблиці створюються при першому
+зверненні через ensure_db(), перевірка з'єднання виконується один раз за запуск.
+"""
+import threading
 from pathlib import Path
+from typing import Optional
 from sqlmodel import create_engine, SQLModel, Session
 from sqlalchemy.engine import Engine
 from sqlalchemy import event
@@ -32,7 +37,39 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.close()
-    console.print("[bold blue]🔧 Налаштовано SQLite PRAGMA[/bold blue]")
+    
+    # Повідомлення лише для першого з'єднання, а не для кожного нового в пулі
+    global _pragma_reported
+    if not _pragma_reported:
+        _pragma_reported = True
+        console.print("[bold blue]🔧 Налаштовано SQLite PRAGMA[/bold blue]")
+
+
+_pragma_reported = False
+
+# PRAGMA user_version: 1 — таблиця clients перебудована під поточну схему
+# (подальші версії — одноразові кроки ClientRepository, див. models/client_repository.py)
+CLIENTS_SCHEMA_VERSION = 1
+
+_db_ready = False
+_db_lock = threading.Lock()
+_connection_ok: Optional[bool] = None
+
+
+def ensure_db():
+    """Створює таблиці та мігрує схему при першому зверненні (один раз за запуск, з будь-якого потоку)"""
+    if _db_ready:
+        return
+    
+    with _db_lock:
+        if _db_ready:
+            return
+        db_file = DATABASE_DIR / "fitness_crm.db"
+        if not db_file.exists():
+            console.print("[bold cyan]🆕 Створюємо нову базу даних[/bold cyan]")
+        else:
+            console.print("[bold cyan]📂 Використовуємо існуючу базу даних[/bold cyan]")
+        init_db()
 
 
 def init_db():
@@ -40,9 +77,16 @@ def init_db():
     try:
         # Імпортуємо всі моделі
         from models.client import Client  # noqa: F401
+        from models.measurement import Measurement  # noqa: F401
+        from models.media import MediaBlob, MediaReference  # noqa: F401
         
         # Створюємо всі таблиці
         SQLModel.metadata.create_all(engine)
+        _migrate_schema()
+        _check_foreign_keys()
+        
+        global _db_ready
+        _db_ready = True
         console.print("[bold green]✅ База даних ініціалізована успішно![/bold green]")
         
     except Exception as e:
@@ -50,6 +94,112 @@ def init_db():
         raise
 
 
+def _migrate_schema():
+    """Додає відсутні стовпці та індекси в існуючі таблиці (легка міграція без Alembic)"""
+    from sqlalchemy import inspect, text
+    
+    _rebuild_legacy_clients()
+    
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                console.print(f"[bold cyan]🔄 Додано стовпець {table.name}.{column.name}[/bold cyan]")
+            
+            # create_all не додає індекси до вже існуючих таблиць
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(connection)
+                    console.print(f"[bold cyan]🔄 Додано індекс {index.name}[/bold cyan]")
+
+
+def _has_legacy_phone_constraint(connection) -> bool:
+    """Чи має clients старе обмеження phone NOT NULL UNIQUE (таблиця першої версії init_db)"""
+    columns = {row[1]: row[3] for row in connection.exec_driver_sql("PRAGMA table_info(clients)")}
+    if columns.get('phone'):
+        return True
+    for index in connection.exec_driver_sql("PRAGMA index_list(clients)").all():
+        name, unique = index[1], index[2]
+        if unique and [row[2] for row in connection.exec_driver_sql(f"PRAGMA index_info('{name}')")] == ['phone']:
+            return True
+    return False
+
+
+def _rebuild_legacy_clients():
+    """Перебудовує clients зі старим обмеженням телефону: нова таблиця, копія рядків, заміна.
+    
+    ALTER TABLE не знімає NOT NULL / UNIQUE, а без цього імпорт і збереження клієнтів без телефону
+    або зі спільним телефоном падають. rowid зберігається — на нього посилається індекс FTS.
+    """
+    from sqlalchemy.schema import CreateIndex, CreateTable
+    from models.client import Client
+    
+    with engine.connect() as connection:
+        version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+        if version >= CLIENTS_SCHEMA_VERSION:
+            return
+        legacy = _has_legacy_phone_constraint(connection)
+        existing = [row[1] for row in connection.exec_driver_sql("PRAGMA table_info(clients)")]
+    
+    if not legacy:
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f"PRAGMA user_version = {CLIENTS_SCHEMA_VERSION}")
+        return
+    
+    table = Client.__table__
+    columns = ", ".join(column.name for column in table.columns if column.name in existing)
+    create_sql = str(CreateTable(table).compile(dialect=engine.dialect)).replace(
+        f"CREATE TABLE {table.name} ", "CREATE TABLE clients_rebuild ", 1)
+    index_sqls = [str(CreateIndex(index).compile(dialect=engine.dialect)) for index in table.indexes]
+    
+    # Власна транзакція на DBAPI-з'єднанні: foreign_keys вимикається до BEGIN, інакше
+    # DROP TABLE каскадно видалив би історію замірів і посилання на фото
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        raw.commit()
+        cursor.execute("PRAGMA foreign_keys=OFF")
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute("DROP TABLE IF EXISTS clients_rebuild")
+            cursor.execute(create_sql)
+            cursor.execute(f"INSERT INTO clients_rebuild(rowid, {columns}) SELECT rowid, {columns} FROM clients")
+            cursor.execute("DROP TABLE clients")
+            cursor.execute("ALTER TABLE clients_rebuild RENAME TO clients")
+            for index_sql in index_sqls:
+                cursor.execute(index_sql)
+            cursor.execute(f"PRAGMA user_version = {CLIENTS_SCHEMA_VERSION}")
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+    finally:
+        raw.close()
+    console.print("[bold cyan]🔄 Таблицю clients перебудовано: телефон більше не обов'язковий і не унікальний[/bold cyan]")
+
+
+def _check_foreign_keys():
+    """Перевіряє, що з'єднання вмикають зовнішні ключі: без них ondelete="CASCADE" не спрацьовує"""
+    with engine.connect() as connection:
+        enabled = connection.exec_driver_sql("PRAGMA foreign_keys").scalar()
+    if not enabled:
+        console.print("[bold red]⚠️ PRAGMA foreign_keys вимкнено: історія замірів і посилання на фото "
+                      "не видалятимуться разом з клієнтом[/bold red]")
+
+
 def get_session() -> Session:
     """Отримати сесію для роботи з БД"""
     try:
@@ -60,25 +210,19 @@ def get_session() -> Session:
         raise
 
 
-def test_connection():
-    """Тестувати з'єднання з базою даних"""
+def test_connection(force: bool = False) -> bool:
+    """Тестувати з'єднання з базою даних (результат запам'ятовується; force — перевірити знову)"""
+    global _connection_ok
+    if _connection_ok is not None and not force:
+        return _connection_ok
+    
     try:
         with get_session() as session:
             from sqlalchemy import text
             session.execute(text("SELECT 1"))
             console.print("[bold green]✅ З'єднання з базою даних успішне[/bold green]")
-            return True
+            _connection_ok = True
     except Exception as e:
         console.print(f"[bold red]❌ Помилка з'єднання з базою даних: {e}[/bold red]")
-        return False
-
-
-# Ініціалізуємо БД при імпорті
-db_file = DATABASE_DIR / "fitness_crm.db"
-if not db_file.exists():
-    console.print("[bold cyan]🆕 Створюємо нову базу даних[/bold cyan]")
-    init_db()
-else:
-    console.print("[bold cyan]📂 Використовуємо існуючу базу даних[/bold cyan]")
-    # Перевіряємо з'єднання
-    test_connection()
\ No newline at end of file
+        _connection_ok = False
+    return _connection_ok
@@ -4,8 +4,12 @@ Fitness CRM - Система управління клієнтами для тр
 Автор: Денис
 """
 import sys
+import time
+
+_STARTED_AT = time.perf_counter()  # Відлік часу запуску — до важких імпортів
+
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QEvent, QObject
 from qfluentwidgets import setTheme, Theme, setThemeColor
 from rich.console import Console
 from rich.panel import Panel
@@ -23,8 +27,59 @@ console = Console()
 app_logger = get_app_logger()
 
 
+class FirstPaintProbe(QObject):
+    """Фіксує час до першого відмальовування вікна та до завантаження всіх клієнтів"""
+    
+    def __init__(self, window, report: bool = False):
+        super().__init__(window)
+        self.report = report
+        self.first_paint_ms = None
+        self.clients_ms = None
+        self.clients_count = 0
+        window.installEventFilter(self)
+        window.clients_page.clients_loaded.connect(self._on_clients_loaded)
+        if window.clients_page.is_loaded:  # --eager: клієнти зчитано ще в конструкторі вікна
+            self._on_clients_loaded(len(window.clients_page.clients))
+    
+    @staticmethod
+    def _elapsed_ms() -> float:
+        return (time.perf_counter() - _STARTED_AT) * 1000
+    
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint and self.first_paint_ms is None:
+            self.first_paint_ms = self._elapsed_ms()
+            watched.removeEventFilter(self)
+            app_logger.info(f"⏱️ Перше відмальовування вікна: {self.first_paint_ms:.0f} мс")
+            self._finish()
+        return False
+    
+    def _on_clients_loaded(self, count: int):
+        if self.clients_ms is not None:
+            return
+        self.clients_ms = self._elapsed_ms()
+        self.clients_count = count
+        app_logger.info(f"⏱️ Клієнтів завантажено ({count}): {self.clients_ms:.0f} мс")
+        self._finish()
+    
+    def _finish(self):
+        """--startup-report: друкує рядок з вимірами та завершує програму"""
+        if not self.report or self.first_paint_ms is None or self.clients_ms is None:
+            return
+        print(f"⏱️ startup first_paint_ms={self.first_paint_ms:.1f} "
+              f"clients_ms={self.clients_ms:.1f} clients={self.clients_count}", flush=True)
+        QApplication.quit()
+
+
 def main():
-    """Головна функція запуску програми"""
+    """Головна функція запуску програми
+    
+    --eager — старий порядок: БД ініціалізується та перевіряється до показу вікна.
+    --startup-report — вивести час до першого відмальовування та до завантаження клієнтів і вийти.
+    """
+    startup_report = '--startup-report' in sys.argv
+    if '--eager' in sys.argv:
+        config.LAZY_STARTUP = False
+    
     # Красивий стартовий банер
     console.print()
     console.print(Panel.fit(
@@ -56,8 +111,9 @@ def main():
     app_logger.info(f"📱 Додаток: {config.APP_NAME} v{config.APP_VERSION}")
     app_logger.info(f"👤 Автор: {config.APP_AUTHOR}")
     
-    # Перевіряємо з'єднання з базою даних
-    if not test_connection():
+    # У лінивому режимі БД ініціалізується у фоновому потоці при зчитуванні клієнтів,
+    # помилка з'явиться повідомленням у вікні
+    if not config.LAZY_STARTUP and not test_connection():
         app_logger.error("❌ Не вдалося підключитися до бази даних")
         return 1
     
@@ -75,6 +131,7 @@ def main():
         window = MainWindow()
         window.resize(*config.WINDOW_SIZE)
         window.setWindowTitle(config.WINDOW_TITLE)
+        FirstPaintProbe(window, report=startup_report)
         window.show()
         app_logger.info("🪟 Головне вікно створено та показано")
         
@@ -85,7 +142,7 @@ def main():
         app_logger.info("🏁 Програма завершена")
         fitness_logger.log_shutdown()
         return result
-        
+    
     except Exception as e:
         app_logger.error(f"💥 Критична помилка: {e}")
         return 1
@@ -3,6 +3,7 @@
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field
+from sqlalchemy import Index
 from sqlmodel import Field as SQLField, SQLModel
 import uuid
 
@@ -13,23 +14,35 @@ class ClientBase(SQLModel):
     first_name: str = SQLField(max_length=100)
     last_name: str = SQLField(max_length=100)
     middle_name: Optional[str] = SQLField(default=None, max_length=100)
-    phone: str = SQLField(max_length=20, unique=True)
+    phone: Optional[str] = SQLField(default=None, max_length=20, index=True)
     email: Optional[str] = SQLField(default=None, max_length=100)
     birth_date: Optional[datetime] = None
     
     # Додаткова інформація
     notes: Optional[str] = None
-    is_active: bool = SQLField(default=True)
+    is_active: bool = SQLField(default=True, index=True)
+    
+    # Повні дані картки клієнта (фізичні, здоров'я, спосіб життя, цілі, заміри, тестування) у JSON
+    payload: Optional[str] = None
+    # Коротка картка для дошки (ім'я, телефон, фото) — зчитується без розбору payload.
+    # Обидва поля — текст JSON або байти msgpack, див. models/client_codec.py
+    card: Optional[str] = None
+    
+    # Позиція на дошці клієнтів (дробовий ключ, див. models/sort_keys.py)
+    sort_key: Optional[str] = SQLField(default=None, max_length=64)
     
     # Дати
     created_at: datetime = SQLField(default_factory=datetime.now)
     updated_at: datetime = SQLField(default_factory=datetime.now)
     last_visit: Optional[datetime] = None
+    deleted_at: Optional[datetime] = None
 
 
 class Client(ClientBase, table=True):
     """Модель клієнта для бази даних"""
     __tablename__ = "clients"
+    # Активні клієнти зчитуються одразу в порядку відображення
+    __table_args__ = (Index('ix_clients_active_order', 'is_active', 'sort_key'),)
     
     id: str = SQLField(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     
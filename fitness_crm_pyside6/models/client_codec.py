@@ -0,0 +1,142 @@
+# models/client_codec.py
+"""Кодування записів клієнтів: коротка картка (гаряча) окремо від повних даних (холодні).
+
+Картка — лише поля для сітки/списку (ім'я, телефон, фото та його параметри), вона
+зчитується при старті. Повний запис з усіма вкладками декодується лише тоді,
+коли клієнта відкривають (ClientRepository.get).
+
+Кодеки: json (стандартна бібліотека), orjson та msgpack (опціональні пакети).
+Декодування визначає формат за самими даними, тож записи різних кодеків можуть
+співіснувати; перекодувати всю БД — python -m models.client_codec [кодек].
+"""
+import copy
+import json
+import sys
+from typing import Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Опціональна залежність
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Опціональна залежність
+    msgpack = None
+
+
+CODECS = ('json', 'orjson', 'msgpack')
+DEFAULT_BATCH_SIZE = 500
+
+# Поля картки: все, що показують PhotoCard, ListItemWidget, сітка та корзина
+CARD_FIELDS = (
+    'id', 'first_name', 'surname', 'full_name', 'phone', 'email', 'gender', 'birth_date',
+    'photo_path', 'photo_scale', 'photo_offset_x', 'photo_offset_y', 'photo_params', 'ai_url',
+)
+
+
+def available_codecs() -> Dict[str, bool]:
+    """Які кодеки можна використати в цьому оточенні"""
+    return {'json': True, 'orjson': orjson is not None, 'msgpack': msgpack is not None}
+
+
+def resolve_codec(codec: Optional[str]) -> str:
+    """Перевіряє назву кодека; якщо пакет не встановлено — json з попередженням"""
+    codec = (codec or 'json').lower()
+    if codec not in CODECS:
+        raise ValueError(f"Невідомий кодек {codec!r}, доступні: {', '.join(CODECS)}")
+    if not available_codecs()[codec]:
+        print(f"⚠️ Пакет {codec} не встановлено, записи клієнтів кодуються в json")
+        return 'json'
+    return codec
+
+
+def card_summary(client_data: dict) -> dict:
+    """Картка клієнта — лише поля, потрібні для відображення на дошці.
+
+    Незалежна копія: вкладені значення (photo_params) копіюються, тож картка
+    не змінюється разом з даними, з яких її зроблено. Копія картки — card_summary(картка).
+    """
+    return {field: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            for field, value in ((field, client_data[field]) for field in CARD_FIELDS if field in client_data)}
+
+
+def encode(data: dict, codec: str = 'json') -> Union[str, bytes]:
+    """Кодує запис. JSON-кодеки повертають текст (читабельний у БД), msgpack — байти"""
+    if codec == 'msgpack':
+        return msgpack.packb(data, use_bin_type=True, default=str)
+    if codec == 'orjson':
+        return orjson.dumps(data, default=str).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def decode(value: Union[str, bytes, None]) -> Optional[dict]:
+    """Розбирає запис будь-якого кодека (формат визначається за першим байтом)"""
+    if not value:
+        return None
+    if isinstance(value, memoryview):
+        value = bytes(value)
+
+    if isinstance(value, bytes) and value[:1] != b'{':
+        if msgpack is None:
+            raise ValueError("Запис закодовано msgpack, але пакет msgpack не встановлено")
+        return msgpack.unpackb(value, raw=False)
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def encode_card(client_data: dict, codec: str = 'json') -> Union[str, bytes]:
+    """Кодує картку клієнта (див. card_summary)"""
+    return encode(card_summary(client_data), codec)
+
+
+def migrate_storage(codec: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+    """Перекодовує всі записи (включно з корзиною) у вибраний кодек та перебудовує картки"""
+    from sqlalchemy import bindparam, func, select, update
+
+    from config.database import engine, ensure_db
+    from models.client import Client
+
+    codec = resolve_codec(codec)
+    ensure_db()
+    table = Client.__table__
+    stats = {'clients': 0, 'bytes_before': 0, 'bytes_after': 0}
+
+    statement = (update(table).where(table.c.id == bindparam('row_id'))
+                 .values(payload=bindparam('row_payload'), card=bindparam('row_card')))
+
+    with engine.connect() as connection:
+        client_ids = connection.execute(select(table.c.id).order_by(table.c.id)).scalars().all()
+
+    for start in range(0, len(client_ids), batch_size):
+        chunk = client_ids[start:start + batch_size]
+        with engine.begin() as connection:
+            rows = connection.execute(select(table.c.id, table.c.payload).where(table.c.id.in_(chunk)))
+            params = []
+            for client_id, payload in rows:
+                client_data = decode(payload)
+                if client_data is None:
+                    continue
+                new_payload = encode(client_data, codec)
+                stats['bytes_before'] += len(payload.encode('utf-8') if isinstance(payload, str) else payload)
+                stats['bytes_after'] += len(new_payload.encode('utf-8') if isinstance(new_payload, str) else new_payload)
+                params.append({'row_id': client_id, 'row_payload': new_payload,
+                               'row_card': encode_card(client_data, codec)})
+            if params:
+                connection.execute(statement, params)
+            stats['clients'] += len(params)
+
+    with engine.connect() as connection:
+        card_bytes = connection.execute(select(func.sum(func.length(table.c.card)))).scalar() or 0
+
+    print(f"🗜️ Перекодовано клієнтів: {stats['clients']} → {codec}; "
+          f"повні дані {stats['bytes_before']} → {stats['bytes_after']} байт, картки {card_bytes} байт")
+    return stats
+
+
+if __name__ == "__main__":
+    # python -m models.client_codec [json|orjson|msgpack] [розмір_пакета]
+    target = sys.argv[1] if len(sys.argv) > 1 else 'json'
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BATCH_SIZE
+    migrate_storage(target, size)
@@ -0,0 +1,145 @@
+# models/client_importer.py
+"""Пакетний імпорт JSON файлів клієнтів у таблицю clients"""
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import select
+
+from config.database import engine, ensure_db
+from models import client_codec, client_search, measurement_history
+from models.client import Client
+from models.client_repository import (CLIENTS_DIR, TRASH_DIR, client_to_row,
+                                      upsert_statement)
+
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _iter_json_files(directory: str) -> Iterator[str]:
+    """Перебирає JSON файли папки без побудови повного списку"""
+    if not os.path.isdir(directory):
+        return
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.json'):
+                yield entry.path
+
+
+def _iter_trash_files(trash_dir: str) -> Iterator[Tuple[str, datetime]]:
+    """Перебирає JSON файли з папок корзини разом з датою видалення"""
+    if not os.path.isdir(trash_dir):
+        return
+
+    with os.scandir(trash_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            deleted_at = datetime.fromtimestamp(entry.stat().st_mtime)
+            for filepath in _iter_json_files(entry.path):
+                yield filepath, deleted_at
+
+
+def _read_client(filepath: str) -> Optional[dict]:
+    """Зчитує один JSON файл клієнта"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            client_data = json.load(f)
+    except Exception as e:
+        print(f"❌ Помилка читання {os.path.basename(filepath)}: {e}")
+        return None
+
+    if not isinstance(client_data, dict) or not client_data.get('id'):
+        print(f"⚠️ Пропущено {os.path.basename(filepath)}: відсутній ID клієнта")
+        return None
+    return client_data
+
+
+def _reindex_from_db(connection, client_ids):
+    """Індексує клієнтів за даними, що фактично збереглися в БД після upsert"""
+    if not client_ids:
+        return
+
+    table = Client.__table__
+    rows = connection.execute(
+        select(table.c.payload).where(table.c.id.in_(client_ids), table.c.is_active == True)  # noqa: E712
+    )
+    client_search.index_clients(connection, (client_codec.decode(payload) for (payload,) in rows))
+
+
+def _record_measurements_from_db(connection, client_ids):
+    """Дописує в історію знімки замірів клієнтів, що фактично збереглися в БД після upsert"""
+    table = Client.__table__
+    rows = connection.execute(select(table.c.payload).where(table.c.id.in_(client_ids)))
+    measurement_history.record_clients(connection, (client_codec.decode(payload) for (payload,) in rows))
+
+
+def import_json_clients(clients_dir: str = CLIENTS_DIR, trash_dir: str = TRASH_DIR,
+                        batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+    """Потоково імпортує JSON файли клієнтів у БД пакетними транзакціями.
+
+    Дублікати ID об'єднуються: залишається запис з новішим updated_at.
+    Клієнти з папок корзини імпортуються як неактивні.
+    """
+    ensure_db()
+
+    stats = {'imported': 0, 'skipped': 0, 'batches': 0}
+    statement = upsert_statement(newer_only=True)
+    batch: Dict[str, dict] = {}
+
+    with engine.begin() as connection:
+        fts = client_search.is_fts_available(connection)
+
+    def flush():
+        if not batch:
+            return
+        with engine.begin() as connection:
+            connection.execute(statement, list(batch.values()))
+            if fts:
+                # Пошуковий індекс оновлюється в тій самій транзакції
+                client_search.remove_clients(connection, batch.keys())
+                active_ids = [row['id'] for row in batch.values() if row['is_active']]
+                _reindex_from_db(connection, active_ids)
+            _record_measurements_from_db(connection, list(batch.keys()))
+        stats['imported'] += len(batch)
+        stats['batches'] += 1
+        batch.clear()
+
+    def sources():
+        for filepath in _iter_json_files(clients_dir):
+            yield filepath, True, None
+        for filepath, deleted_at in _iter_trash_files(trash_dir):
+            yield filepath, False, deleted_at
+
+    for filepath, is_active, deleted_at in sources():
+        client_data = _read_client(filepath)
+        if client_data is None:
+            stats['skipped'] += 1
+            continue
+
+        row = client_to_row(client_data, is_active=is_active, deleted_at=deleted_at)
+        current = batch.get(row['id'])
+        if current is not None:
+            # Активний запис важливіший за копію з корзини, далі — новіший updated_at
+            stats['skipped'] += 1
+            if (current['is_active'], current['updated_at']) >= (row['is_active'], row['updated_at']):
+                continue
+
+        batch[row['id']] = row
+        if len(batch) >= batch_size:
+            flush()
+
+    flush()
+
+    print(f"📥 Імпортовано клієнтів: {stats['imported']} "
+          f"(пакетів: {stats['batches']}, пропущено: {stats['skipped']})")
+    return stats
+
+
+if __name__ == "__main__":
+    # python -m models.client_importer [розмір_пакета]
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BATCH_SIZE
+    import_json_clients(batch_size=size)
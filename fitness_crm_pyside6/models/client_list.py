@@ -2,10 +2,12 @@
 """Клас для керування списком клієнтів"""
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from sqlmodel import Session, select, or_
+from sqlmodel import Session, or_, select
 from models.client import Client, ClientCreate, ClientUpdate
-from config.database import engine
-import json
+from models.client_search import index_clients, remove_clients, search_client_ids
+from models.client_repository import get_client_repository
+from config.database import engine, ensure_db
+from utils.file_utils import atomic_write_json
 import os
 
 
@@ -13,7 +15,10 @@ class ClientList:
     """Керування списком клієнтів"""
     
     def __init__(self):
+        ensure_db()
         self.session = Session(engine)
+        # Індекс FTS5 створює та заповнює репозиторій; тут лише прапорець, перевірений один раз
+        self._fts = get_client_repository().search_indexed
     
     def get_all(self, active_only: bool = True) -> List[Client]:
         """Отримати всіх клієнтів"""
@@ -29,16 +34,28 @@ class ClientList:
         if not query:
             return self.get_all()
         
-        statement = select(Client).where(
-            or_(
-                Client.first_name.contains(query),
-                Client.last_name.contains(query),
-                Client.phone.contains(query),
-                Client.email.contains(query)
-            )
-        ).where(Client.is_active == True)
-        
-        return self.session.exec(statement).all()
+        if not self._fts:
+            # SQLite без FTS5: пошук підрядка, як у репозиторії
+            statement = select(Client).where(
+                or_(
+                    Client.first_name.contains(query),
+                    Client.last_name.contains(query),
+                    Client.phone.contains(query),
+                    Client.email.contains(query)
+                )
+            ).where(Client.is_active == True)
+            return self.session.exec(statement).all()
+        
+        # Повнотекстовий індекс FTS5 замість LIKE '%...%'
+        client_ids = search_client_ids(self.session.connection(), query)
+        if not client_ids:
+            return []
+        
+        statement = select(Client).where(Client.id.in_(client_ids)).where(Client.is_active == True)
+        clients = {client.id: client for client in self.session.exec(statement).all()}
+        
+        # Зберігаємо порядок релевантності
+        return [clients[cid] for cid in client_ids if cid in clients]
     
     def get_by_id(self, client_id: str) -> Optional[Client]:
         """Отримати клієнта за ID"""
@@ -48,6 +65,8 @@ class ClientList:
         """Створити нового клієнта"""
         client = Client(**client_data.dict())
         self.session.add(client)
+        self.session.flush()
+        self._index(client)
         self.session.commit()
         self.session.refresh(client)
         
@@ -68,6 +87,8 @@ class ClientList:
         
         client.updated_at = datetime.now()
         self.session.add(client)
+        self.session.flush()
+        self._index(client)
         self.session.commit()
         self.session.refresh(client)
         
@@ -79,6 +100,10 @@ class ClientList:
         if not client:
             return False
         
+        # Неактивні клієнти в пошук не потрапляють (як у репозиторії)
+        if self._fts:
+            remove_clients(self.session.connection(), [client_id])
+        
         if soft_delete:
             client.is_active = False
             client.updated_at = datetime.now()
@@ -109,6 +134,24 @@ class ClientList:
             self.session.refresh(client)
         return client
     
+    def _index(self, client: Client):
+        """Оновлює рядок клієнта в індексі FTS5 (у транзакції сесії, рядок clients вже записаний)"""
+        if not self._fts:
+            return
+        
+        if not client.is_active:
+            remove_clients(self.session.connection(), [client.id])
+            return
+        
+        index_clients(self.session.connection(), [{
+            'id': client.id,
+            'first_name': client.first_name,
+            'surname': client.last_name,
+            'phone': client.phone,
+            'email': client.email,
+            'trainer_notes': client.notes,
+        }])
+    
     def _create_client_folder(self, client: Client):
         """Створює структуру папок для клієнта"""
         base_path = os.path.join("data", "clients", client.folder_name)
@@ -124,8 +167,7 @@ class ClientList:
         # Створюємо файл даних клієнта
         client_data_path = os.path.join(base_path, "client_data.json")
         if not os.path.exists(client_data_path):
-            with open(client_data_path, 'w', encoding='utf-8') as f:
-                json.dump(client.dict(), f, ensure_ascii=False, indent=2, default=str)
+            atomic_write_json(client_data_path, client.dict(), indent=2, default=str)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Отримати статистику по клієнтах"""
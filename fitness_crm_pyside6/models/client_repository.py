@@ -0,0 +1,552 @@
+# models/client_repository.py
+"""Репозиторій клієнтів на SQLite з індексом карток у пам'яті та лінивим завантаженням повних даних"""
+import copy
+import os
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert
+
+from config.config import CLIENT_STORAGE_CODEC
+from config.database import engine, ensure_db
+from models.client import Client
+from models import client_codec, client_search, measurement_history
+from models.media_store import get_media_store
+from models.sort_keys import key_between, spread_keys
+
+
+CLIENTS_DIR = os.path.join("data", "clients")
+TRASH_DIR = os.path.join("data", "trash")
+
+# Версія БД, з якої JSON файли вже імпортовані (1 — перебудова clients, config/database.py)
+LEGACY_IMPORT_VERSION = 2
+# Версія БД, з якої знімки замірів з payload перенесені в історію measurements
+MEASUREMENT_HISTORY_VERSION = 3
+
+# Стовпці, які оновлюються при повторному збереженні клієнта
+_UPSERT_COLUMNS = (
+    'first_name', 'last_name', 'phone', 'email', 'birth_date', 'notes',
+    'is_active', 'payload', 'card', 'updated_at', 'last_visit', 'deleted_at',
+)
+
+
+def parse_datetime(value) -> Optional[datetime]:
+    """Перетворює дату з JSON (ISO або ДД.ММ.РРРР) у datetime"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        pass
+
+    try:
+        return datetime.strptime(str(value), "%d.%m.%Y")
+    except ValueError:
+        return None
+
+
+def client_to_row(client_data: dict, is_active: bool = True,
+                  deleted_at: Optional[datetime] = None,
+                  sort_key: Optional[str] = None,
+                  codec: Optional[str] = None) -> dict:
+    """Перетворює словник клієнта у рядок таблиці clients.
+
+    sort_key записується лише для нового рядка (при оновленні позиція не змінюється).
+    codec — кодек payload та card (за замовчуванням CLIENT_STORAGE_CODEC).
+    """
+    codec = codec or _default_codec()
+    now = datetime.now()
+    return {
+        'id': client_data['id'],
+        'first_name': client_data.get('first_name', '') or '',
+        'last_name': client_data.get('surname', '') or '',
+        'phone': (client_data.get('phone') or '').strip() or None,
+        'email': (client_data.get('email') or '').strip() or None,
+        'birth_date': parse_datetime(client_data.get('birth_date')),
+        'notes': client_data.get('trainer_notes') or None,
+        'is_active': is_active,
+        'payload': client_codec.encode(client_data, codec),
+        'card': client_codec.encode_card(client_data, codec),
+        'created_at': parse_datetime(client_data.get('created_at')) or now,
+        'updated_at': parse_datetime(client_data.get('updated_at')) or now,
+        'last_visit': parse_datetime(client_data.get('last_visit')),
+        'deleted_at': deleted_at,
+        'sort_key': sort_key,
+    }
+
+
+_resolved_codec: Optional[str] = None
+
+
+def _default_codec() -> str:
+    """Кодек з конфігурації (перевіряється один раз)"""
+    global _resolved_codec
+    if _resolved_codec is None:
+        _resolved_codec = client_codec.resolve_codec(CLIENT_STORAGE_CODEC)
+    return _resolved_codec
+
+
+def upsert_statement(newer_only: bool = False):
+    """INSERT ... ON CONFLICT(id) DO UPDATE (виконується з пакетом рядків)"""
+    statement = insert(Client.__table__)
+    where = None
+    if newer_only:
+        # При імпорті дублікатів перемагає запис з новішим updated_at
+        where = statement.excluded.updated_at > Client.__table__.c.updated_at
+
+    return statement.on_conflict_do_update(
+        index_elements=['id'],
+        set_={name: statement.excluded[name] for name in _UPSERT_COLUMNS},
+        where=where
+    )
+
+
+class ClientRepository:
+    """Зберігає клієнтів у таблиці clients.
+
+    У пам'яті постійно тримаються лише картки (client_codec.CARD_FIELDS) — їх показує
+    дошка. Повні дані клієнта декодуються з payload при першому get().
+    """
+
+    def __init__(self, clients_dir: str = CLIENTS_DIR, trash_dir: str = TRASH_DIR,
+                 codec: Optional[str] = None):
+        self.clients_dir = clients_dir
+        self.trash_dir = trash_dir
+        self.codec = client_codec.resolve_codec(codec) if codec else _default_codec()
+        self._records: Dict[str, dict] = {}  # id → картка клієнта
+        self._details: Dict[str, dict] = {}  # id → повні дані (завантажені на вимогу)
+        self._sort_keys: Dict[str, str] = {}  # id → ключ позиції на дошці
+        self._last_key: Optional[str] = None  # Найбільший ключ (включно з корзиною)
+        self._loaded = False
+        self._fts = False  # Чи доступний індекс FTS5
+        self._batch_connection = None  # Спільна транзакція пакетного режиму (batch)
+        self._released_media = set()  # Файли сховища, звільнені в пакеті (прибираються після commit)
+        self._load_lock = threading.RLock()  # load() може виконуватись у фоновому потоці при старті
+
+    def load(self, force: bool = False):
+        """Один раз зчитує картки активних клієнтів з БД та будує індекс.
+
+        Безпечно викликати з фонового потоку: інші виклики чекають на завершення.
+        """
+        if self._loaded and not force:
+            return
+
+        with self._load_lock:
+            if self._loaded and not force:
+                return
+
+            first_load = not self._loaded
+            if first_load:
+                ensure_db()
+                self._import_legacy_files()
+                self._backfill_measurement_history()
+            self._assign_missing_sort_keys()
+            self._build_missing_cards()
+
+            # Лише картки, порядок береться з індексу (is_active, sort_key) — без сортування в пам'яті
+            records, sort_keys = {}, {}
+            table = Client.__table__
+            statement = (select(table.c.id, table.c.card, table.c.sort_key)
+                         .where(table.c.is_active == True)  # noqa: E712
+                         .order_by(table.c.sort_key))
+            with engine.connect() as connection:
+                for client_id, card, sort_key in connection.execute(statement):
+                    client_data = self._decode(client_id, card)
+                    if client_data is not None:
+                        records[client_id] = client_data
+                        sort_keys[client_id] = sort_key
+                self._last_key = connection.execute(select(func.max(table.c.sort_key))).scalar()
+
+            self._records, self._sort_keys = records, sort_keys
+            self._details.clear()
+
+            if first_load:
+                self._ensure_search_index()
+            self._loaded = True
+
+    def all(self) -> List[dict]:
+        """Картки всіх активних клієнтів у порядку дошки (sort_key) — копії, як і в get()"""
+        self.load()
+        # Після move() словник уже не впорядкований; для майже відсортованого списку це O(n)
+        records = sorted(self._records.values(), key=lambda client_data: self._sort_keys[client_data['id']])
+        return [client_codec.card_summary(client_data) for client_data in records]
+
+    def get(self, client_id: str) -> Optional[dict]:
+        """Повні дані клієнта за ID — копія, тож незбережені зміни в діалогах не потрапляють у кеш"""
+        client_data = self._cached(client_id)
+        return copy.deepcopy(client_data) if client_data is not None else None
+
+    def _cached(self, client_id: str) -> Optional[dict]:
+        """Повні дані з кешу репозиторію (payload декодується при першому зверненні); не змінювати"""
+        self.load()
+        if client_id not in self._records:
+            return None
+
+        client_data = self._details.get(client_id)
+        if client_data is None:
+            table = Client.__table__
+            with engine.connect() as connection:
+                payload = connection.execute(select(table.c.payload).where(table.c.id == client_id)).scalar()
+            client_data = self._decode(client_id, payload)
+            if client_data is not None:
+                self._details[client_id] = client_data
+        return client_data
+
+    def card(self, client_id: str) -> Optional[dict]:
+        """Копія картки клієнта без звернення до диску"""
+        self.load()
+        client_data = self._records.get(client_id)
+        return client_codec.card_summary(client_data) if client_data is not None else None
+
+    def __contains__(self, client_id: str) -> bool:
+        self.load()
+        return client_id in self._records
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self._records)
+
+    @property
+    def search_indexed(self) -> bool:
+        """Чи доступний індекс FTS5 (перевіряється та заповнюється один раз у load())"""
+        self.load()
+        return self._fts
+
+    def save(self, client_data: dict) -> str:
+        """Зберігає клієнта в БД та оновлює індекс. Повертає ID клієнта"""
+        self.load()
+        client_id = client_data['id']
+        table = Client.__table__
+        with self._transaction() as connection:
+            sort_key = self._sort_keys.get(client_id)
+            if sort_key is None:
+                # Клієнт з корзини лишається на своєму місці, новий стає в кінець дошки
+                sort_key = (connection.execute(select(table.c.sort_key).where(table.c.id == client_id)).scalar()
+                            or key_between(self._last_key, None))
+            connection.execute(upsert_statement(), [client_to_row(client_data, sort_key=sort_key, codec=self.codec)])
+            if self._fts:
+                client_search.index_clients(connection, [client_data])
+            # Змінені заміри дописуються в історію, попередні лишаються
+            measurement_history.record_clients(connection, [client_data])
+            released_media = get_media_store().set_references(connection, client_id, client_data)
+
+        if released_media:
+            # Фото, прибрані з клієнта, видаляються з диску, якщо на них ніхто не посилається
+            self._released_media |= released_media
+            if self._batch_connection is None:
+                self._collect_released_media()
+
+        self._sort_keys[client_id] = sort_key
+        self._last_key = max(self._last_key or '', sort_key)
+        self._records[client_id] = client_codec.card_summary(client_data)
+        self._details[client_id] = copy.deepcopy(client_data)
+        return client_id
+
+    def move(self, client_id: str, after_id: Optional[str], before_id: Optional[str]) -> str:
+        """Ставить клієнта між сусідами after_id та before_id (None — початок або кінець дошки).
+
+        Змінюється лише ключ цього клієнта — один рядок у БД. Повертає новий ключ.
+        """
+        self.load()
+        if client_id not in self._records:
+            raise KeyError(client_id)
+
+        sort_key = key_between(self._sort_keys.get(after_id) if after_id else None,
+                               self._sort_keys.get(before_id) if before_id else None)
+        table = Client.__table__
+        with self._transaction() as connection:
+            connection.execute(update(table).where(table.c.id == client_id).values(sort_key=sort_key))
+
+        self._sort_keys[client_id] = sort_key
+        self._last_key = max(self._last_key or '', sort_key)
+        return sort_key
+
+    @contextmanager
+    def batch(self):
+        """Пакетний режим: усі записи всередині блоку — одна транзакція.
+
+        Замість окремого commit (і синхронізації журналу) на кожного клієнта — один на пакет.
+        Якщо блок завершився помилкою, БД відкочується, а індекс у пам'яті перечитується.
+        Читання (all, search) всередині блоку бачать лише вже закомічені дані в БД.
+        """
+        self.load()
+        if self._batch_connection is not None:
+            # Вкладений пакет — частина зовнішнього
+            yield self
+            return
+
+        try:
+            with engine.begin() as connection:
+                self._batch_connection = connection
+                yield self
+        except Exception:
+            self._batch_connection = None
+            self._released_media.clear()
+            self.load(force=True)
+            raise
+        finally:
+            self._batch_connection = None
+        self._collect_released_media()
+
+    def search(self, text: str, limit: Optional[int] = None) -> List[dict]:
+        """Пошук клієнтів за іменем, телефоном, email, нотатками та цілями (за релевантністю)"""
+        self.load()
+        if not text.strip():
+            return self.all()
+
+        if self._fts:
+            with engine.connect() as connection:
+                client_ids = client_search.search_client_ids(connection, text, limit)
+            return [client_codec.card_summary(self._records[cid]) for cid in client_ids if cid in self._records]
+
+        # Запасний варіант без FTS5: пошук підрядка в повних даних (декодуються всі клієнти)
+        needle = text.strip().casefold()
+        found = [client_codec.card_summary(self._records[client_id]) for client_id in list(self._records)
+                 if needle in " ".join(client_search.fts_row(self._cached(client_id) or {'id': client_id})[1:]).casefold()]
+        return found if limit is None else found[:limit]
+
+    # ===== ІСТОРІЯ ЗАМІРІВ =====
+
+    def measurements(self, client_id: str, metrics: Optional[Sequence[str]] = None,
+                     start: Optional[date] = None, end: Optional[date] = None) -> List[dict]:
+        """Заміри клієнта за період (включно) у порядку дат: [{'date', 'metric', 'value'}]"""
+        with engine.connect() as connection:
+            return measurement_history.history(connection, client_id, metrics, start, end)
+
+    def latest_measurements(self, client_id: str) -> Dict[str, dict]:
+        """Останнє значення кожного показника: {показник: {'date', 'value'}}"""
+        with engine.connect() as connection:
+            return measurement_history.latest(connection, client_id)
+
+    def measurement_trend(self, client_id: str, metrics: Optional[Sequence[str]] = None,
+                          max_points: int = measurement_history.DEFAULT_MAX_POINTS,
+                          period: Optional[str] = None, start: Optional[date] = None,
+                          end: Optional[date] = None) -> Dict[str, List[dict]]:
+        """Агреговані точки для графіка прогресу (див. measurement_history.downsample)"""
+        with engine.connect() as connection:
+            return measurement_history.downsample(connection, client_id, metrics, max_points, period, start, end)
+
+    # ===== КОРЗИНА =====
+
+    def move_to_trash(self, client_id: str) -> bool:
+        """М'яке видалення: позначає клієнта неактивним"""
+        self.load()
+        table = Client.__table__
+        now = datetime.now()
+        with self._transaction() as connection:
+            result = connection.execute(
+                update(table).where(table.c.id == client_id)
+                .values(is_active=False, deleted_at=now, updated_at=now)
+            )
+            if self._fts:
+                client_search.remove_clients(connection, [client_id])
+
+        self._forget(client_id)
+        return result.rowcount > 0
+
+    def trashed(self) -> List[dict]:
+        """Клієнти в корзині: [{'id', 'data' (картка), 'deleted_at'}]"""
+        self.load()
+        table = Client.__table__
+        statement = (select(table.c.id, table.c.card, table.c.deleted_at, table.c.updated_at)
+                     .where(table.c.is_active == False)  # noqa: E712
+                     .order_by(table.c.deleted_at.desc()))
+
+        items = []
+        with engine.connect() as connection:
+            for client_id, card, deleted_at, updated_at in connection.execute(statement):
+                client_data = self._decode(client_id, card)
+                if client_data is not None:
+                    items.append({
+                        'id': client_id,
+                        'data': client_data,
+                        'deleted_at': deleted_at or updated_at,
+                    })
+        return items
+
+    def restore(self, client_id: str) -> Optional[dict]:
+        """Повертає клієнта з корзини та додає його в індекс"""
+        self.load()
+        table = Client.__table__
+        with self._transaction() as connection:
+            connection.execute(
+                update(table).where(table.c.id == client_id)
+                .values(is_active=True, deleted_at=None)
+            )
+            row = connection.execute(
+                select(table.c.payload, table.c.sort_key).where(table.c.id == client_id)
+            ).first()
+            payload, sort_key = row if row is not None else (None, None)
+
+            client_data = self._decode(client_id, payload)
+            if client_data is not None and self._fts:
+                client_search.index_clients(connection, [client_data])
+
+        if client_data is not None:
+            # Клієнт повертається на своє колишнє місце на дошці
+            self._records[client_id] = client_codec.card_summary(client_data)
+            self._details[client_id] = copy.deepcopy(client_data)
+            self._sort_keys[client_id] = sort_key or key_between(self._last_key, None)
+        return client_data
+
+    def delete_permanently(self, client_id: str):
+        """Безповоротно видаляє клієнта з БД"""
+        self.load()
+        table = Client.__table__
+        with self._transaction() as connection:
+            if self._fts:
+                client_search.remove_clients(connection, [client_id])
+            connection.execute(delete(table).where(table.c.id == client_id))
+        self._forget(client_id)
+        # Посилання клієнта на фото видалені каскадно разом з рядком
+        get_media_store().collect_garbage()
+
+    def clear_trash(self):
+        """Безповоротно видаляє всіх клієнтів з корзини"""
+        self.load()
+        table = Client.__table__
+        with self._transaction() as connection:
+            connection.execute(delete(table).where(table.c.is_active == False))  # noqa: E712
+        get_media_store().collect_garbage()
+
+    # ===== ДОПОМІЖНІ МЕТОДИ =====
+
+    def _ensure_search_index(self):
+        """Створює індекс FTS5 і заповнює його, якщо він порожній"""
+        with engine.begin() as connection:
+            self._fts = client_search.is_fts_available(connection)
+            if not self._fts or not self._records:
+                return
+
+            count = connection.exec_driver_sql(
+                f"SELECT count(*) FROM {client_search.FTS_TABLE}").scalar()
+            if count == 0:
+                # Індексуються поля з повних даних, тож payload декодується один раз тут
+                table = Client.__table__
+                rows = connection.execute(
+                    select(table.c.id, table.c.payload).where(table.c.is_active == True)  # noqa: E712
+                ).all()
+                client_search.index_clients(connection, (
+                    client_data for client_data in (self._decode(client_id, payload) for client_id, payload in rows)
+                    if client_data is not None))
+                print(f"🔎 Побудовано пошуковий індекс: {len(rows)} клієнтів")
+
+    def _collect_released_media(self):
+        """Збирач сміття для фото, звільнених останніми збереженнями"""
+        if self._released_media:
+            released, self._released_media = self._released_media, set()
+            get_media_store().collect_garbage(released)
+
+    def _forget(self, client_id: str):
+        """Прибирає клієнта з індексів у пам'яті"""
+        self._records.pop(client_id, None)
+        self._details.pop(client_id, None)
+        self._sort_keys.pop(client_id, None)
+
+    @contextmanager
+    def _transaction(self):
+        """Транзакція для запису: спільна в пакетному режимі, інакше окрема"""
+        if self._batch_connection is not None:
+            yield self._batch_connection
+        else:
+            with engine.begin() as connection:
+                yield connection
+
+    def _assign_missing_sort_keys(self):
+        """Ключі для рядків без позиції (стара БД, імпорт JSON) — за датою створення, після наявних"""
+        table = Client.__table__
+        with engine.begin() as connection:
+            client_ids = connection.execute(
+                select(table.c.id).where(table.c.sort_key.is_(None)).order_by(table.c.created_at)
+            ).scalars().all()
+            if not client_ids:
+                return
+
+            # Рівновіддалені ключі однакової довжини, усі більші за вже наявні
+            last_key = connection.execute(select(func.max(table.c.sort_key))).scalar()
+            prefix = key_between(last_key, None) if last_key else ''
+            connection.execute(
+                update(table).where(table.c.id == bindparam('row_id')).values(sort_key=bindparam('row_key')),
+                [{'row_id': client_id, 'row_key': prefix + key}
+                 for client_id, key in zip(client_ids, spread_keys(len(client_ids)))]
+            )
+        print(f"🔢 Призначено порядок на дошці: {len(client_ids)} клієнтів")
+
+    def _build_missing_cards(self):
+        """Картки для рядків, збережених до їх появи (один прохід по payload)"""
+        table = Client.__table__
+        with engine.begin() as connection:
+            rows = connection.execute(
+                select(table.c.id, table.c.payload).where(table.c.card.is_(None))
+            ).all()
+            params = []
+            for client_id, payload in rows:
+                client_data = self._decode(client_id, payload)
+                if client_data is not None:
+                    params.append({'row_id': client_id, 'row_card': client_codec.encode_card(client_data, self.codec)})
+            if not params:
+                return
+            connection.execute(
+                update(table).where(table.c.id == bindparam('row_id')).values(card=bindparam('row_card')),
+                params
+            )
+        print(f"🗂️ Створено картки клієнтів: {len(params)}")
+
+    def _import_legacy_files(self):
+        """Одноразовий імпорт старих JSON файлів (позначка — PRAGMA user_version)"""
+        with engine.connect() as connection:
+            version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+        if version >= LEGACY_IMPORT_VERSION:
+            return
+
+        from models.client_importer import import_json_clients
+        import_json_clients(self.clients_dir, self.trash_dir)
+
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f"PRAGMA user_version = {LEGACY_IMPORT_VERSION}")
+
+    def _backfill_measurement_history(self):
+        """Одноразово переносить збережені знімки замірів усіх клієнтів (і з корзини) в історію"""
+        with engine.connect() as connection:
+            version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+        if version >= MEASUREMENT_HISTORY_VERSION:
+            return
+
+        table = Client.__table__
+        with engine.begin() as connection:
+            rows = connection.execute(select(table.c.id, table.c.payload)).all()
+            added = measurement_history.record_clients(connection, (
+                client_data for client_data in (self._decode(client_id, payload) for client_id, payload in rows)
+                if client_data is not None))
+            connection.exec_driver_sql(f"PRAGMA user_version = {MEASUREMENT_HISTORY_VERSION}")
+        if added:
+            print(f"📏 Перенесено в історію замірів: {added} значень")
+
+    @staticmethod
+    def _decode(client_id: str, payload) -> Optional[dict]:
+        """Розбирає payload або card (будь-який кодек)"""
+        if not payload:
+            return None
+        try:
+            return client_codec.decode(payload)
+        except Exception as e:
+            print(f"❌ Помилка завантаження клієнта {client_id}: {e}")
+            return None
+
+
+# Глобальний екземпляр репозиторію
+_client_repository: Optional[ClientRepository] = None
+
+
+def get_client_repository() -> ClientRepository:
+    """Спільний репозиторій клієнтів для всіх вікон та діалогів"""
+    global _client_repository
+    if _client_repository is None:
+        _client_repository = ClientRepository()
+    return _client_repository
@@ -0,0 +1,106 @@
+# models/client_search.py
+"""Повнотекстовий пошук клієнтів (SQLite FTS5)"""
+import re
+from typing import Iterable, List, Optional
+
+from sqlalchemy.exc import OperationalError
+
+
+FTS_TABLE = "clients_fts"
+
+# Стовпці індексу та їх вага для bm25 (client_id не індексується)
+FTS_COLUMNS = ('first_name', 'surname', 'phone', 'email', 'goals', 'trainer_notes')
+FTS_WEIGHTS = (10.0, 10.0, 8.0, 5.0, 1.0, 1.0)
+
+# unicode61 приводить до нижнього регістру будь-які літери Unicode (кирилиця включно),
+# prefix='2 3' — індекси для швидкого пошуку за початком слова
+_CREATE_FTS = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"client_id UNINDEXED, {', '.join(FTS_COLUMNS)}, "
+    "tokenize=\"unicode61 remove_diacritics 2\", prefix='2 3')"
+)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def is_fts_available(connection) -> bool:
+    """Створює таблицю FTS5, якщо її немає. False — SQLite зібрано без FTS5"""
+    columns = tuple(row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({FTS_TABLE})"))
+    if columns and columns != ('client_id',) + FTS_COLUMNS:
+        # Індекс зі старим набором стовпців перестворюється і заповнюється наново
+        connection.exec_driver_sql(f"DROP TABLE {FTS_TABLE}")
+    try:
+        connection.exec_driver_sql(_CREATE_FTS)
+        return True
+    except OperationalError as e:
+        print(f"⚠️ FTS5 недоступний, пошук працюватиме без індексу: {e}")
+        return False
+
+
+def _phone_terms(phone: str) -> str:
+    """Телефон у вигляді, зручному для пошуку за префіксом: оригінал, лише цифри, без коду країни"""
+    digits = "".join(c for c in phone if c.isdigit())
+    terms = [phone, digits]
+    if len(digits) > 10:
+        terms.append(digits[-10:])
+    return " ".join(t for t in terms if t)
+
+
+def fts_row(client_data: dict) -> tuple:
+    """Значення рядка FTS для клієнта"""
+    return (
+        client_data['id'],
+        client_data.get('first_name', '') or '',
+        client_data.get('surname', '') or '',
+        _phone_terms(client_data.get('phone', '') or ''),
+        client_data.get('email', '') or '',
+        client_data.get('goals', '') or '',
+        client_data.get('trainer_notes', '') or '',
+    )
+
+
+# Рядок FTS має той самий rowid, що й рядок clients — видалення та оновлення без сканування
+_ROWID_OF = "(SELECT rowid FROM clients WHERE id = ?)"
+
+
+def index_clients(connection, clients: Iterable[dict]):
+    """Додає або оновлює клієнтів в індексі (рядки clients мають вже існувати)"""
+    rows = [fts_row(client_data) for client_data in clients]
+    if not rows:
+        return
+
+    remove_clients(connection, [row[0] for row in rows])
+    placeholders = ", ".join("?" * (len(FTS_COLUMNS) + 1))
+    connection.exec_driver_sql(
+        f"INSERT INTO {FTS_TABLE}(rowid, client_id, {', '.join(FTS_COLUMNS)}) "
+        f"VALUES ({_ROWID_OF}, {placeholders})",
+        [(row[0],) + row for row in rows]
+    )
+
+
+def remove_clients(connection, client_ids: Iterable[str]):
+    """Видаляє клієнтів з індексу (до видалення рядків clients)"""
+    params = [(client_id,) for client_id in client_ids]
+    if params:
+        connection.exec_driver_sql(f"DELETE FROM {FTS_TABLE} WHERE rowid = {_ROWID_OF}", params)
+
+
+def build_match_query(text: str) -> str:
+    """Перетворює введений текст у запит MATCH: кожне слово — префікс, всі слова обов'язкові"""
+    tokens = _TOKEN_RE.findall(text)
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def search_client_ids(connection, text: str, limit: Optional[int] = None) -> List[str]:
+    """Повертає ID клієнтів, відсортовані за релевантністю (bm25). limit=None — без обмеження"""
+    match = build_match_query(text)
+    if not match:
+        return []
+
+    weights = ", ".join(str(weight) for weight in FTS_WEIGHTS)
+    result = connection.exec_driver_sql(
+        f"SELECT client_id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ? "
+        f"ORDER BY bm25({FTS_TABLE}, 0.0, {weights}) LIMIT ?",
+        (match, -1 if limit is None else limit)
+    )
+    return [row[0] for row in result]
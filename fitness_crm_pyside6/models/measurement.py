@@ -0,0 +1,26 @@
+# models/measurement.py
+"""Модель запису історії замірів (один показник клієнта на одну дату)"""
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import Field as SQLField, SQLModel
+
+
+class Measurement(SQLModel, table=True):
+    """Рядок історії замірів.
+
+    Таблиця лише доповнюється: виправлення заміру за ту саму дату — новий рядок,
+    чинним вважається рядок з найбільшим id (див. models/measurement_history.py).
+    """
+    __tablename__ = "measurements"
+    # Діапазон дат одного клієнта — один прохід по індексу
+    __table_args__ = (Index('ix_measurements_client_date', 'client_id', 'date'),)
+
+    id: Optional[int] = SQLField(default=None, primary_key=True)
+    # Каскад діє, бо кожне з'єднання вмикає PRAGMA foreign_keys (config/database.py)
+    client_id: str = SQLField(foreign_key="clients.id", ondelete="CASCADE")
+    date: date
+    metric: str = SQLField(max_length=32)
+    value: float
+    recorded_at: datetime = SQLField(default_factory=datetime.now)
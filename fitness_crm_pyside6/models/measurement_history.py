@@ -0,0 +1,173 @@
+# models/measurement_history.py
+"""Історія замірів клієнтів: запис знімків з картки та запити для графіків прогресу.
+
+Вкладка «Поточні заміри» зберігає у записі клієнта лише останній знімок
+(measurement_date, measurement_weight, обхвати). При кожному збереженні клієнта
+змінені значення дописуються в таблицю measurements — попередні не перезаписуються.
+За одну дату може бути кілька рядків одного показника; чинний — з найбільшим id.
+"""
+import math
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from models.measurement import Measurement
+
+
+TABLE = Measurement.__tablename__
+
+# Поле знімка в записі клієнта → показник в історії
+SNAPSHOT_FIELDS = {
+    'measurement_weight': 'weight',
+    'shoulders': 'shoulders',
+    'chest': 'chest',
+    'waist': 'waist',
+    'hips': 'hips',
+    'left_arm': 'left_arm',
+    'right_arm': 'right_arm',
+    'left_thigh': 'left_thigh',
+    'right_thigh': 'right_thigh',
+    'left_calf': 'left_calf',
+    'right_calf': 'right_calf',
+}
+
+# Групування за календарним періодом (strftime SQLite)
+PERIOD_FORMATS = {
+    'week': '%Y-%W',
+    'month': '%Y-%m',
+    'year': '%Y',
+}
+
+DEFAULT_MAX_POINTS = 120
+
+
+def snapshot_values(client_data: dict) -> Optional[Tuple[str, Dict[str, float]]]:
+    """Дата та значення поточного знімка замірів клієнта (0 — «не виміряно», пропускається)"""
+    measured_on = client_data.get('measurement_date')
+    try:
+        measured_on = date.fromisoformat(measured_on).isoformat() if measured_on else None
+    except (TypeError, ValueError):
+        measured_on = None
+    if measured_on is None:
+        return None
+
+    values = {}
+    for field, metric in SNAPSHOT_FIELDS.items():
+        try:
+            value = float(client_data.get(field) or 0)
+        except (TypeError, ValueError):
+            continue
+        if value > 0:
+            values[metric] = value
+    return (measured_on, values) if values else None
+
+
+def _current_values(connection, client_id: str, measured_on: str) -> Dict[str, float]:
+    """Чинні значення показників клієнта на дату"""
+    result = connection.exec_driver_sql(
+        f"SELECT metric, value, max(id) FROM {TABLE} WHERE client_id = ? AND date = ? GROUP BY metric",
+        (client_id, measured_on)
+    )
+    return {metric: value for metric, value, _ in result}
+
+
+def record_clients(connection, clients: Iterable[dict]) -> int:
+    """Дописує в історію змінені значення знімків замірів (рядки clients мають вже існувати).
+
+    Повертає кількість доданих рядків. Незмінені значення не дублюються, тож виклик
+    можна повторювати при кожному збереженні клієнта.
+    """
+    now = datetime.now().isoformat(sep=' ')
+    rows = []
+    for client_data in clients:
+        snapshot = snapshot_values(client_data)
+        if snapshot is None:
+            continue
+
+        measured_on, values = snapshot
+        current = _current_values(connection, client_data['id'], measured_on)
+        rows.extend((client_data['id'], measured_on, metric, value, now)
+                    for metric, value in values.items() if current.get(metric) != value)
+
+    if rows:
+        connection.exec_driver_sql(
+            f"INSERT INTO {TABLE}(client_id, date, metric, value, recorded_at) VALUES (?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+
+def _range_filter(client_id: str, metrics: Optional[Sequence[str]],
+                  start: Optional[date], end: Optional[date]) -> Tuple[str, tuple]:
+    """Умова WHERE для клієнта, діапазону дат (включно) та списку показників"""
+    where = ["client_id = ?"]
+    params = [client_id]
+    if start is not None:
+        where.append("date >= ?")
+        params.append(start.isoformat())
+    if end is not None:
+        where.append("date <= ?")
+        params.append(end.isoformat())
+    if metrics:
+        where.append(f"metric IN ({', '.join('?' * len(metrics))})")
+        params.extend(metrics)
+    return " AND ".join(where), tuple(params)
+
+
+def _current_rows(client_id: str, metrics, start, end) -> Tuple[str, tuple]:
+    """Підзапит чинних рядків (останній запис кожного показника на кожну дату)"""
+    where, params = _range_filter(client_id, metrics, start, end)
+    return (f"SELECT date, metric, value, max(id) AS id FROM {TABLE} "
+            f"WHERE {where} GROUP BY date, metric"), params
+
+
+def history(connection, client_id: str, metrics: Optional[Sequence[str]] = None,
+            start: Optional[date] = None, end: Optional[date] = None) -> List[dict]:
+    """Заміри клієнта за період у порядку дат: [{'date', 'metric', 'value'}]"""
+    query, params = _current_rows(client_id, metrics, start, end)
+    result = connection.exec_driver_sql(f"SELECT date, metric, value FROM ({query}) ORDER BY date, metric", params)
+    return [{'date': date.fromisoformat(measured_on), 'metric': metric, 'value': value}
+            for measured_on, metric, value in result]
+
+
+def latest(connection, client_id: str) -> Dict[str, dict]:
+    """Останнє значення кожного показника: {показник: {'date', 'value'}}"""
+    query, params = _current_rows(client_id, None, None, None)
+    result = connection.exec_driver_sql(
+        f"SELECT metric, max(date), value FROM ({query}) GROUP BY metric", params)
+    return {metric: {'date': date.fromisoformat(measured_on), 'value': value}
+            for metric, measured_on, value in result}
+
+
+def downsample(connection, client_id: str, metrics: Optional[Sequence[str]] = None,
+               max_points: int = DEFAULT_MAX_POINTS, period: Optional[str] = None,
+               start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, List[dict]]:
+    """Агреговані точки для графіка: {показник: [{'start', 'end', 'avg', 'min', 'max', 'count'}]}.
+
+    period ('week', 'month', 'year') — групування за календарем; інакше діапазон дат
+    ділиться на рівні відрізки так, щоб на показник припадало не більше max_points точок.
+    Агрегація виконується в SQLite — у Python повертаються лише готові точки.
+    """
+    query, params = _current_rows(client_id, metrics, start, end)
+    if period is not None:
+        bucket = f"strftime('{PERIOD_FORMATS[period]}', date)"
+    else:
+        first, last = connection.exec_driver_sql(
+            f"SELECT julianday(min(date)), julianday(max(date)) FROM ({query})", params).one()
+        if first is None:
+            return {}
+        width = max(1, math.ceil((last - first + 1) / max(1, max_points)))
+        bucket = f"CAST((julianday(date) - {first}) / {width} AS INTEGER)"
+
+    result = connection.exec_driver_sql(
+        f"SELECT metric, min(date), max(date), avg(value), min(value), max(value), count(*) "
+        f"FROM ({query}) GROUP BY metric, {bucket} ORDER BY metric, min(date)", params)
+
+    points: Dict[str, List[dict]] = {}
+    for metric, first_date, last_date, average, minimum, maximum, count in result:
+        points.setdefault(metric, []).append({
+            'start': date.fromisoformat(first_date),
+            'end': date.fromisoformat(last_date),
+            'avg': average,
+            'min': minimum,
+            'max': maximum,
+            'count': count,
+        })
+    return points
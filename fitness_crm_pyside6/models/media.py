@@ -0,0 +1,26 @@
+# models/media.py
+"""Моделі сховища медіафайлів з адресацією за вмістом (див. models/media_store.py)"""
+from datetime import datetime
+
+from sqlalchemy import Index
+from sqlmodel import Field as SQLField, SQLModel
+
+
+class MediaBlob(SQLModel, table=True):
+    """Файл у сховищі: ім'я — SHA-256 вмісту, тож однакові фото зберігаються один раз"""
+    __tablename__ = "media_blobs"
+
+    sha256: str = SQLField(primary_key=True, max_length=64)
+    extension: str = SQLField(default='', max_length=16)
+    size: int = 0
+    created_at: datetime = SQLField(default_factory=datetime.now)
+
+
+class MediaReference(SQLModel, table=True):
+    """Посилання клієнта на файл; кількість рядків з одним sha256 — лічильник посилань"""
+    __tablename__ = "media_refs"
+    # Підрахунок посилань на файл без сканування таблиці
+    __table_args__ = (Index('ix_media_refs_sha256', 'sha256'),)
+
+    client_id: str = SQLField(foreign_key="clients.id", ondelete="CASCADE", primary_key=True)
+    sha256: str = SQLField(primary_key=True, max_length=64)
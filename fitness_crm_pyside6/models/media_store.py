@@ -0,0 +1,183 @@
+# models/media_store.py
+"""Сховище фото з адресацією за вмістом.
+
+Файл зберігається як data/media/<перші 2 символи>/<sha256><розширення>: повторний
+імпорт того самого фото не створює копії, а перенесення вихідної папки не ламає
+картку клієнта. Посилання клієнтів на файли записуються в media_refs разом зі
+збереженням клієнта; файли без жодного посилання видаляються збирачем сміття.
+"""
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from typing import Iterable, Optional, Set
+
+from config.database import engine, ensure_db
+from models.media import MediaBlob, MediaReference
+
+
+MEDIA_DIR = os.path.join("data", "media")
+CHUNK_SIZE = 1024 * 1024  # Файл хешується та копіюється шматками, без читання в пам'ять цілком
+
+BLOBS_TABLE = MediaBlob.__tablename__
+REFS_TABLE = MediaReference.__tablename__
+
+_BLOB_NAME_RE = re.compile(r'^([0-9a-f]{64})(\.[0-9A-Za-z]{1,15})?$')
+
+
+def blob_hash(path: Optional[str]) -> Optional[str]:
+    """SHA-256 файлу сховища за його шляхом (None — шлях не зі сховища)"""
+    if not path:
+        return None
+    directory, name = os.path.split(os.path.normpath(path))
+    match = _BLOB_NAME_RE.match(name)
+    if match is None or os.path.basename(directory) != match.group(1)[:2]:
+        return None
+    return match.group(1)
+
+
+def media_references(client_data: dict) -> Set[str]:
+    """Файли сховища, на які посилається запис клієнта (фото профілю та фото тестування)"""
+    paths = [client_data.get('photo_path')]
+    for photo in client_data.get('testing_photos') or []:
+        if isinstance(photo, dict):
+            # path — робоча копія для перегляду, original_path — оригінал імпорту (якщо відрізняється)
+            paths.extend((photo.get('path'), photo.get('original_path')))
+    return {sha256 for sha256 in map(blob_hash, paths) if sha256}
+
+
+class MediaStore:
+    """Імпорт файлів у сховище, облік посилань та збирання сміття"""
+
+    def __init__(self, root: str = MEDIA_DIR):
+        self.root = root
+        # Імпортовані в цьому сеансі, але ще не збережені в жодному клієнті (відкритий діалог) —
+        # збирач сміття їх не чіпає
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def path_for(self, sha256: str, extension: str = '') -> str:
+        return os.path.join(self.root, sha256[:2], sha256 + extension)
+
+    def import_file(self, source_path: str) -> str:
+        """Копіює файл у сховище (якщо такого вмісту ще немає) і повертає його шлях у сховищі.
+
+        Хеш рахується під час копіювання в тимчасовий файл — вихідний файл читається один раз.
+        """
+        with open(source_path, 'rb') as source:
+            return self._import(iter(lambda: source.read(CHUNK_SIZE), b''),
+                                os.path.splitext(source_path)[1].lower())
+
+    def import_bytes(self, data: bytes, extension: str) -> str:
+        """Як import_file, але для вмісту в пам'яті (наприклад, щойно закодованого JPEG)"""
+        return self._import((data,), extension.lower())
+
+    def _import(self, chunks: Iterable[bytes], extension: str) -> str:
+        ensure_db()
+        os.makedirs(self.root, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(prefix='.import-', dir=self.root)
+        try:
+            with os.fdopen(fd, 'wb') as target:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    target.write(chunk)
+                    size += len(chunk)
+            sha256 = digest.hexdigest()
+
+            with engine.begin() as connection:
+                stored_extension = connection.exec_driver_sql(
+                    f"SELECT extension FROM {BLOBS_TABLE} WHERE sha256 = ?", (sha256,)).scalar()
+                if stored_extension is None:
+                    stored_extension = extension[:16]
+                    connection.exec_driver_sql(
+                        f"INSERT INTO {BLOBS_TABLE}(sha256, extension, size, created_at) "
+                        f"VALUES (?, ?, ?, datetime('now', 'localtime'))", (sha256, stored_extension, size))
+
+                blob_path = self.path_for(sha256, stored_extension)
+                if os.path.exists(blob_path):
+                    os.remove(temp_path)  # Дублікат — копія не потрібна
+                else:
+                    os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                    os.replace(temp_path, blob_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self._lock:
+            self._pending.add(sha256)
+        return blob_path
+
+    def set_references(self, connection, client_id: str, client_data: dict) -> Set[str]:
+        """Замінює посилання клієнта на файли (в транзакції збереження клієнта).
+
+        Повертає файли, на які клієнт більше не посилається — кандидати для collect_garbage.
+        """
+        current = media_references(client_data)
+        previous = {row[0] for row in connection.exec_driver_sql(
+            f"SELECT sha256 FROM {REFS_TABLE} WHERE client_id = ?", (client_id,))}
+
+        released = previous - current
+        if released:
+            connection.exec_driver_sql(f"DELETE FROM {REFS_TABLE} WHERE client_id = ? AND sha256 = ?",
+                                       [(client_id, sha256) for sha256 in released])
+        if current - previous:
+            connection.exec_driver_sql(f"INSERT INTO {REFS_TABLE}(client_id, sha256) VALUES (?, ?)",
+                                       [(client_id, sha256) for sha256 in current - previous])
+        with self._lock:
+            self._pending -= current
+        return released
+
+    def reference_count(self, sha256: str) -> int:
+        """Кількість клієнтів, що посилаються на файл"""
+        with engine.connect() as connection:
+            return connection.exec_driver_sql(
+                f"SELECT count(*) FROM {REFS_TABLE} WHERE sha256 = ?", (sha256,)).scalar()
+
+    def collect_garbage(self, candidates: Optional[Iterable[str]] = None) -> int:
+        """Видаляє файли без посилань (лише серед candidates, якщо задано). Повертає кількість"""
+        ensure_db()
+        query = (f"SELECT sha256, extension FROM {BLOBS_TABLE} "
+                 f"WHERE NOT EXISTS (SELECT 1 FROM {REFS_TABLE} WHERE {REFS_TABLE}.sha256 = {BLOBS_TABLE}.sha256)")
+        params = ()
+        if candidates is not None:
+            candidates = list(candidates)
+            if not candidates:
+                return 0
+            query += f" AND sha256 IN ({', '.join('?' * len(candidates))})"
+            params = tuple(candidates)
+
+        with self._lock:
+            pending = set(self._pending)
+        with engine.begin() as connection:
+            garbage = [(sha256, extension) for sha256, extension in connection.exec_driver_sql(query, params)
+                       if sha256 not in pending]
+            if not garbage:
+                return 0
+            connection.exec_driver_sql(f"DELETE FROM {BLOBS_TABLE} WHERE sha256 = ?",
+                                       [(sha256,) for sha256, _ in garbage])
+
+        for sha256, extension in garbage:
+            try:
+                os.remove(self.path_for(sha256, extension))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"⚠️ Не вдалося видалити файл сховища {sha256[:12]}: {e}")
+        print(f"🧹 Видалено файлів без посилань: {len(garbage)}")
+        return len(garbage)
+
+
+# Глобальний екземпляр сховища
+_media_store: Optional[MediaStore] = None
+
+
+def get_media_store() -> MediaStore:
+    """Спільне сховище медіафайлів"""
+    global _media_store
+    if _media_store is None:
+        _media_store = MediaStore()
+    return _media_store
@@ -0,0 +1,61 @@
+# models/sort_keys.py
+"""Дробові ключі сортування: новий ключ завжди можна вставити між двома сусідніми.
+
+Ключ — рядок з цифр base62, який порівнюється як дріб 0.xxx (звичайне порівняння
+рядків у Python та SQLite BINARY). Перенесення елемента змінює лише його ключ.
+Ключі ніколи не закінчуються на '0', тож між будь-якими двома завжди є місце.
+"""
+from typing import List, Optional
+
+
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+BASE = len(DIGITS)
+_VALUES = {digit: value for value, digit in enumerate(DIGITS)}
+
+
+def key_between(lower: Optional[str], upper: Optional[str]) -> str:
+    """Ключ строго між lower та upper (None — без межі з цього боку).
+
+    Додавання в кінець (upper=None) збільшує останню цифру на одиницю, тож ключі
+    подовжуються лише раз на ~60 нових елементів; вставка між сусідами ділить проміжок навпіл.
+    """
+    if lower is not None and upper is not None and lower >= upper:
+        raise ValueError(f"Некоректні межі ключа: {lower!r} >= {upper!r}")
+
+    lower = lower or ''
+    append = upper is None
+    digits = []
+    position = 0
+    while True:
+        low = _VALUES[lower[position]] if position < len(lower) else 0
+        high = _VALUES[upper[position]] if upper is not None else BASE
+
+        if high - low > 1:
+            digits.append(DIGITS[low + 1 if append else (low + high) // 2])
+            return ''.join(digits)
+
+        # Цифра збігається з нижньою межею; якщо верхня більша на одиницю,
+        # далі вона вже не обмежує (префікс і так менший за upper)
+        digits.append(DIGITS[low])
+        if high - low == 1:
+            upper = None
+        position += 1
+
+
+def spread_keys(count: int) -> List[str]:
+    """count рівновіддалених ключів однакової довжини (для початкового порядку)"""
+    width = 1
+    while BASE ** width <= count:
+        width += 1
+    step = BASE ** width // (count + 1)
+
+    keys = []
+    for i in range(1, count + 1):
+        value = i * step
+        prefix = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            prefix.append(DIGITS[digit])
+        # Середня цифра в кінці лишає місце для вставок з обох боків
+        keys.append(''.join(reversed(prefix)) + DIGITS[BASE // 2])
+    return keys
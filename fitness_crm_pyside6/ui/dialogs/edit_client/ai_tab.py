@@ -7,7 +7,6 @@ from PySide6.QtGui import QClipboard
 from qfluentwidgets import LineEdit, TextEdit, InfoBar, InfoBarPosition
 from ui.styles import COLORS
 from utils.ai_helper import generate_ai_prompt, get_default_ai_url
-import webbrowser
 
 
 class AITab(QWidget):
@@ -193,6 +192,8 @@ class AITab(QWidget):
     
     def _open_ai_page(self):
         """Відкриває сторінку Google AI Studio або збережене посилання"""
+        import webbrowser
+        
         ai_link = self.ai_link_edit.text().strip()
         
         if ai_link:
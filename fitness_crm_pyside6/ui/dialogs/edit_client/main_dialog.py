@@ -1,28 +1,58 @@
 # ui/dialogs/edit_client/main_dialog.py
 """Головний діалог редагування клієнта"""
+import importlib
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QTabWidget, QWidget, QFrame, QFileDialog)
 from PySide6.QtGui import QFont
 from qfluentwidgets import MessageBox, InfoBar, InfoBarPosition
-from .basic_tab import BasicTab
-from .physical_tab_new import PhysicalTab
-from .health_tab import HealthTab
-from .lifestyle_tab import LifestyleTab
-from .goals_tab import GoalsTab
-from .measurements_tab import MeasurementsTab
-from .testing_tab import TestingTab
-from .ai_tab import AITab
 from ui.dialogs.photo_display import PhotoDisplayWidget
 from ui.styles import COLORS
 import os
 
 
+# Вкладки в порядку відображення: (ключ, модуль пакета, клас, заголовок, чи передавати діалог як parent)
+TAB_SPECS = (
+    ('basic', 'basic_tab', 'BasicTab', "👤 Основні дані", True),
+    ('physical', 'physical_tab_new', 'PhysicalTab', "💪 Фізичні параметри", True),
+    ('health', 'health_tab', 'HealthTab', "❤️ Здоров'я", False),
+    ('lifestyle', 'lifestyle_tab', 'LifestyleTab', "🏃 Спосіб життя", False),
+    ('goals', 'goals_tab', 'GoalsTab', "🎯 Цілі та плани", False),
+    ('measurements', 'measurements_tab', 'MeasurementsTab', "📏 Поточні заміри", False),
+    ('testing', 'testing_tab', 'TestingTab', "📸 Тестування", False),
+    ('ai', 'ai_tab', 'AITab', "🤖 Персональний АІ", False),
+)
+
+# Вкладка (та її модуль) створюється при першому відкритті; False — всі вкладки одразу, як раніше
+LAZY_TABS = True
+
+
+class _TabAttribute:
+    """Атрибут діалогу (basic_tab, physical_tab, ...), що створює вкладку при першому зверненні"""
+    
+    def __init__(self, key):
+        self.key = key
+    
+    def __get__(self, dialog, owner):
+        if dialog is None:
+            return self
+        return dialog._ensure_tab(self.key)
+
+
 class EditClientDialog(QDialog):
     """Діалог додавання/редагування клієнта"""
     
     client_saved = Signal(dict)  # Сигнал при збереженні клієнта
     
+    basic_tab = _TabAttribute('basic')
+    physical_tab = _TabAttribute('physical')
+    health_tab = _TabAttribute('health')
+    lifestyle_tab = _TabAttribute('lifestyle')
+    goals_tab = _TabAttribute('goals')
+    measurements_tab = _TabAttribute('measurements')
+    testing_tab = _TabAttribute('testing')
+    ai_tab = _TabAttribute('ai')
+    
     def __init__(self, client_data=None, parent=None):
         super().__init__(parent)
         self.client_data = client_data or {}
@@ -188,28 +218,22 @@ class EditClientDialog(QDialog):
             }}
         """)
         
-        # Створюємо всі 8 вкладок
-        self.basic_tab = BasicTab(self.client_data, parent=self)
-        self.physical_tab = PhysicalTab(self.client_data, parent=self)
-        self.health_tab = HealthTab(self.client_data)
-        self.lifestyle_tab = LifestyleTab(self.client_data)
-        self.goals_tab = GoalsTab(self.client_data)
-        self.measurements_tab = MeasurementsTab(self.client_data)
-        self.testing_tab = TestingTab(self.client_data)
-        self.ai_tab = AITab(self.client_data)
-        
-        # Підключаємо сигнали для автоматичних розрахунків
-        self._setup_tab_connections()
-        
-        # Додаємо вкладки
-        self.tab_widget.addTab(self.basic_tab, "👤 Основні дані")
-        self.tab_widget.addTab(self.physical_tab, "💪 Фізичні параметри")
-        self.tab_widget.addTab(self.health_tab, "❤️ Здоров'я")
-        self.tab_widget.addTab(self.lifestyle_tab, "🏃 Спосіб життя")
-        self.tab_widget.addTab(self.goals_tab, "🎯 Цілі та плани")
-        self.tab_widget.addTab(self.measurements_tab, "📏 Поточні заміри")
-        self.tab_widget.addTab(self.testing_tab, "📸 Тестування")
-        self.tab_widget.addTab(self.ai_tab, "🤖 Персональний АІ")
+        # Порожні сторінки для всіх 8 вкладок; сама вкладка з'являється в сторінці при першому відкритті
+        self._tabs = {}
+        self._tab_pages = {}
+        for key, _module, _class_name, title, _needs_parent in TAB_SPECS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_pages[key] = page
+            self.tab_widget.addTab(page, title)
+        
+        if LAZY_TABS:
+            self._ensure_tab('basic')
+        else:
+            for key in self._tab_pages:
+                self._ensure_tab(key)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(self.tab_widget, 1)
         
@@ -273,38 +297,58 @@ class EditClientDialog(QDialog):
         
         layout.addLayout(buttons_layout)
     
-    def _setup_tab_connections(self):
-        """Налаштовує зв'язки між вкладками для автоматичних розрахунків"""
-        print("🔗 Налаштовую зв'язки між вкладками...")
+    def _ensure_tab(self, key):
+        """Повертає вкладку, при першому зверненні імпортує її модуль та створює"""
+        tab = self._tabs.get(key)
+        if tab is not None:
+            return tab
+        
+        _key, module_name, class_name, _title, needs_parent = next(spec for spec in TAB_SPECS if spec[0] == key)
+        tab_class = getattr(importlib.import_module(f'.{module_name}', __package__), class_name)
+        tab = tab_class(self.client_data, parent=self) if needs_parent else tab_class(self.client_data)
+        self._tabs[key] = tab
+        self._tab_pages[key].layout().addWidget(tab)
         
+        # Підключаємо сигнали для автоматичних розрахунків
+        self._setup_tab_connections(key, tab)
+        return tab
+    
+    def _on_tab_changed(self, index):
+        """Створює вкладку при першому переході на неї"""
+        if 0 <= index < len(TAB_SPECS):
+            self._ensure_tab(TAB_SPECS[index][0])
+    
+    def _built_tabs(self):
+        """Вже створені вкладки в порядку відображення"""
+        return [self._tabs[spec[0]] for spec in TAB_SPECS if spec[0] in self._tabs]
+    
+    def _setup_tab_connections(self, key, tab):
+        """Налаштовує зв'язки новоствореної вкладки з фізичною для автоматичних розрахунків"""
         # Підключаємо зміни в основних даних (вік, стать) до оновлення розрахунків
-        if hasattr(self.basic_tab, 'birth_date_edit'):
-            self.basic_tab.birth_date_edit.dateChanged.connect(self._trigger_calculations_update)
-            print("✅ Підключено сигнал dateChanged для дати народження")
-        
-        if hasattr(self.basic_tab, 'gender_combo'):
-            self.basic_tab.gender_combo.currentTextChanged.connect(self._trigger_calculations_update)
-            print("✅ Підключено сигнал currentTextChanged для статі")
+        if key == 'basic':
+            if hasattr(tab, 'birth_date_edit'):
+                tab.birth_date_edit.dateChanged.connect(self._trigger_calculations_update)
+                print("✅ Підключено сигнал dateChanged для дати народження")
+            
+            if hasattr(tab, 'gender_combo'):
+                tab.gender_combo.currentTextChanged.connect(self._trigger_calculations_update)
+                print("✅ Підключено сигнал currentTextChanged для статі")
         
         # Підключаємо зміни в способі життя (активність) до оновлення розрахунків
-        if hasattr(self.lifestyle_tab, 'activity_level_combo'):
-            self.lifestyle_tab.activity_level_combo.currentTextChanged.connect(self._trigger_calculations_update)
+        elif key == 'lifestyle' and hasattr(tab, 'activity_level_combo'):
+            tab.activity_level_combo.currentTextChanged.connect(self._trigger_calculations_update)
             print("✅ Підключено сигнал currentTextChanged для рівня активності")
-        
-        print("🔗 Зв'язки між вкладками налаштовано")
     
     def _trigger_calculations_update(self):
         """Запускає оновлення розрахунків у фізичній вкладці"""
-        print("🔥 Запуск оновлення розрахунків...")
-        
-        # Перевіряємо чи існує physical_tab
-        if not hasattr(self, 'physical_tab'):
-            print("⚠️ physical_tab ще не створено")
+        # Фізична вкладка ще не відкривалась — розрахунки виконаються при її створенні
+        physical_tab = self._tabs.get('physical')
+        if physical_tab is None:
             return
-            
-        if hasattr(self.physical_tab, '_update_calculations'):
+        
+        if hasattr(physical_tab, '_update_calculations'):
             print("📊 Викликаю _update_calculations в physical_tab")
-            self.physical_tab._update_calculations()
+            physical_tab._update_calculations()
         else:
             print("⚠️ Метод _update_calculations не знайдено в physical_tab")
     
@@ -318,8 +362,16 @@ class EditClientDialog(QDialog):
         )
         
         if file_path:
-            self._current_photo_path = file_path
-            self.photo_display.load_photo(file_path)
+            try:
+                self._current_photo_path = self._store_photo(file_path)
+            except OSError as e:
+                MessageBox(
+                    title="❌ Помилка",
+                    content=f"Не вдалося скопіювати фото: {e}",
+                    parent=self
+                ).exec()
+                return
+            self.photo_display.load_photo(self._current_photo_path)
             
             InfoBar.success(
                 title="Успіх",
@@ -331,6 +383,14 @@ class EditClientDialog(QDialog):
                 parent=self
             )
     
+    @staticmethod
+    def _store_photo(file_path):
+        """Шлях фото в сховищі медіафайлів (файл копіюється, якщо його там ще немає)"""
+        from models.media_store import blob_hash, get_media_store
+        if blob_hash(file_path) is not None:
+            return file_path
+        return get_media_store().import_file(file_path)
+    
     def _load_client_data(self):
         """Завантажує дані клієнта для редагування"""
         if self.is_edit_mode and self.client_data:
@@ -352,8 +412,8 @@ class EditClientDialog(QDialog):
     def _save_client(self):
         """Збереження клієнта"""
         try:
-            # Збираємо дані з усіх вкладок
-            client_data = {}
+            # Збираємо дані з відкритих вкладок; поля невідкритих лишаються як були
+            client_data = dict(self.client_data)
             
             # Основні дані (обов'язкові)
             basic_data = self.basic_tab.get_data()
@@ -361,15 +421,13 @@ class EditClientDialog(QDialog):
                 return
             
             client_data.update(basic_data)
-            client_data.update(self.physical_tab.get_data())
-            client_data.update(self.health_tab.get_data())
-            client_data.update(self.lifestyle_tab.get_data())
-            client_data.update(self.goals_tab.get_data())
-            client_data.update(self.measurements_tab.get_data())
-            client_data.update(self.testing_tab.get_data())
-            client_data.update(self.ai_tab.get_data())
+            for tab in self._built_tabs():
+                if tab is not self.basic_tab:
+                    client_data.update(tab.get_data())
             
-            # Додаємо фото та його параметри
+            # Додаємо фото та його параметри (фото з довільної папки переноситься в сховище)
+            if self._current_photo_path and os.path.isfile(self._current_photo_path):
+                self._current_photo_path = self._store_photo(self._current_photo_path)
             client_data['photo_path'] = self._current_photo_path
             
             # Зберігаємо параметри позиціонування фото
@@ -470,40 +528,27 @@ class EditClientDialog(QDialog):
         return True
     
     def _save_client_to_file(self, client_data):
-        """Зберігає клієнта у файл JSON"""
-        import json
-        import os
+        """Зберігає клієнта в базу даних через репозиторій клієнтів"""
         from datetime import datetime
-        
-        # Створюємо папку для клієнтів якщо її немає
-        clients_dir = "data/clients"
-        os.makedirs(clients_dir, exist_ok=True)
+        from models.client_repository import get_client_repository
         
         # Додаємо timestamp
         client_data['created_at'] = datetime.now().isoformat()
         client_data['updated_at'] = datetime.now().isoformat()
         
-        # Створюємо безпечне ім'я файлу з імені та прізвища
         first_name = client_data.get('first_name', '')
         surname = client_data.get('surname', '')
         full_name = f"{first_name} {surname}".strip()
         
-        safe_name = "".join(c for c in full_name if c.isalnum() or c in ' -_').strip()
-        safe_name = safe_name.replace(' ', '_')[:30]  # Обмежуємо довжину
-        
-        filename = f"{safe_name}_{client_data['id'][:8]}.json"
-        filepath = os.path.join(clients_dir, filename)
-        
-        # Зберігаємо у файл
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(client_data, f, ensure_ascii=False, indent=2)
+        # Зберігаємо в БД та оновлюємо індекс
+        client_id = get_client_repository().save(client_data)
         
         # Виводимо повідомлення про успішне збереження
         from config.logger import get_app_logger
         logger = get_app_logger()
         
-        logger.info(f"💾 Клієнта '{full_name}' збережено: {filename}")
-        print(f"✅ Клієнта збережено: {filepath}")
+        logger.info(f"💾 Клієнта '{full_name}' збережено: {client_id[:8]}")
+        print(f"✅ Клієнта збережено: {client_id}")
         
         return client_data
     
@@ -512,7 +557,7 @@ class EditClientDialog(QDialog):
         print("🆕 Встановлення пустих значень для нового клієнта...")
         
         # Очищаємо поля в basic_tab
-        if hasattr(self, 'basic_tab') and hasattr(self.basic_tab, 'set_default_empty_values'):
+        if hasattr(self.basic_tab, 'set_default_empty_values'):
             self.basic_tab.set_default_empty_values()
         
         # Очищаємо поля в physical_tab - там вже встановлені нульові значення
@@ -2,11 +2,11 @@
 """Вкладка фізичних параметрів клієнта з автоматичними розрахунками"""
 import math
 from datetime import datetime, date
-from PySide6.QtCore import QDate, Qt, Signal
+from PySide6.QtCore import QDate, Qt, Signal, QTimer
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, 
                                QGroupBox, QScrollArea, QLabel, QFrame)
 from qfluentwidgets import LineEdit, ComboBox, DateEdit, SpinBox, DoubleSpinBox
-from utils.calculations import FitnessCalculator
+from utils.calculations import ACTIVITY_LEVELS, get_metric_graph
 """Вкладка фізичних параметрів клієнта з автоматичними розрахунками"""
 import math
 from datetime import datetime, date
@@ -16,6 +16,29 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
 from qfluentwidgets import LineEdit, ComboBox, DateEdit, SpinBox, DoubleSpinBox
 
 
+# Розрахункові картки: лейбл → показники графа (utils.calculations.METRICS) → метод, що формує текст картки
+METRIC_CARDS = (
+    ('bmi_display', ('bmi', 'bmi_category'), '_format_bmi'),
+    ('body_fat_display', ('body_fat_percentage',), '_format_body_fat'),
+    ('muscle_mass_display', ('muscle_mass',), '_format_muscle_mass'),
+    ('body_type_display', ('body_type',), '_format_body_type'),
+    ('bmr_display', ('bmr',), '_format_bmr'),
+    ('calories_display', ('daily_calories_detailed',), '_format_daily_calories'),
+    ('hr_status_display', ('hr_status',), '_format_hr_status'),
+    ('hr_zones_display', ('hr_zones',), '_format_hr_zones'),
+)
+
+RESULT_LABEL_STYLE = "QLabel { background: transparent; border: none; }"
+
+# Кольори фону для кольорів категорій з utils.calculations
+CATEGORY_BACKGROUNDS = {
+    '#EF4444': '#FEE2E2',  # Червоний -> Світло-червоний
+    '#10B981': '#D1FAE5',  # Зелений -> Світло-зелений
+    '#3B82F6': '#DBEAFE',  # Блакитний -> Світло-блакитний
+    '#F59E0B': '#FEF3C7',  # Помаранчевий -> Світло-помаранчевий
+}
+
+
 class PhysicalTab(QWidget):
     """Вкладка фізичних параметрів клієнта з автоматичними розрахунками"""
     
@@ -26,6 +49,15 @@ class PhysicalTab(QWidget):
         super().__init__(parent)
         self.client_data = client_data or {}
         self.parent_dialog = parent  # Для отримання даних з інших вкладок
+        
+        # Серія змін (тики спінбоксів, сигнали інших вкладок) дає один перерахунок за прохід циклу подій
+        self._calculation_timer = QTimer(self)
+        self._calculation_timer.setSingleShot(True)
+        self._calculation_timer.setInterval(0)
+        self._calculation_timer.timeout.connect(self._recalculate)
+        self._last_inputs = {}  # Входи останнього перерахунку
+        self._card_texts = {}  # Поточний текст кожної картки
+        
         self._init_ui()
         self._load_data()
         self._setup_calculations()
@@ -179,7 +211,8 @@ class PhysicalTab(QWidget):
         self.menstrual_cycle_edit = LineEdit()
         self.menstrual_cycle_edit.setPlaceholderText("Інформація про менструальний цикл")
         self.menstrual_cycle_edit.setMinimumHeight(40)
-        self.menstrual_row = medical_form.addRow("🌸 Цикл місячних:", self.menstrual_cycle_edit)
+        medical_form.addRow("🌸 Цикл місячних:", self.menstrual_cycle_edit)
+        self.menstrual_row = (medical_form.labelForField(self.menstrual_cycle_edit), self.menstrual_cycle_edit)
         
         # ===== РОЗРАХУНКОВІ ПОКАЗНИКИ =====
         calculations_group = QGroupBox("🧮 Розрахункові показники (автоматично)")
@@ -277,18 +310,9 @@ class PhysicalTab(QWidget):
         self.weight_changed.emit(value)
     
     def _setup_calculations(self):
-        """Налаштовує автоматичні розрахунки при зміні полів"""
-        # Підключаємо оновлення розрахунків до зміни значень основних полів
-        if hasattr(self, 'height_spin'):
-            self.height_spin.valueChanged.connect(self._update_calculations)
-        if hasattr(self, 'weight_spin'):
-            self.weight_spin.valueChanged.connect(self._update_calculations)
-            self.weight_spin.valueChanged.connect(self._on_weight_changed)
-        if hasattr(self, 'heart_rate_spin'):
-            self.heart_rate_spin.valueChanged.connect(self._update_calculations)
-        
-        # Виконуємо початковий розрахунок
-        self._update_calculations()
+        """Виконує початковий розрахунок (сигнали полів підключено в _init_ui)"""
+        self._calculation_timer.stop()
+        self._recalculate()
     
     def _on_weight_changed(self, value):
         """Обробляє зміну ваги та сигналізує іншим вкладкам"""
@@ -296,65 +320,64 @@ class PhysicalTab(QWidget):
             self.weight_changed.emit(value)
     
     def _update_calculations(self):
-        """Оновлює всі розрахунки автоматично в режимі реального часу"""
+        """Планує перерахунок показників; всі виклики до наступного проходу циклу подій об'єднуються в один"""
+        if not self._calculation_timer.isActive():
+            self._calculation_timer.start()
+    
+    def _calculation_inputs(self):
+        """Поточні входи розрахунків: поля вкладки та дані з інших вкладок"""
+        return {
+            'height': self.height_spin.value() or None,
+            'weight': self.weight_spin.value() or None,
+            'hr_rest': self.heart_rate_spin.value() or None,
+            'age': self._get_age(),
+            'gender': self._get_gender(),
+            'activity_level': ACTIVITY_LEVELS.get(self._get_activity_level(), 'sedentary'),
+        }
+    
+    def _recalculate(self):
+        """Перераховує лише показники, входи яких змінились, та оновлює лише змінені картки"""
         try:
-            # Отримуємо базові дані
-            height_cm = self.height_spin.value() if self.height_spin.value() > 0 else None
-            weight_kg = self.weight_spin.value() if self.weight_spin.value() > 0 else None
-            hr_rest = self.heart_rate_spin.value() if self.heart_rate_spin.value() > 0 else None
-            
-            # Отримуємо дані з інших вкладок
-            age = self._get_age()
-            gender = self._get_gender()
-            activity_level = self._get_activity_level()
+            inputs = self._calculation_inputs()
+            changed = {name for name, value in inputs.items()
+                       if name not in self._last_inputs or self._last_inputs[name] != value}
+            if not changed:
+                return
+            self._last_inputs = inputs
             
             # Показуємо/приховуємо поле циклу місячних
-            self._toggle_menstrual_field(gender)
-            
-            # Створюємо словник даних для розрахунків
-            data = {
-                'weight': weight_kg,
-                'height': height_cm,
-                'age': age,
-                'gender': gender,
-                'activity_level': activity_level,
-                'hr_rest': hr_rest
-            }
+            if 'gender' in changed:
+                self._toggle_menstrual_field(inputs['gender'])
             
-            # Виконуємо всі розрахунки одночасно
-            metrics = FitnessCalculator.calculate_all_metrics(data)
-            
-            # Оновлюємо відображення всіх результатів (якщо є відповідні віджети)
-            if hasattr(self, 'bmi_display'):
-                self._update_bmi_display(metrics['bmi'], metrics['bmi_category'])
-            if hasattr(self, 'body_fat_display'):
-                self._update_body_fat_display(metrics['body_fat_percentage'])
-            if hasattr(self, 'ideal_weight_display'):
-                self._update_ideal_weight_display(metrics['ideal_weight'])
-            if hasattr(self, 'bmr_display'):
-                self._update_bmr_display(metrics['bmr'])
-            if hasattr(self, 'daily_calories_display'):
-                self._update_daily_calories_display(metrics['daily_calories_detailed'])
-            if hasattr(self, 'water_display'):
-                self._update_water_intake_display(metrics['water_intake'])
-            if hasattr(self, 'muscle_mass_display'):
-                self._update_muscle_mass_display(metrics['muscle_mass'])
-            if hasattr(self, 'body_type_display'):
-                self._update_body_type_display(metrics['body_type'])
-            if hasattr(self, 'hr_status_display'):
-                self._update_hr_status_display(metrics['hr_status'])
-            if hasattr(self, 'hr_zones_display'):
-                self._update_hr_zones_display(metrics['hr_zones'])
+            # Картки, показники яких залежать від змінених входів (спільні проміжні значення рахуються раз)
+            graph = get_metric_graph()
+            cards = [card for card in METRIC_CARDS if not changed.isdisjoint(graph.inputs_of(*card[1]))]
+            metrics = graph.evaluate_many({name for card in cards for name in card[1]}, inputs)
+            for attribute, _metric_names, formatter in cards:
+                self._set_card_text(getattr(self, attribute), getattr(self, formatter)(metrics))
             
         except Exception as e:
             # Логуємо помилку, але не виводимо в консоль
             if hasattr(self, 'parent_dialog') and hasattr(self.parent_dialog, 'logger'):
                 self.parent_dialog.logger.error(f"Помилка розрахунків: {e}")
     
-    def _update_bmi_display(self, bmi, category):
-        """Оновлює відображення ІМТ"""
-        if not bmi or not hasattr(self, 'bmi_display'):
+    def _set_card_text(self, label, text):
+        """Оновлює картку, лише якщо її текст змінився"""
+        if self._card_texts.get(label) == text:
             return
+        self._card_texts[label] = text
+        label.setText(text)
+        if label.styleSheet() != RESULT_LABEL_STYLE:
+            label.setStyleSheet(RESULT_LABEL_STYLE)
+    
+    # ===== ФОРМАТУВАННЯ КАРТОК =====
+    
+    def _format_bmi(self, metrics):
+        """Текст картки ІМТ"""
+        bmi = metrics['bmi']
+        if not bmi:
+            return "Введіть зріст та вагу"
+        category = metrics['bmi_category']
         
         # Визначення кольору за категорією
         if "Недостатня" in category:
@@ -370,61 +393,166 @@ class PhysicalTab(QWidget):
             color = "#EF4444"  # Червоний
             bg_color = "#FEE2E2"
         
-        result_text = f"""
+        return f"""
         <div style='background: {bg_color}; padding: 8px; border-radius: 6px; color: {color}; font-weight: 600;'>
             <div style='font-size: 16px;'>ІМТ: {bmi}</div>
             <div style='font-size: 14px; margin-top: 4px;'>{category}</div>
         </div>
         """
-        
-        self.bmi_display.setText(result_text)
-        self.bmi_display.setStyleSheet("QLabel { background: transparent; border: none; }")
     
-    def _update_body_fat_display(self, body_fat):
-        """Оновлює відображення відсотка жиру"""
-        if not body_fat or not hasattr(self, 'body_fat_display'):
-            return
+    def _format_body_fat(self, metrics):
+        """Текст картки відсотка жиру"""
+        body_fat = metrics['body_fat_percentage']
+        if not body_fat:
+            return "Введіть зріст, вагу, вік та стать"
         
-        result_text = f"""
+        return f"""
         <div style='background: #DBEAFE; padding: 8px; border-radius: 6px; color: #3B82F6; font-weight: 600;'>
             <div style='font-size: 16px;'>Жир у тілі: {body_fat}%</div>
         </div>
         """
-        
-        self.body_fat_display.setText(result_text)
-        self.body_fat_display.setStyleSheet("QLabel { background: transparent; border: none; }")
+    
+    def _format_muscle_mass(self, metrics):
+        """Текст картки м'язової маси"""
+        muscle_mass = metrics['muscle_mass']
+        if not muscle_mass:
+            return "Введіть зріст, вагу, вік та стать"
+        
+        color = muscle_mass['color']
+        bg_color = CATEGORY_BACKGROUNDS.get(color, '#F3F4F6')
+        return f"""
+        <div style='background: {bg_color}; padding: 8px; border-radius: 6px; color: {color}; font-weight: 600;'>
+            <div style='font-size: 16px;'>М'язова маса: {muscle_mass['mass_kg']} кг</div>
+            <div style='font-size: 14px; margin-top: 4px;'>{muscle_mass['percentage']}% - {muscle_mass['category']}</div>
+        </div>
+        """
+    
+    def _format_body_type(self, metrics):
+        """Текст картки типу тілобудови"""
+        body_type = metrics['body_type']
+        if not body_type:
+            return "Введіть зріст та вагу"
+        
+        color = body_type['color']
+        bg_color = CATEGORY_BACKGROUNDS.get(color, '#F3F4F6')
+        return f"""
+        <div style='background: {bg_color}; padding: 12px; border-radius: 8px; color: {color}; font-weight: 600;'>
+            <div style='font-size: 16px; margin-bottom: 8px;'>Тип тілобудови: {body_type['type']}</div>
+            <div style='font-size: 12px; color: #6B7280; line-height: 1.4;'>{body_type['description']}</div>
+        </div>
+        """
+    
+    def _format_bmr(self, metrics):
+        """Текст картки базального метаболізму"""
+        bmr = metrics['bmr']
+        if not bmr:
+            return "Введіть зріст, вагу, вік та стать"
+        
+        return f"""
+        <div style='background: #FEF3C7; padding: 8px; border-radius: 6px; color: #D97706; font-weight: 600;'>
+            <div style='font-size: 16px;'>BMR: {int(bmr)} ккал/день</div>
+        </div>
+        """
+    
+    def _format_daily_calories(self, metrics):
+        """Текст картки денної потреби в калоріях"""
+        calories = metrics['daily_calories_detailed']
+        if not calories:
+            return "Введіть зріст, вагу, вік та стать"
+        
+        return f"""
+        <div style='background: #ECFDF5; padding: 12px; border-radius: 8px; color: #059669; font-weight: 600;'>
+            <div style='font-size: 16px; margin-bottom: 8px;'>Денні калорії:</div>
+            <div style='font-size: 14px; margin: 4px 0;'>🎯 Підтримка: {calories['maintenance']} ккал</div>
+            <div style='font-size: 14px; margin: 4px 0;'>📉 Схуднення: {calories['weight_loss']} ккал</div>
+            <div style='font-size: 14px; margin: 4px 0;'>📈 Набір маси: {calories['weight_gain']} ккал</div>
+        </div>
+        """
+    
+    def _format_hr_status(self, metrics):
+        """Текст картки статусу ЧСС у спокої"""
+        hr_status = metrics['hr_status']
+        if not hr_status:
+            return "Введіть ЧСС у спокої"
+        
+        color = hr_status['color']
+        bg_color = CATEGORY_BACKGROUNDS.get(color, '#F3F4F6')
+        return f"""
+        <div style='background: {bg_color}; padding: 8px; border-radius: 6px; color: {color}; font-weight: 600;'>
+            <div style='font-size: 16px;'>ЧСС: {hr_status['value']} уд/хв</div>
+            <div style='font-size: 14px; margin-top: 4px;'>{hr_status['status']}</div>
+            <div style='font-size: 12px; color: #6B7280; margin-top: 4px;'>{hr_status['description']}</div>
+        </div>
+        """
+    
+    def _format_hr_zones(self, metrics):
+        """Текст картки пульсових зон"""
+        hr_zones = metrics['hr_zones']
+        if not hr_zones:
+            return "Введіть дату народження для розрахунку віку"
+        
+        zones_html = []
+        for zone_key in ('recovery', 'fat_burn', 'aerobic', 'anaerobic', 'maximum'):
+            zone = hr_zones[zone_key]
+            color = zone['color']
+            zones_html.append(f"""
+                <div style='margin: 4px 0; padding: 6px; background: {color}20; border-left: 4px solid {color}; border-radius: 4px;'>
+                    <span style='color: {color}; font-weight: 600;'>{zone['name']}</span>
+                    <span style='color: #6B7280; margin-left: 8px;'>{zone['range']} уд/хв ({zone['percentage']})</span>
+                </div>
+            """)
+        
+        return f"""
+        <div style='background: #F8F9FA; padding: 12px; border-radius: 8px;'>
+            <div style='font-size: 16px; font-weight: 600; color: #111827; margin-bottom: 8px;'>
+                Пульсові зони (макс. {hr_zones['max_hr']} уд/хв):
+            </div>
+            {''.join(zones_html)}
+        </div>
+        """
+    
+    def _built_tab(self, key):
+        """Вкладка діалогу, якщо вона вже створена (звернення до атрибута створило б ліниву вкладку)"""
+        return getattr(self.parent_dialog, '_tabs', {}).get(key)
     
     def _get_age(self):
-        """Отримує вік з вкладки основних даних"""
+        """Отримує вік з вкладки основних даних або з даних клієнта"""
         try:
-            if hasattr(self.parent_dialog, 'basic_tab'):
-                birth_date = self.parent_dialog.basic_tab.birth_date_edit.date().toPython()
-                today = date.today()
-                age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
-                return age
+            basic_tab = self._built_tab('basic')
+            if basic_tab is not None:
+                birth_date = basic_tab.birth_date_edit.date().toPython()
+            else:
+                birth_date = date.fromisoformat(str(self.client_data.get('birth_date', ''))[:10])
+            today = date.today()
+            age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+            return age
         except:
             pass
         return None
     
     def _get_gender(self):
-        """Отримує стать з вкладки основних даних"""
+        """Отримує стать з вкладки основних даних або з даних клієнта"""
         try:
-            if hasattr(self.parent_dialog, 'basic_tab'):
-                gender_text = self.parent_dialog.basic_tab.gender_combo.currentText()
-                if "Чоловік" in gender_text:
-                    return "male"
-                elif "Жінка" in gender_text:
-                    return "female"
+            basic_tab = self._built_tab('basic')
+            if basic_tab is not None:
+                gender_text = basic_tab.gender_combo.currentText()
+            else:
+                gender_text = self.client_data.get('gender') or ''
+            if "Чоловік" in gender_text:
+                return "male"
+            elif "Жінка" in gender_text:
+                return "female"
         except:
             pass
         return None
     
     def _get_activity_level(self):
-        """Отримує рівень активності з вкладки способу життя"""
+        """Отримує рівень активності з вкладки способу життя або з даних клієнта"""
         try:
-            if hasattr(self.parent_dialog, 'lifestyle_tab'):
-                activity_text = self.parent_dialog.lifestyle_tab.activity_level_combo.currentText()
-                return activity_text
+            lifestyle_tab = self._built_tab('lifestyle')
+            if lifestyle_tab is not None:
+                return lifestyle_tab.activity_level_combo.currentText()
+            return self.client_data.get('activity_level') or None
         except:
             pass
         return None
@@ -438,344 +566,6 @@ class PhysicalTab(QWidget):
             self.menstrual_cycle_edit.setVisible(False)
             self.menstrual_row[0].setVisible(False)  # Лейбл
     
-    # ===== МЕТОДИ РОЗРАХУНКІВ =====
-    
-    def _calculate_bmi(self, height_cm, weight_kg):
-        """Розрахунок ІМТ"""
-        if height_cm <= 0 or weight_kg <= 0:
-            self.bmi_display.setText("Введіть зріст та вагу")
-            return
-        
-        height_m = height_cm / 100
-        bmi = weight_kg / (height_m ** 2)
-        
-        # Визначення категорії та кольору
-        if bmi < 18.5:
-            category = "Недостатня вага"
-            color = "#EF4444"  # Червоний
-            bg_color = "#FEE2E2"
-        elif 18.5 <= bmi < 25:
-            category = "Норма"
-            color = "#10B981"  # Зелений
-            bg_color = "#D1FAE5"
-        elif 25 <= bmi < 30:
-            category = "Надлишкова вага"
-            color = "#F59E0B"  # Помаранчевий
-            bg_color = "#FEF3C7"
-        else:
-            category = "Ожиріння"
-            color = "#EF4444"  # Червоний
-            bg_color = "#FEE2E2"
-        
-        result_text = f"""
-        <div style='background: {bg_color}; padding: 8px; border-radius: 6px; color: {color}; font-weight: 600;'>
-            <div style='font-size: 16px;'>ІМТ: {bmi:.1f}</div>
-            <div style='font-size: 14px; margin-top: 4px;'>{category}</div>
-        </div>
-        """
-        
-        self.bmi_display.setText(result_text)
-        self.bmi_display.setStyleSheet("QLabel { background: transparent; border: none; }")
-    
-    def _calculate_body_fat(self, height_cm, weight_kg, age, gender):
-        """Розрахунок відсотка жиру за формулою Deurenberg"""
-        if not all([height_cm, weight_kg, age, gender]):
-            self.body_fat_display.setText("Введіть зріст, вагу, вік та стать")
-            return
-        
-        height_m = height_cm / 100
-        bmi = weight_kg / (height_m ** 2)
-        
-        # Формула Deurenberg
-        if gender == "male":
-            body_fat = 1.20 * bmi + 0.23 * age - 16.2
-        else:  # female
-            body_fat = 1.20 * bmi + 0.23 * age - 5.4
-        
-        # Визначення категорії
-        if gender == "male":
-            if body_fat < 6:
-                category = "Дуже низький"
-                color = "#3B82F6"  # Блакитний
-                bg_color = "#DBEAFE"
-            elif body_fat < 14:
-                category = "Низький"
-                color = "#06B6D4"  # Бірюзовий
-                bg_color = "#CFFAFE"
-            elif body_fat < 25:
-                category = "Нормальний"
-                color = "#10B981"  # Зелений
-                bg_color = "#D1FAE5"
-            else:
-                category = "Високий"
-                color = "#EF4444"  # Червоний
-                bg_color = "#FEE2E2"
-        else:  # female
-            if body_fat < 16:
-                category = "Дуже низький"
-                color = "#3B82F6"  # Блакитний
-                bg_color = "#DBEAFE"
-            elif body_fat < 20:
-                category = "Низький"
-                color = "#06B6D4"  # Бірюзовий
-                bg_color = "#CFFAFE"
-            elif body_fat < 30:
-                category = "Нормальний"
-                color = "#10B981"  # Зелений
-                bg_color = "#D1FAE5"
-            else:
-                category = "Високий"
-                color = "#EF4444"  # Червоний
-                bg_color = "#FEE2E2"
-        
-        result_text = f"""
-        <div style='background: {bg_color}; padding: 8px; border-radius: 6px; color: {color}; font-weight: 600;'>
-            <div style='font-size: 16px;'>Жир: {body_fat:.1f}%</div>
-            <div style='font-size: 14px; margin-top: 4px;'>{category}</div>
-        </div>
-        """
-        
-        self.body_fat_display.setText(result_text)
-        self.body_fat_display.setStyleSheet("QLabel { background: transparent; border: none; }")
-    
-    def _calculate_muscle_mass(self, height_cm, weight_kg, age, gender):
-        """Розрахунок м'язової маси за формулою Janssen"""
-        if not all([height_cm, weight_kg, age, gender]):
-            self.muscle_mass_display.setText("Введіть зріст, вагу, вік та стать")
-            return
-        
-        height_m = height_cm / 100
-        
-        # Формула Janssen для скелетної м'язової маси
-        if gender == "male":
-            muscle_mass = (0.407 * weight_kg) + (0.267 * height_cm) - (0.049 * age) + 5.09
-        else:  # female
-            muscle_mass = (0.252 * weight_kg) + (0.473 * height_cm) - (0.048 * age) + 2.83
-        
-        muscle_percentage = (muscle_mass / weight_kg) * 100
-        
-        # Визначення категорії
-        if gender == "male":
-            if muscle_percentage < 37:
-                category = "Низький"
-                color = "#EF4444"  # Червоний
-                bg_color = "#FEE2E2"
-            elif muscle_percentage < 45:
-                category = "Нормальний"
-                color = "#10B981"  # Зелений
-                bg_color = "#D1FAE5"
-            else:
-                category = "Високий"
-                color = "#3B82F6"  # Блакитний
-                bg_color = "#DBEAFE"
-        else:  # female
-            if muscle_percentage < 31:
-                category = "Низький"
-                color = "#EF4444"  # Червоний
-                bg_color = "#FEE2E2"
-            elif muscle_percentage < 36:
-                category = "Нормальний"
-                color = "#10B981"  # Зелений
-                bg_color = "#D1FAE5"
-            else:
-                category = "Високий"
-                color = "#3B82F6"  # Блакитний
-                bg_color = "#DBEAFE"
-        
-        result_text = f"""
-        <div style='background: {bg_color}; padding: 8px; border-radius: 6px; color: {color}; font-weight: 600;'>
-            <div style='font-size: 16px;'>М'язи: {muscle_mass:.1f} кг ({muscle_percentage:.1f}%)</div>
-            <div style='font-size: 14px; margin-top: 4px;'>{category}</div>
-        </div>
-        """
-        
-        self.muscle_mass_display.setText(result_text)
-        self.muscle_mass_display.setStyleSheet("QLabel { background: transparent; border: none; }")
-    
-    def _calculate_body_type(self, height_cm, weight_kg, age, gender):
-        """Визначення типу тілобудови (соматотипу)"""
-        if not all([height_cm, weight_kg, gender]):
-            self.body_type_display.setText("Введіть зріст, вагу та стать")
-            return
-        
-        height_m = height_cm / 100
-        bmi = weight_kg / (height_m ** 2)
-        
-        # Спрощений алгоритм визначення соматотипу на основі ІМТ
-        if bmi < 20:
-            body_type = "Ектоморф"
-            description = "Тонке, худе тіло з вузькими кістками та низьким рівнем жиру. Метаболізм швидкий, важко набирати вагу."
-            color = "#3B82F6"  # Блакитний
-            bg_color = "#DBEAFE"
-        elif bmi < 25:
-            body_type = "Мезоморф"
-            description = "Атлетичне, мускулисте тіло з широкими плечима. Метаболізм середній, легко нарощують м'язи."
-            color = "#10B981"  # Зелений
-            bg_color = "#D1FAE5"
-        else:
-            body_type = "Ендоморф"
-            description = "Широка кісткова структура, схильність до набору жиру. Метаболізм повільний, легко набирають вагу."
-            color = "#F59E0B"  # Помаранчевий
-            bg_color = "#FEF3C7"
-        
-        result_text = f"""
-        <div style='background: {bg_color}; padding: 8px; border-radius: 6px; color: {color}; font-weight: 600;'>
-            <div style='font-size: 16px;'>{body_type}</div>
-            <div style='font-size: 12px; margin-top: 4px; color: #374151; font-weight: normal;'>{description}</div>
-        </div>
-        """
-        
-        self.body_type_display.setText(result_text)
-        self.body_type_display.setStyleSheet("QLabel { background: transparent; border: none; }")
-    
-    def _calculate_bmr(self, height_cm, weight_kg, age, gender):
-        """Розрахунок базального метаболізму за формулою Міффліна-Сан Жеора"""
-        if not all([height_cm, weight_kg, age, gender]):
-            self.bmr_display.setText("Введіть зріст, вагу, вік та стать")
-            return
-        
-        # Формула Міффліна-Сан Жеора
-        if gender == "male":
-            bmr = 10 * weight_kg + 6.25 * height_cm - 5 * age + 5
-        else:  # female
-            bmr = 10 * weight_kg + 6.25 * height_cm - 5 * age - 161
-        
-        result_text = f"""
-        <div style='background: #F3F4F6; padding: 8px; border-radius: 6px; color: #374151; font-weight: 600;'>
-            <div style='font-size: 16px;'>BMR: {bmr:.0f} ккал/день</div>
-            <div style='font-size: 12px; margin-top: 4px; font-weight: normal;'>Мінімальна енергія для життєдіяльності</div>
-        </div>
-        """
-        
-        self.bmr_display.setText(result_text)
-        self.bmr_display.setStyleSheet("QLabel { background: transparent; border: none; }")
-    
-    def _calculate_daily_calories(self, height_cm, weight_kg, age, gender, activity_level):
-        """Розрахунок денної потреби в калоріях"""
-        if not all([height_cm, weight_kg, age, gender]):
-            self.calories_display.setText("Введіть зріст, вагу, вік та стать")
-            return
-        
-        # Розрахунок BMR
-        if gender == "male":
-            bmr = 10 * weight_kg + 6.25 * height_cm - 5 * age + 5
-        else:  # female
-            bmr = 10 * weight_kg + 6.25 * height_cm - 5 * age - 161
-        
-        # Коефіцієнти активності
-        activity_multipliers = {
-            "Мінімальна активність": 1.2,
-            "Легка активність": 1.375,
-            "Помірна активність": 1.55,
-            "Висока активність": 1.725,
-            "Дуже висока активність": 1.9
-        }
-        
-        multiplier = 1.55  # За замовчуванням помірна активність
-        if activity_level and activity_level in activity_multipliers:
-            multiplier = activity_multipliers[activity_level]
-        
-        maintenance_calories = bmr * multiplier
-        cutting_calories = maintenance_calories * 0.8  # -20% для схуднення
-        bulking_calories = maintenance_calories * 1.2   # +20% для набору маси
-        
-        result_text = f"""
-        <div style='background: #F3F4F6; padding: 8px; border-radius: 6px; color: #374151; font-weight: 600;'>
-            <div style='font-size: 14px;'>🎯 Підтримка: {maintenance_calories:.0f} ккал/день</div>
-            <div style='font-size: 14px; margin-top: 2px;'>📉 Схуднення: {cutting_calories:.0f} ккал/день</div>
-            <div style='font-size: 14px; margin-top: 2px;'>📈 Набір маси: {bulking_calories:.0f} ккал/день</div>
-        </div>
-        """
-        
-        self.calories_display.setText(result_text)
-        self.calories_display.setStyleSheet("QLabel { background: transparent; border: none; }")
-    
-    def _calculate_hr_status(self, hr_rest, age):
-        """Визначення статусу ЧСС у спокої"""
-        if not hr_rest:
-            self.hr_status_display.setText("Введіть ЧСС у спокої")
-            return
-        
-        # Визначення статусу ЧСС
-        if hr_rest < 50:
-            status = "❄️ Занадто низький"
-            description = "Може вимагати консультації лікаря"
-            color = "#EF4444"  # Червоний
-            bg_color = "#FEE2E2"
-        elif hr_rest < 60:
-            status = "📉 Низький"
-            description = "Часто у добре тренованих людей"
-            color = "#F59E0B"  # Помаранчевий
-            bg_color = "#FEF3C7"
-        elif hr_rest < 70:
-            status = "✅ Оптимальний"
-            description = "Найкращі показники для здоров'я"
-            color = "#10B981"  # Зелений
-            bg_color = "#D1FAE5"
-        elif hr_rest < 80:
-            status = "👍 Нормальний"
-            description = "Типові показники"
-            color = "#3B82F6"  # Блакитний
-            bg_color = "#DBEAFE"
-        elif hr_rest < 90:
-            status = "📈 Підвищений"
-            description = "Можливо, потрібно більше активності"
-            color = "#F59E0B"  # Помаранчевий
-            bg_color = "#FEF3C7"
-        else:
-            status = "🔥 Високий"
-            description = "Рекомендована консультація лікаря"
-            color = "#EF4444"  # Червоний
-            bg_color = "#FEE2E2"
-        
-        result_text = f"""
-        <div style='background: {bg_color}; padding: 8px; border-radius: 6px; color: {color}; font-weight: 600;'>
-            <div style='font-size: 16px;'>{status}</div>
-            <div style='font-size: 12px; margin-top: 4px; color: #374151; font-weight: normal;'>{description}</div>
-        </div>
-        """
-        
-        self.hr_status_display.setText(result_text)
-        self.hr_status_display.setStyleSheet("QLabel { background: transparent; border: none; }")
-    
-    def _calculate_hr_zones(self, age):
-        """Розрахунок пульсових зон тренувань"""
-        if not age:
-            self.hr_zones_display.setText("Введіть дату народження для розрахунку віку")
-            return
-        
-        max_hr = 220 - age
-        
-        # Зони тренувань (відсотки від максимального пульсу)
-        recovery_min = int(max_hr * 0.5)
-        recovery_max = int(max_hr * 0.6)
-        
-        fat_burn_min = int(max_hr * 0.6)
-        fat_burn_max = int(max_hr * 0.7)
-        
-        aerobic_min = int(max_hr * 0.7)
-        aerobic_max = int(max_hr * 0.8)
-        
-        anaerobic_min = int(max_hr * 0.8)
-        anaerobic_max = int(max_hr * 0.9)
-        
-        max_min = int(max_hr * 0.9)
-        max_max = max_hr
-        
-        result_text = f"""
-        <div style='background: #F3F4F6; padding: 8px; border-radius: 6px; color: #374151; font-weight: 600;'>
-            <div style='font-size: 14px; margin-bottom: 6px;'>🎯 Максимальний пульс: {max_hr} уд/хв</div>
-            <div style='font-size: 12px; color: #10B981;'>😌 ВІДНОВЛЕННЯ: {recovery_min}-{recovery_max} уд/хв</div>
-            <div style='font-size: 12px; color: #F59E0B;'>🔥 ЖИРОСПАЛЮВАННЯ: {fat_burn_min}-{fat_burn_max} уд/хв</div>
-            <div style='font-size: 12px; color: #3B82F6;'>🏃 АЕРОБНА: {aerobic_min}-{aerobic_max} уд/хв</div>
-            <div style='font-size: 12px; color: #8B5CF6;'>⚡ АНАЕРОБНА: {anaerobic_min}-{anaerobic_max} уд/хв</div>
-            <div style='font-size: 12px; color: #EF4444;'>🔥 МАКСИМАЛЬНА: {max_min}-{max_max} уд/хв</div>
-        </div>
-        """
-        
-        self.hr_zones_display.setText(result_text)
-        self.hr_zones_display.setStyleSheet("QLabel { background: transparent; border: none; }")
-    
     # ===== ДОПОМІЖНІ МЕТОДИ =====
     
     def _get_group_style(self):
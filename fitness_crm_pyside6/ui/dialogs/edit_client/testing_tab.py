@@ -1,16 +1,16 @@
 # ui/dialogs/edit_client/testing_tab.py
 """Вкладка тестування клієнта"""
 import os
-import shutil
 from datetime import datetime
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, 
                                QPushButton, QScrollArea, QGridLayout, QLabel, QFileDialog)
-from PySide6.QtCore import Qt
-from qfluentwidgets import MessageBox
+from PySide6.QtCore import Qt, QDate
+from qfluentwidgets import MessageBox, ProgressBar
 from ui.styles import COLORS
 from ui.widgets.testing_card import TestingPhotoCard, TestingTextCard
 from ui.dialogs.testing_photo_info_dialog import TestingPhotoInfoDialog, TestingTextInfoDialog
-from ui.dialogs.photo_compare import PhotoCompareDialog
+from models.media_store import blob_hash
+from utils.photo_import import get_import_loader, prepare_testing_photo
 
 
 class TestingTab(QWidget):
@@ -30,6 +30,11 @@ class TestingTab(QWidget):
         self.testing_photos = []  # Список словників з інформацією про фото
         self.text_blocks = []  # Список текстових блоків
         self.selected_photos = []  # Список вибраних фото для порівняння
+        self._photo_cards = {}  # Шлях фото -> TestingPhotoCard (у порядку testing_photos)
+        self._text_cards = {}  # id(текстового блоку) -> (блок, TestingTextCard)
+        self._import_total = 0  # Файлів у поточному імпорті
+        self._import_done = 0
+        self._import_failed = 0
         self._init_ui()
         self._load_data()
     
@@ -131,6 +136,23 @@ class TestingTab(QWidget):
         stats_layout.addWidget(self.selected_count_label)
         stats_layout.addStretch()
         
+        # Прогрес пакетного імпорту (видно лише під час імпорту)
+        self.import_status_label = QLabel()
+        self.import_status_label.setStyleSheet("""
+            QLabel {
+                font-size: 13px;
+                color: #2563EB;
+                font-weight: 500;
+            }
+        """)
+        self.import_progress = ProgressBar()
+        self.import_progress.setFixedWidth(200)
+        self.import_status_label.hide()
+        self.import_progress.hide()
+        
+        stats_layout.addWidget(self.import_status_label)
+        stats_layout.addWidget(self.import_progress)
+        
         photos_layout.addLayout(stats_layout)
         
         # Область для карток фото
@@ -206,6 +228,7 @@ class TestingTab(QWidget):
         self.text_blocks_layout = QVBoxLayout(self.text_blocks_widget)
         self.text_blocks_layout.setSpacing(10)
         self.text_blocks_layout.setContentsMargins(15, 15, 15, 15)
+        self.text_blocks_layout.addStretch()  # Картки вставляються перед розтягувачем
         
         content_layout.addStretch()
     
@@ -229,18 +252,6 @@ class TestingTab(QWidget):
             }
         """
     
-    def _get_client_testing_folder(self):
-        """Повертає шлях до папки тестування клієнта"""
-        if not self.client_id:
-            return None
-        
-        client_folder = os.path.join("data", "clients", self.client_id)
-        testing_folder = os.path.join(client_folder, "photos", "testing")
-        
-        # Створюємо папку якщо не існує
-        os.makedirs(testing_folder, exist_ok=True)
-        return testing_folder
-    
     def _add_photos(self):
         """Додає фото тестування"""
         file_paths, _ = QFileDialog.getOpenFileNames(
@@ -253,47 +264,73 @@ class TestingTab(QWidget):
         if not file_paths:
             return
         
-        testing_folder = self._get_client_testing_folder()
-        if not testing_folder:
-            MessageBox.warning(
-                title="Помилка",
-                content="Не вдалося створити папку для фото тестування",
-                parent=self
-            )
-            return
+        self._import_photos(file_paths)
+    
+    def _import_photos(self, file_paths):
+        """Пакетний імпорт: копіювання, EXIF та робоча копія готуються в пулі потоків.
         
+        Картки додаються по мірі готовності. Для одного файлу, як і раніше, відкривається
+        діалог з описом (дата вже заповнена з EXIF); для кількох — дата береться з EXIF,
+        а опис можна додати пізніше кнопкою редагування картки.
+        """
+        single = len(file_paths) == 1 and self._import_total == self._import_done
+        if self._import_total == self._import_done:
+            self._import_total = self._import_done = self._import_failed = 0
+        self._import_total += len(file_paths)
+        self._update_import_progress()
+        
+        loader = get_import_loader()
         for file_path in file_paths:
-            # Відкриваємо діалог для введення інформації
-            info_dialog = TestingPhotoInfoDialog(self)
-            if info_dialog.exec() == info_dialog.Accepted:
+            loader.load(
+                lambda path=file_path: prepare_testing_photo(path),
+                lambda result, path=file_path: self._on_photo_prepared(path, result, single),
+                owner=self
+            )
+    
+    def _on_photo_prepared(self, source_path, result, ask_info):
+        """Готове фото з пулу (GUI-потік): нова картка без перебудови сітки"""
+        self._import_done += 1
+        if result is None:
+            self._import_failed += 1
+            print(f"❌ Не вдалося імпортувати фото: {os.path.basename(source_path)}")
+        elif any(p['path'] == result['path'] for p in self.testing_photos):
+            print(f"ℹ️ Фото вже додано до тестування: {result['source']}")
+        else:
+            date_taken = result['date_taken'] or QDate.currentDate().toString("dd.MM.yyyy")
+            description = ""
+            if ask_info:
+                info_dialog = TestingPhotoInfoDialog(self)
+                info_dialog.date_edit.setDate(QDate.fromString(date_taken, "dd.MM.yyyy"))
+                if info_dialog.exec() != info_dialog.Accepted:
+                    self._update_import_progress()
+                    return
                 date_taken, description = info_dialog.get_info()
-                
-                # Копіюємо файл до папки клієнта
-                filename = os.path.basename(file_path)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                new_filename = f"testing_{timestamp}_{filename}"
-                new_path = os.path.join(testing_folder, new_filename)
-                
-                try:
-                    shutil.copy2(file_path, new_path)
-                    
-                    # Додаємо інформацію про фото
-                    photo_info = {
-                        'path': new_path,
-                        'date_taken': date_taken,
-                        'description': description,
-                        'timestamp': timestamp
-                    }
-                    self.testing_photos.append(photo_info)
-                    
-                except Exception as e:
-                    MessageBox.warning(
-                        title="Помилка",
-                        content=f"Не вдалося скопіювати файл: {str(e)}",
-                        parent=self
-                    )
+            
+            photo_info = {
+                'path': result['path'],
+                'date_taken': date_taken,
+                'description': description,
+                'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S")
+            }
+            if result['original_path'] != result['path']:
+                photo_info['original_path'] = result['original_path']
+            self.testing_photos.append(photo_info)
+            self._update_photos_display()
         
-        self._update_photos_display()
+        self._update_import_progress()
+    
+    def _update_import_progress(self):
+        """Показує прогрес імпорту; ховає його, коли всі файли оброблено"""
+        running = self._import_done < self._import_total
+        self.import_status_label.setVisible(running)
+        self.import_progress.setVisible(running)
+        if running:
+            self.import_progress.setRange(0, self._import_total)
+            self.import_progress.setValue(self._import_done)
+            self.import_status_label.setText(f"⏳ Імпорт: {self._import_done}/{self._import_total}")
+        elif self._import_total:
+            print(f"📥 Імпортовано фото тестування: {self._import_total - self._import_failed} "
+                  f"з {self._import_total}")
     
     def _add_text_block(self):
         """Додає текстовий блок"""
@@ -310,62 +347,98 @@ class TestingTab(QWidget):
             self._update_text_blocks_display()
     
     def _update_photos_display(self):
-        """Оновлює відображення фото"""
-        # Очищуємо попередній layout
-        for i in reversed(range(self.photos_grid.count())):
-            item = self.photos_grid.itemAt(i)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.setParent(None)
-        
-        # Додаємо картки фото
-        for i, photo_info in enumerate(self.testing_photos):
-            photo_card = TestingPhotoCard(
-                photo_info['path'],
-                photo_info['date_taken'],
-                photo_info['description']
-            )
-            
-            # Підключаємо сигнали
-            photo_card.selection_changed.connect(self._on_photo_selection_changed)
-            photo_card.delete_requested.connect(self._delete_photo)
-            photo_card.edit_requested.connect(self._edit_photo_info)
-            
-            # Розміщуємо в сітці (3 колонки)
-            row = i // 3
-            col = i % 3
-            self.photos_grid.addWidget(photo_card, row, col)
+        """Узгоджує картки з testing_photos за шляхом фото.
+        
+        Картка створюється лише для нового фото, картка видаленого фото знищується,
+        змінені дата/опис оновлюються через update_info. Решта карток зберігаються
+        (разом з мініатюрою та станом вибору) і лише переставляються в сітці.
+        """
+        previous_cards = self._photo_cards
+        self._photo_cards = {}
+        for photo_info in self.testing_photos:
+            path = photo_info['path']
+            if path in self._photo_cards:
+                continue
+            photo_card = previous_cards.pop(path, None)
+            if photo_card is None:
+                photo_card = self._create_photo_card(photo_info)
+            elif (photo_card.date_taken, photo_card.description) != (photo_info['date_taken'],
+                                                                     photo_info['description']):
+                photo_card.update_info(photo_info['date_taken'], photo_info['description'])
+            self._photo_cards[path] = photo_card
+        
+        # Картки фото, яких більше немає в списку
+        for photo_card in previous_cards.values():
+            self.photos_grid.removeWidget(photo_card)
+            photo_card.deleteLater()
+        
+        # Розміщуємо в сітці (3 колонки); зсуваються лише картки після зміненої позиції
+        for index, photo_card in enumerate(self._photo_cards.values()):
+            position = divmod(index, 3)
+            layout_index = self.photos_grid.indexOf(photo_card)
+            if layout_index >= 0:
+                if self.photos_grid.getItemPosition(layout_index)[:2] == position:
+                    continue
+                self.photos_grid.removeWidget(photo_card)
+            self.photos_grid.addWidget(photo_card, *position)
         
         # Оновлюємо статистику
         self._update_stats()
     
+    def _create_photo_card(self, photo_info):
+        """Створює картку фото з підключеними сигналами"""
+        photo_card = TestingPhotoCard(
+            photo_info['path'],
+            photo_info['date_taken'],
+            photo_info['description']
+        )
+        
+        # Підключаємо сигнали
+        photo_card.selection_changed.connect(self._on_photo_selection_changed)
+        photo_card.delete_requested.connect(self._delete_photo)
+        photo_card.edit_requested.connect(self._edit_photo_info)
+        return photo_card
+    
     def _update_text_blocks_display(self):
-        """Оновлює відображення текстових блоків"""
-        # Очищуємо попередній layout
-        for i in reversed(range(self.text_blocks_layout.count())):
-            item = self.text_blocks_layout.itemAt(i)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.setParent(None)
-        
-        # Додаємо картки текстових блоків
-        for i, text_block in enumerate(self.text_blocks):
-            text_card = TestingTextCard(
-                i,
-                text_block['date_created'],
-                text_block['text_content']
-            )
-            
-            # Підключаємо сигнали
-            text_card.delete_requested.connect(self._delete_text_block)
-            text_card.edit_requested.connect(self._edit_text_block)
-            
-            self.text_blocks_layout.addWidget(text_card)
+        """Узгоджує картки з text_blocks (ключ — сам словник блоку).
         
-        # Додаємо розтягувач в кінці
-        self.text_blocks_layout.addStretch()
+        Як і для фото: нові блоки отримують картку, видалені — прибираються,
+        змінений вміст оновлюється через update_content, решта лише переставляється.
+        """
+        previous_cards = self._text_cards
+        self._text_cards = {}
+        for text_block in self.text_blocks:
+            entry = previous_cards.pop(id(text_block), None)
+            if entry is None or entry[0] is not text_block:
+                text_card = TestingTextCard(
+                    0,
+                    text_block['date_created'],
+                    text_block['text_content']
+                )
+                
+                # Підключаємо сигнали
+                text_card.delete_requested.connect(self._delete_text_block)
+                text_card.edit_requested.connect(self._edit_text_block)
+            else:
+                text_card = entry[1]
+                if (text_card.date_created, text_card.text_content) != (text_block['date_created'],
+                                                                        text_block['text_content']):
+                    text_card.update_content(text_block['date_created'], text_block['text_content'])
+            self._text_cards[id(text_block)] = (text_block, text_card)
+        
+        for _, text_card in previous_cards.values():
+            self.text_blocks_layout.removeWidget(text_card)
+            text_card.deleteLater()
+        
+        # Порядок карток перед розтягувачем; індекс картки — позиція блоку для сигналів
+        for index, (_, text_card) in enumerate(self._text_cards.values()):
+            text_card.index = index
+            layout_index = self.text_blocks_layout.indexOf(text_card)
+            if layout_index == index:
+                continue
+            if layout_index >= 0:
+                self.text_blocks_layout.removeWidget(text_card)
+            self.text_blocks_layout.insertWidget(index, text_card)
     
     def _on_photo_selection_changed(self, selected, photo_path):
         """Обробляє зміну вибору фото"""
@@ -407,7 +480,8 @@ class TestingTab(QWidget):
             )
             return
         
-        # Відкриваємо діалог порівняння
+        # Відкриваємо діалог порівняння (модуль з віджетами корекції фото імпортується лише тут)
+        from ui.dialogs.photo_compare import PhotoCompareDialog
         compare_dialog = PhotoCompareDialog(self.selected_photos, self)
         compare_dialog.exec()
     
@@ -427,9 +501,10 @@ class TestingTab(QWidget):
             if photo_path in self.selected_photos:
                 self.selected_photos.remove(photo_path)
             
-            # Видаляємо файл
+            # Файл сховища видаляється після збереження клієнта, якщо на нього ніхто не посилається;
+            # старі копії в папці клієнта — одразу
             try:
-                if os.path.exists(photo_path):
+                if blob_hash(photo_path) is None and os.path.exists(photo_path):
                     os.remove(photo_path)
             except Exception as e:
                 print(f"Помилка видалення файлу: {e}")
@@ -467,7 +542,10 @@ class TestingTab(QWidget):
             date_taken, description = info_dialog.get_info()
             photo_info['date_taken'] = date_taken
             photo_info['description'] = description
-            self._update_photos_display()
+            # Мініатюра не змінюється — оновлюємо лише підписи картки
+            photo_card = self._photo_cards.get(photo_path)
+            if photo_card is not None:
+                photo_card.update_info(date_taken, description)
     
     def _delete_text_block(self, index):
         """Видаляє текстовий блок"""
@@ -497,7 +575,9 @@ class TestingTab(QWidget):
                 date_created, text_content = info_dialog.get_content()
                 text_block['date_created'] = date_created
                 text_block['text_content'] = text_content
-                self._update_text_blocks_display()
+                entry = self._text_cards.get(id(text_block))
+                if entry is not None:
+                    entry[1].update_content(date_created, text_content)
     
     def _load_data(self):
         """Завантажує дані клієнта"""
@@ -3,9 +3,10 @@
 import os
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QFrame, QScrollArea, QWidget)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtGui import QKeySequence, QShortcut, QPixmap
 from ui.widgets.photo_display import PhotoDisplayWidget, PhotoControlPanel
+from utils.image_loader import decode_image, get_image_loader
 
 
 class PhotoCompareDialog(QDialog):
@@ -17,6 +18,7 @@ class PhotoCompareDialog(QDialog):
         self.photo_widgets = []
         self.control_panels = []
         self._current_drag_index = None
+        self._sync_view = False  # Спільний зум і пан для всіх фото (порівняння постави до/після)
         
         self._init_ui()
         self._load_photos()
@@ -127,8 +129,32 @@ class PhotoCompareDialog(QDialog):
         auto_center_btn.clicked.connect(self._auto_center_all)
         control_layout.addWidget(auto_center_btn)
         
+        # Синхронний зум і пан
+        self.sync_view_btn = QPushButton("🔗 Синхронний зум")
+        self.sync_view_btn.setCheckable(True)
+        self.sync_view_btn.setFixedHeight(40)
+        self.sync_view_btn.setStyleSheet("""
+            QPushButton {
+                background: #374151;
+                color: white;
+                border: none;
+                border-radius: 6px;
+                font-size: 14px;
+                font-weight: 600;
+                padding: 0 20px;
+            }
+            QPushButton:hover {
+                background: #4B5563;
+            }
+            QPushButton:checked {
+                background: #10B981;
+            }
+        """)
+        self.sync_view_btn.toggled.connect(self._set_sync_view)
+        control_layout.addWidget(self.sync_view_btn)
+        
         # Підказка
-        hint_label = QLabel("💡 Підказка: Утримуйте Ctrl і перетягніть фото, щоб поміняти їх місцями • Використовуйте коліщатко миші для зуму • Перетягуйте для переміщення")
+        hint_label = QLabel("💡 Підказка: Утримуйте Ctrl і перетягніть фото, щоб поміняти їх місцями • Використовуйте коліщатко миші для зуму • Перетягуйте для переміщення • Ctrl+L — синхронний зум")
         hint_label.setStyleSheet("""
             QLabel {
                 color: #9CA3AF;
@@ -210,6 +236,9 @@ class PhotoCompareDialog(QDialog):
             photo_widget.setMinimumSize(300, 300)
             photo_widget.drag_started.connect(self._on_drag_started)
             photo_widget.drop_accepted.connect(self._on_drop_accepted)
+            photo_widget.view_changed.connect(
+                lambda widget=photo_widget: self._on_view_changed(widget)
+            )
             photo_frame_layout.addWidget(photo_widget)
             
             # Панель керування фото
@@ -232,6 +261,10 @@ class PhotoCompareDialog(QDialog):
         # Ctrl+A для автоцентрування
         center_shortcut = QShortcut(QKeySequence("Ctrl+A"), self)
         center_shortcut.activated.connect(self._auto_center_all)
+        
+        # Ctrl+L для синхронного зуму
+        sync_shortcut = QShortcut(QKeySequence("Ctrl+L"), self)
+        sync_shortcut.activated.connect(self.sync_view_btn.toggle)
     
     def _on_drag_started(self, index):
         """Обробляє початок перетягування"""
@@ -246,9 +279,10 @@ class PhotoCompareDialog(QDialog):
         self.photo_paths[from_index], self.photo_paths[to_index] = \
             self.photo_paths[to_index], self.photo_paths[from_index]
         
-        # Перезавантажуємо фотографії
-        self.photo_widgets[from_index]._load_image()
-        self.photo_widgets[to_index]._load_image()
+        # Перезавантажуємо фотографії (піраміди вже в спільному кеші — без повторного декодування)
+        for index in (from_index, to_index):
+            self.photo_widgets[index].photo_path = self.photo_paths[index]
+            self.photo_widgets[index]._load_image()
         
         # Автоцентруємо
         self.photo_widgets[from_index]._auto_fit_photo()
@@ -260,7 +294,23 @@ class PhotoCompareDialog(QDialog):
     def _auto_center_all(self):
         """Автоматично центрує всі фотографії"""
         for photo_widget in self.photo_widgets:
-            photo_widget.center_photo()
+            photo_widget._auto_fit_photo()
+    
+    def _set_sync_view(self, enabled):
+        """Вмикає спільний зум і пан; при ввімкненні всі фото вирівнюються по першому"""
+        self._sync_view = enabled
+        if enabled and self.photo_widgets:
+            self._on_view_changed(self.photo_widgets[0])
+    
+    def _on_view_changed(self, source_widget):
+        """Переносить кадр панелі, яку рухає користувач, на решту фото"""
+        if not self._sync_view:
+            return
+        
+        state = source_widget.view_state()
+        for photo_widget in self.photo_widgets:
+            if photo_widget is not source_widget:
+                photo_widget.set_view_state(state)
     
     def closeEvent(self, event):
         """Обробляє закриття діалогу"""
@@ -322,8 +372,6 @@ class PhotoCompareViewer(QWidget):
     
     def _load_photos(self):
         """Завантажує фотографії для перегляду"""
-        from PySide6.QtGui import QPixmap
-        
         for i, photo_path in enumerate(self.photo_paths):
             # Колонка для фото
             photo_column = QWidget()
@@ -360,16 +408,13 @@ class PhotoCompareViewer(QWidget):
             """)
             
             if os.path.exists(photo_path):
-                pixmap = QPixmap(photo_path)
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(
-                        238, 298,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    photo_label.setPixmap(scaled_pixmap)
-                else:
-                    photo_label.setText("📷\nПомилка завантаження")
+                # Декодуємо у фоні одразу в зменшеному розмірі
+                photo_label.setText("📷\nЗавантаження...")
+                get_image_loader().load(
+                    lambda path=photo_path: self._decode_preview(path),
+                    lambda image, label=photo_label: self._on_preview_loaded(label, image),
+                    owner=photo_label
+                )
             else:
                 photo_label.setText("📷\nФото не знайдено")
             
@@ -379,3 +424,24 @@ class PhotoCompareViewer(QWidget):
             self.photos_layout.addWidget(photo_column)
         
         self.photos_layout.addStretch()
+    
+    @staticmethod
+    def _decode_preview(photo_path):
+        """Прев'ю 238x298 (виконується у робочому потоці)"""
+        image = decode_image(photo_path, QSize(238, 298))
+        if image is None:
+            return None
+        return image.scaled(
+            238, 298,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    
+    @staticmethod
+    def _on_preview_loaded(photo_label, image):
+        """Підміняє заглушку готовим прев'ю"""
+        if image is not None:
+            photo_label.setPixmap(QPixmap.fromImage(image))
+        else:
+            photo_label.setText("📷\nПомилка завантаження")
+
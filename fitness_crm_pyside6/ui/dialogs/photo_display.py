@@ -1,8 +1,9 @@
 # ui/dialogs/photo_display.py
 """Віджет для відображення та редагування фото клієнта"""
-from PySide6.QtCore import Signal, QRect, Qt
+from PySide6.QtCore import Signal, QRect, QRectF, Qt
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPixmap, QPainter, QColor, QFont, QPen
+from PySide6.QtGui import QImageReader, QPixmap, QPainter, QColor, QFont, QPen
+from utils.image_pyramid import get_pyramid_cache
 
 
 class PhotoDisplayWidget(QWidget):
@@ -15,7 +16,9 @@ class PhotoDisplayWidget(QWidget):
         
         # Дані фото
         self.photo_path = None
-        self.pixmap = None
+        self._image_size = None  # Розмір оригіналу (QSize) — від нього рахуються масштаб і зміщення
+        self._pyramid = None  # Рівні фото зі спільного кешу (будуються у фоні)
+        self._level_pixmaps = {}  # Рівень піраміди → QPixmap (створюється при першому малюванні рівня)
         self._scale = 1.0  # Поточний масштаб
         self._offset = None  # Зміщення як QPointF
         
@@ -57,19 +60,28 @@ class PhotoDisplayWidget(QWidget):
     def _show_placeholder(self):
         """Показує заглушку коли фото немає"""
         self.photo_path = None
-        self.pixmap = None
+        self._image_size = None
+        self._pyramid = None
+        self._level_pixmaps = {}
         self.update()
     
     def load_photo(self, photo_path):
-        """Завантажує фото за шляхом"""
+        """Завантажує фото за шляхом.
+        
+        Розмір читається із заголовка файлу одразу (масштаб і зміщення готові), а піраміда
+        зменшених рівнів будується у фоні — до її готовності показується заглушка.
+        """
         try:
-            self.photo_path = photo_path
-            self.pixmap = QPixmap(photo_path)
-            
-            if self.pixmap.isNull():
+            size = QImageReader(photo_path).size()
+            if not size.isValid() or size.isEmpty():
                 self._show_placeholder()
                 return False
             
+            self.photo_path = photo_path
+            self._image_size = size
+            self._pyramid = None
+            self._level_pixmaps = {}
+            
             # Скидаємо трансформації тільки якщо не встановлені збережені параметри
             if self._scale == 1.0 and (not self._offset or (self._offset.x() == 0 and self._offset.y() == 0)):
                 # Автоматично підганяємо фото
@@ -86,6 +98,11 @@ class PhotoDisplayWidget(QWidget):
             
             self.update()
             self.photo_changed.emit(photo_path)
+            get_pyramid_cache().request(
+                photo_path,
+                lambda pyramid, error: self._on_pyramid_loaded(photo_path, pyramid, error),
+                owner=self
+            )
             return True
             
         except (OSError, IOError) as e:
@@ -93,13 +110,32 @@ class PhotoDisplayWidget(QWidget):
             self._show_placeholder()
             return False
     
+    def _on_pyramid_loaded(self, photo_path, pyramid, error):
+        """Піраміда готова (з кешу — одразу, інакше з робочого потоку)"""
+        if photo_path != self.photo_path:
+            return  # Тим часом вибрано інше фото
+        if pyramid is None:
+            print(f"Помилка завантаження фото: {error}")
+            self._show_placeholder()
+            return
+        
+        self._pyramid = pyramid
+        self.update()
+    
+    def _level_pixmap(self, level):
+        """QPixmap рівня піраміди (рівні, до яких не дійшов зум, не створюються)"""
+        pixmap = self._level_pixmaps.get(level)
+        if pixmap is None:
+            pixmap = self._level_pixmaps[level] = QPixmap.fromImage(self._pyramid.levels[level])
+        return pixmap
+    
     def _fit_to_widget(self):
         """Підганяє фото під розмір віджета"""
-        if not self.pixmap:
+        if not self._image_size:
             return
         
         widget_rect = self.rect()
-        pixmap_rect = self.pixmap.rect()
+        pixmap_rect = QRect(0, 0, self._image_size.width(), self._image_size.height())
         
         # Обчислюємо масштаб для вміщення
         scale_x = widget_rect.width() / pixmap_rect.width()
@@ -119,26 +155,44 @@ class PhotoDisplayWidget(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         
-        if self.pixmap and not self.pixmap.isNull():
+        if self._pyramid is not None:
             self._draw_photo(painter)
         else:
             self._draw_placeholder(painter)
     
     def _draw_photo(self, painter):
         """Малює фото з трансформаціями"""
-        if not self.pixmap or not self._offset:
+        if self._pyramid is None or not self._offset:
             return
         
         # Обчислюємо розміри та позицію
-        scaled_width = int(self.pixmap.width() * self._scale)
-        scaled_height = int(self.pixmap.height() * self._scale)
+        scaled_width = int(self._image_size.width() * self._scale)
+        scaled_height = int(self._image_size.height() * self._scale)
+        if scaled_width <= 0 or scaled_height <= 0:
+            return
         
         x = int(self._offset.x())
         y = int(self._offset.y())
         
-        # Малюємо фото
-        target_rect = QRect(x, y, scaled_width, scaled_height)
-        painter.drawPixmap(target_rect, self.pixmap)
+        # Малюємо лише видиму частину фото
+        target_rect = QRectF(x, y, scaled_width, scaled_height)
+        visible = target_rect.intersected(QRectF(self.rect()))
+        if visible.isEmpty():
+            return
+        
+        # Найменший рівень піраміди, якого досить для масштабу: згладжування обробляє
+        # не більше ніж удвічі більше пікселів, ніж видно на екрані
+        level = self._pyramid.level_for(self._scale * self.devicePixelRatioF())
+        pixmap = self._level_pixmap(level)
+        ratio_x = pixmap.width() / target_rect.width()
+        ratio_y = pixmap.height() / target_rect.height()
+        source_rect = QRectF(
+            (visible.left() - target_rect.left()) * ratio_x,
+            (visible.top() - target_rect.top()) * ratio_y,
+            visible.width() * ratio_x,
+            visible.height() * ratio_y
+        )
+        painter.drawPixmap(visible, pixmap, source_rect)
     
     def _draw_placeholder(self, painter):
         """Малює заглушку коли фото немає"""
@@ -175,33 +229,34 @@ class PhotoDisplayWidget(QWidget):
     
     def wheelEvent(self, event):
         """Обробка прокрутки миші для зуму"""
-        if not self.pixmap or not self._offset:
+        if not self._image_size or not self._offset:
             return
         
         # Зум
         zoom_factor = 1.1 if event.angleDelta().y() > 0 else 1.0 / 1.1
         
-        # Обмежуємо масштаб
+        # Обмежуємо масштаб (велике фото вписується з масштабом, меншим за min_scale, —
+        # наближення до дозволеного діапазону не блокуємо)
         new_scale = self._scale * zoom_factor
-        if self.min_scale <= new_scale <= self.max_scale:
+        if new_scale <= self.max_scale and (new_scale >= self.min_scale or zoom_factor > 1):
             # Зум до позиції курсора
             mouse_pos = event.position()
             
             # Зберігаємо відносну позицію курсора
-            rel_x = (mouse_pos.x() - self._offset.x()) / (self.pixmap.width() * self._scale)
-            rel_y = (mouse_pos.y() - self._offset.y()) / (self.pixmap.height() * self._scale)
+            rel_x = (mouse_pos.x() - self._offset.x()) / (self._image_size.width() * self._scale)
+            rel_y = (mouse_pos.y() - self._offset.y()) / (self._image_size.height() * self._scale)
             
             self._scale = new_scale
             
             # Коригуємо зміщення
-            self._offset.setX(mouse_pos.x() - (rel_x * self.pixmap.width() * self._scale))
-            self._offset.setY(mouse_pos.y() - (rel_y * self.pixmap.height() * self._scale))
+            self._offset.setX(mouse_pos.x() - (rel_x * self._image_size.width() * self._scale))
+            self._offset.setY(mouse_pos.y() - (rel_y * self._image_size.height() * self._scale))
             
             self.update()
     
     def mousePressEvent(self, event):
         """Початок перетягування"""
-        if event.button() == Qt.MouseButton.LeftButton and self.pixmap and self._offset:
+        if event.button() == Qt.MouseButton.LeftButton and self._image_size and self._offset:
             self.dragging = True
             self.last_pan_point = event.position()
     
@@ -277,11 +332,11 @@ class PhotoDisplayWidget(QWidget):
     
     def _auto_fit_photo(self):
         """Автоматично підганяє фото під віджет"""
-        if not self.pixmap:
+        if not self._image_size:
             return
         
         widget_rect = self.rect()
-        pixmap_rect = self.pixmap.rect()
+        pixmap_rect = QRect(0, 0, self._image_size.width(), self._image_size.height())
         
         # Обчислюємо масштаб для вміщення зі збереженням пропорцій
         scale_x = widget_rect.width() / pixmap_rect.width()
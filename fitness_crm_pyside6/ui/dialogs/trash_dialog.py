@@ -5,10 +5,7 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                QPushButton, QTableWidget, QTableWidgetItem, QHeaderView)
 from PySide6.QtGui import QFont
 from qfluentwidgets import MessageBox, InfoBar, InfoBarPosition, PrimaryPushButton
-import os
-import json
-import shutil
-from datetime import datetime
+from models.client_repository import get_client_repository
 
 
 class TrashDialog(QDialog):
@@ -144,39 +141,22 @@ class TrashDialog(QDialog):
     
     def _load_trash_items(self):
         """Завантажує елементи з корзини"""
-        trash_dir = "data/trash"
-        if not os.path.exists(trash_dir):
-            return
-        
         items = []
         
-        # Перевіряємо папки клієнтів в корзині
-        for item_name in os.listdir(trash_dir):
-            item_path = os.path.join(trash_dir, item_name)
-            if os.path.isdir(item_path):
-                # Це папка клієнта
-                try:
-                    # Шукаємо JSON файл клієнта
-                    json_files = [f for f in os.listdir(item_path) if f.endswith('.json')]
-                    if json_files:
-                        json_path = os.path.join(item_path, json_files[0])
-                        with open(json_path, 'r', encoding='utf-8') as f:
-                            client_data = json.load(f)
-                        
-                        # Отримуємо дату видалення з мітки часу папки
-                        stat = os.stat(item_path)
-                        delete_date = datetime.fromtimestamp(stat.st_mtime).strftime("%d.%m.%Y")
-                        
-                        items.append({
-                            'type': '👤 Клієнт',
-                            'name': client_data.get('full_name', item_name),
-                            'owner': '-',
-                            'delete_date': delete_date,
-                            'path': item_path,
-                            'data': client_data
-                        })
-                except:
-                    continue
+        # Клієнти, позначені в БД як видалені
+        for trashed in get_client_repository().trashed():
+            client_data = trashed['data']
+            deleted_at = trashed['deleted_at']
+            delete_date = deleted_at.strftime("%d.%m.%Y") if deleted_at else '-'
+            
+            items.append({
+                'type': '👤 Клієнт',
+                'name': client_data.get('full_name', trashed['id'][:8]),
+                'owner': '-',
+                'delete_date': delete_date,
+                'id': trashed['id'],
+                'data': client_data
+            })
         
         # Заповнюємо таблицю
         self.table.setRowCount(len(items))
@@ -264,18 +244,8 @@ class TrashDialog(QDialog):
             try:
                 # Відновлюємо клієнта
                 if item['type'] == '👤 Клієнт':
-                    clients_dir = "data/clients"
-                    os.makedirs(clients_dir, exist_ok=True)
-                    
-                    # Переміщуємо JSON файл назад
-                    json_files = [f for f in os.listdir(item['path']) if f.endswith('.json')]
-                    if json_files:
-                        src_path = os.path.join(item['path'], json_files[0])
-                        dst_path = os.path.join(clients_dir, json_files[0])
-                        shutil.move(src_path, dst_path)
-                    
-                    # Видаляємо папку з корзини
-                    shutil.rmtree(item['path'])
+                    # Знімаємо позначку видалення та оновлюємо індекс клієнтів
+                    get_client_repository().restore(item['id'])
                 
                 InfoBar.success(
                     title="Успіх",
@@ -314,7 +284,7 @@ class TrashDialog(QDialog):
         
         if result == 1:  # 1 означає "Так" в QFluentWidgets
             try:
-                shutil.rmtree(item['path'])
+                get_client_repository().delete_permanently(item['id'])
                 
                 InfoBar.success(
                     title="Успіх",
@@ -350,10 +320,7 @@ class TrashDialog(QDialog):
         
         if result == 1:  # 1 означає "Так" в QFluentWidgets
             try:
-                trash_dir = "data/trash"
-                if os.path.exists(trash_dir):
-                    shutil.rmtree(trash_dir)
-                    os.makedirs(trash_dir, exist_ok=True)
+                get_client_repository().clear_trash()
                 
                 InfoBar.success(
                     title="Успіх",
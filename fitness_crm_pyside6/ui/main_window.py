@@ -1,7 +1,7 @@
 # ui/main_window.py
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QVBoxLayout, QWidget, QDialog, QGridLayout, QScrollArea
-from PySide6.QtGui import QResizeEvent
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, QTimer, Signal
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QVBoxLayout, QWidget, QDialog,
+                               QScrollArea, QStackedWidget)
 from qfluentwidgets import (
     FluentWindow, NavigationItemPosition, setTheme, Theme, 
     SearchLineEdit, PrimaryPushButton, SegmentedWidget,
@@ -9,9 +9,13 @@ from qfluentwidgets import (
 )
 from qfluentwidgets import FluentIcon as FIF
 import qtawesome as qta  # Додаємо QtAwesome для іконок
-from ui.widgets.photo_card import PhotoCard
+from ui.widgets.client_grid import ClientListModel, ClientGridView, longest_ordered_subset
 from ui.widgets.list_item import ListItemWidget
 from ui.dialogs.edit_client.main_dialog import EditClientDialog
+from models.client_repository import get_client_repository
+from config import config
+from config.logger import get_db_logger
+from utils.thumbnail_cache import get_thumbnail_cache
 import sys
 
 
@@ -23,25 +27,66 @@ UI_SETTINGS = {
     'max_columns': 5        # Максимальна кількість колонок
 }
 
+# Скільки карток додається в сітку за один прохід циклу подій під час лінивого старту
+STARTUP_BATCH_SIZE = 200
+
+
+class _ClientsReadSignals(QObject):
+    """Живе в GUI-потоці, тому картки з робочого потоку приходять через чергу подій"""
+    finished = Signal(object)  # картки клієнтів або None (помилка)
+
+
+class _ClientsReadTask(QRunnable):
+    """Ініціалізація БД та зчитування карток клієнтів у власному потоці.
+
+    Не в пулі декодування фото: одноразова міграція не забирає потоки мініатюр.
+    """
+    
+    def __init__(self, signals: _ClientsReadSignals):
+        super().__init__()
+        self.signals = signals
+    
+    def run(self):
+        try:
+            clients = get_client_repository().all()
+        except Exception:
+            get_db_logger().exception("❌ Помилка ініціалізації БД або зчитування клієнтів")
+            clients = None
+        self.signals.finished.emit(clients)
+
 
 class ClientsPage(QWidget):
     """Сторінка клієнтів"""
+    
+    clients_loaded = Signal(int)  # Стартове завантаження завершено (кількість клієнтів)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("clientsPage")
-        self.client_cards = []  # Список всіх карток клієнтів
-        self._active_widgets = []  # Активні віджети
+        self.clients = []  # Дані всіх клієнтів у порядку відображення
+        self._list_items = {}  # Кеш елементів списку: id → ListItemWidget
+        self._list_order = []  # ID елементів списку в поточному порядку лейауту
         self.current_view = "grid"  # Поточний режим перегляду: "grid" або "list"
-        
-        # Створюємо таймер для оптимізації resize
-        self.resize_timer = QTimer(self)
-        self.resize_timer.setInterval(100)  # Затримка 100 мс
-        self.resize_timer.setSingleShot(True)
-        self.resize_timer.timeout.connect(self._update_display)
+        self._search_ids = None  # ID знайдених клієнтів за релевантністю (None — без фільтра)
+        self._pending_clients = []  # Зчитані у фоні клієнти, що ще не додані в сітку
+        self._streamed_count = 0  # Скільки зчитаних клієнтів уже додано в self.clients
+        self.is_loaded = False  # Стартове завантаження завершено (clients_loaded вже надіслано)
+        self._reading = False  # Фонове зчитування клієнтів ще триває
+        
+        # Таймер для пошуку під час введення (debounce)
+        self.search_timer = QTimer(self)
+        self.search_timer.setInterval(250)  # Затримка 250 мс
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self._apply_search)
+        
+        # Порційне додавання карток при старті (між порціями вікно встигає перемалюватись)
+        self._stream_timer = QTimer(self)
+        self._stream_timer.setInterval(0)
+        self._stream_timer.timeout.connect(self._append_pending_batch)
         
         self._init_ui()
         self.add_test_clients()
-        
+    
     def _init_ui(self):
         """Ініціалізація інтерфейсу"""
         # Основний layout
@@ -67,6 +112,9 @@ class ClientsPage(QWidget):
         self.search_input.setPlaceholderText("🔍 Пошук клієнтів...")
         self.search_input.setFixedWidth(400)
         self.search_input.setFixedHeight(40)
+        self.search_input.textChanged.connect(lambda: self.search_timer.start())
+        self.search_input.searchSignal.connect(lambda: self._apply_search())
+        self.search_input.clearSignal.connect(lambda: self._apply_search())
         
         # Кнопка додавання
         self.add_btn = PrimaryPushButton("➕ Додати клієнта")
@@ -92,7 +140,16 @@ class ClientsPage(QWidget):
         
         layout.addWidget(control_panel)
         
-        # Створюємо основний контейнер з прокруткою
+        # Сітка карток (модель + делегат: малюються лише видимі картки)
+        self.client_model = ClientListModel(self)
+        self.grid_view = ClientGridView(UI_SETTINGS['card_spacing'])
+        self.grid_view.setModel(self.client_model)
+        self.grid_view.clicked_client.connect(self.open_client)
+        self.grid_view.edit_requested.connect(self.edit_client)
+        self.grid_view.delete_requested.connect(self.delete_client)
+        self.grid_view.swap_requested.connect(self._handle_card_swap)
+        
+        # Створюємо основний контейнер з прокруткою (вид списку)
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setStyleSheet("""
@@ -111,156 +168,219 @@ class ClientsPage(QWidget):
             }
         """)
         
-        # Грід лейаут для карток
-        self.cards_grid_layout = QGridLayout(self.cards_container)
-        self.cards_grid_layout.setSpacing(UI_SETTINGS['card_spacing'])
-        self.cards_grid_layout.setContentsMargins(
+        # Лейаут для елементів списку (stretch в кінці притискає їх догори)
+        self.list_layout = QVBoxLayout(self.cards_container)
+        self.list_layout.setSpacing(UI_SETTINGS['card_spacing'])
+        self.list_layout.setContentsMargins(
             UI_SETTINGS['min_margin'], 
             UI_SETTINGS['min_margin'],
             UI_SETTINGS['min_margin'], 
             UI_SETTINGS['min_margin']
         )
+        self.list_layout.addStretch()
         
         self.scroll_area.setWidget(self.cards_container)
-        layout.addWidget(self.scroll_area)
+        
+        self.view_stack = QStackedWidget()
+        self.view_stack.addWidget(self.grid_view)
+        self.view_stack.addWidget(self.scroll_area)
+        layout.addWidget(self.view_stack)
     
     def add_test_clients(self):
         """Додати тестових клієнтів"""
+        if config.LAZY_STARTUP:
+            # БД ініціалізується та зчитується у фоновому потоці, вікно показується одразу
+            self._read_pool = QThreadPool(self)
+            self._read_pool.setMaxThreadCount(1)
+            self._read_signals = _ClientsReadSignals(self)
+            self._read_signals.finished.connect(self._on_clients_read)
+            self._reading = True
+            self._read_pool.start(_ClientsReadTask(self._read_signals))
+            return
+        
         # Завантажуємо клієнтів з файлів
         self._load_clients_from_files()
         self._update_display()
+        self._finish_loading()
     
-    def _load_clients_from_files(self):
-        """Завантажує клієнтів з JSON файлів"""
-        import os
-        import json
-        
-        clients_dir = "data/clients"
-        if not os.path.exists(clients_dir):
-            print(f"📁 Директорія {clients_dir} не існує")
+    def _finish_loading(self):
+        """Позначає стартове завантаження завершеним"""
+        self.is_loaded = True
+        self.clients_loaded.emit(len(self.clients))
+    
+    def _on_clients_read(self, clients):
+        """Картки зчитано — додаємо їх у сітку порціями"""
+        self._reading = False
+        if self.is_loaded:
+            # Повний список уже завантажено (_load_clients_from_files), порції не потрібні
             return
         
-        # Очищаємо попередні картки
-        self.client_cards.clear()
-        
-        files = os.listdir(clients_dir)
-        print(f"📂 Знайдено файлів в {clients_dir}: {files}")
-        
-        for filename in files:
-            if filename.endswith('.json'):
-                filepath = os.path.join(clients_dir, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        client_data = json.load(f)
-                    
-                    print(f"✅ Завантажено клієнта: {client_data.get('full_name', 'Невідомий')} (ID: {client_data.get('id')})")
-                    
-                    # Створюємо картку клієнта
-                    card = PhotoCard(client_data, self)
-                    card.clicked.connect(lambda cid=client_data.get('id'): self.open_client(cid))
-                    card.edit_requested.connect(lambda cid=client_data.get('id'): self.edit_client(cid))
-                    card.delete_requested.connect(lambda cid=client_data.get('id'): self.delete_client(cid))
-                    card.swap_requested.connect(self._handle_card_swap)
-                    
-                    self.client_cards.append(card)
-                    
-                except Exception as e:
-                    print(f"❌ Помилка завантаження клієнта з файлу {filename}: {e}")
-        
-        print(f"🔢 Загалом завантажено клієнтів: {len(self.client_cards)}")
-    
-    def _update_display(self):
-        """Оновлення відображення карток або списку"""
-        print(f"🔄 Оновлення відображення. Карток для відображення: {len(self.client_cards)}, Режим: {self.current_view}")
+        if clients is None:
+            InfoBar.error(
+                title='Помилка',
+                content="Не вдалося завантажити клієнтів з бази даних",
+                orient=Qt.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP,
+                duration=5000,
+                parent=self
+            )
+            clients = []
         
-        # Очищаємо лейаут
-        self._clear_layout()
+        # Клієнти, додані, поки йшло зчитування, вже є в self.clients
+        known = {client_data.get('id') for client_data in self.clients}
+        self._pending_clients = [client_data for client_data in clients if client_data.get('id') not in known]
+        print(f"🔢 Загалом завантажено клієнтів: {len(clients)}")
+        self._stream_timer.start()
+    
+    def _append_pending_batch(self):
+        """Додає в сітку чергову порцію зчитаних клієнтів"""
+        batch = self._pending_clients[:STARTUP_BATCH_SIZE]
+        del self._pending_clients[:STARTUP_BATCH_SIZE]
+        
+        # Перед клієнтами, доданими вручну під час завантаження (у них найбільші ключі порядку)
+        position = self._streamed_count
+        self._streamed_count += len(batch)
+        self.clients[position:position] = batch
+        get_thumbnail_cache().prefetch((client_data.get('photo_path') for client_data in batch), 'card')
+        
+        if self.current_view == "grid" and self._search_ids is None:
+            self.client_model.insert_clients(position, batch)
+        else:
+            self._update_display()
         
-        # Отримуємо розміри контейнера
-        container_width = self.cards_container.width()
-        if container_width <= 100:  # Захист від некоректних розмірів
-            print(f"⚠️ Контейнер ще не готовий, ширина: {container_width}")
+        if not self._pending_clients:
+            self._stream_timer.stop()
+            self._finish_loading()
+    
+    def _load_clients_from_files(self):
+        """Завантажує клієнтів з репозиторію (файли зчитуються лише один раз)"""
+        self.clients = get_client_repository().all()
+        print(f"🔢 Загалом завантажено клієнтів: {len(self.clients)}")
+        
+        # Повний список замінює порційне додавання або ще не завершене фонове зчитування
+        streaming = self._stream_timer.isActive() or self._reading
+        self._stream_timer.stop()
+        self._pending_clients = []
+        self._streamed_count = len(self.clients)
+        if streaming and not self.is_loaded:
+            self._finish_loading()
+        
+        # Мініатюри фото генеруються у фоні, щоб прокрутка не декодувала оригінали
+        get_thumbnail_cache().prefetch(
+            (client_data.get('photo_path') for client_data in self.clients), 'card')
+    
+    def _apply_search(self):
+        """Фільтрує картки за текстом пошуку (FTS5 з префіксами)"""
+        self.search_timer.stop()
+        self._refresh_search_ids()
+        self._update_display()
+    
+    def _refresh_search_ids(self):
+        """Перераховує результати пошуку для поточного тексту"""
+        text = self.search_input.text().strip()
+        if not text:
+            self._search_ids = None
             return
         
+        results = get_client_repository().search(text)
+        self._search_ids = [client_data['id'] for client_data in results]
+        print(f"🔎 Пошук '{text}': знайдено {len(self._search_ids)}")
+    
+    def _visible_clients(self):
+        """Клієнти для відображення з урахуванням пошуку"""
+        if self._search_ids is None:
+            return self.clients
+        
+        clients_by_id = {client_data.get('id'): client_data for client_data in self.clients}
+        return [clients_by_id[cid] for cid in self._search_ids if cid in clients_by_id]
+    
+    def _update_display(self):
+        """Оновлення відображення карток або списку (змінюється лише те, що відрізняється)"""
+        print(f"🔄 Оновлення відображення. Клієнтів: {len(self.clients)}, Режим: {self.current_view}")
+        
         if self.current_view == "grid":
-            self._display_grid_view(container_width)
+            self.view_stack.setCurrentWidget(self.grid_view)
+            self._display_grid_view()
         else:
-            self._display_list_view(container_width)
-    
-    def _display_grid_view(self, container_width):
-        """Відображення у вигляді сітки карток"""
-        # Розраховуємо кількість колонок
-        total_spacing = UI_SETTINGS['min_margin'] * 2
-        available_width = container_width - total_spacing
-        card_with_spacing = UI_SETTINGS['card_width'] + UI_SETTINGS['card_spacing']
-        columns = max(1, min(available_width // card_with_spacing, UI_SETTINGS['max_columns']))
-        
-        print(f"📐 Розміщення сітки: {columns} колонок, ширина контейнера: {container_width}")
-        
-        # Розставляємо картки
-        for i, card in enumerate(self.client_cards):
-            row = i // columns
-            col = i % columns
-            self.cards_grid_layout.addWidget(card, row, col)
-            self._active_widgets.append(card)
-            print(f"  📍 Картка {i+1}: позиція ({row}, {col}) | Розмір: {card.size()} | Видимість: {card.isVisible()}")
-        
-        # Показуємо всі картки ПІСЛЯ додавання в лейаут
-        for card in self.client_cards:
-            card.show()
-            card.setVisible(True)
-            
-        # Додаємо stretch для вирівнювання
-        self.cards_grid_layout.setColumnStretch(columns, 1)
-        
-    def _display_list_view(self, container_width):
-        """Відображення у вигляді списку"""
-        print(f"📝 Розміщення списку: ширина контейнера: {container_width}")
-        
-        # Створюємо список елементів
-        for i, client_data in enumerate([card.client_data for card in self.client_cards]):
-            # Створюємо елемент списку
-            list_item = ListItemWidget(client_data, self)
-            list_item.clicked.connect(lambda cid=client_data.get('id'): self.open_client(cid))
-            list_item.edit_requested.connect(lambda cid=client_data.get('id'): self.edit_client(cid))
-            list_item.delete_requested.connect(lambda cid=client_data.get('id'): self.delete_client(cid))
-            
-            # Встановлюємо ширину списку на повну ширину контейнера мінус відступи
-            list_item.setMinimumWidth(container_width - UI_SETTINGS['min_margin'] * 2)
+            self.view_stack.setCurrentWidget(self.scroll_area)
+            self._display_list_view()
+    
+    def _display_grid_view(self):
+        """Відображення у вигляді сітки карток (віртуалізовано)"""
+        visible_clients = self._visible_clients()
+        self.client_model.apply_clients(visible_clients)
+        print(f"📐 Сітка: {len(visible_clients)} карток")
+    
+    def _display_list_view(self):
+        """Відображення у вигляді списку: переставляє лише елементи, що змінили позицію"""
+        visible_clients = self._visible_clients()
+        wanted = {client_data.get('id') for client_data in visible_clients}
+        
+        # Прибираємо з лейауту елементи, яких більше немає у списку (віджети лишаються в кеші)
+        for client_id in self._list_order:
+            if client_id not in wanted and client_id in self._list_items:
+                list_item = self._list_items[client_id]
+                self.list_layout.removeWidget(list_item)
+                list_item.hide()
+        order = [client_id for client_id in self._list_order if client_id in wanted]
+        
+        target_rows = {client_data.get('id'): row for row, client_data in enumerate(visible_clients)}
+        stable = longest_ordered_subset(order, target_rows)
+        
+        # Переставляємо лише ті елементи, що порушують порядок, — одразу після попередника
+        moved = 0
+        for i, client_data in enumerate(visible_clients):
+            client_id = client_data.get('id')
+            list_item = self._get_list_item(client_data)
+            if client_id in stable:
+                continue
             
-            # Додаємо в одну колонку (список) - зліва
-            self.cards_grid_layout.addWidget(list_item, i, 0, Qt.AlignLeft | Qt.AlignTop)
+            if client_id in order:
+                order.remove(client_id)
+                self.list_layout.removeWidget(list_item)
+            position = 0
+            if i:
+                previous_id = visible_clients[i - 1].get('id')
+                position = i if order[i - 1:i] == [previous_id] else order.index(previous_id) + 1
+            self.list_layout.insertWidget(position, list_item)
             list_item.show()
-            list_item.setVisible(True)
-            self._active_widgets.append(list_item)
-            
-            print(f"  📝 Список-елемент {i+1}: рядок {i} | Ширина: {list_item.minimumWidth()} | Висота: {list_item.height()}")
-        
-        # НЕ додаємо stretch - список буде зліва        # Показуємо контейнер та скрол
-        self.cards_container.show()
-        self.scroll_area.show()
+            order.insert(position, client_id)
+            moved += 1
         
-        print(f"✅ Відображення оновлено. Активних віджетів: {len(self._active_widgets)}")
+        self._list_order = order
+        print(f"✅ Список оновлено. Елементів: {len(order)}, переставлено: {moved}")
     
-    def _clear_layout(self):
-        """Очищення лейауту"""
-        print(f"🧹 Очищення лейауту. Поточних активних віджетів: {len(self._active_widgets)}")
-        
-        # Видаляємо всі віджети з лейауту
-        while self.cards_grid_layout.count():
-            child = self.cards_grid_layout.takeAt(0)
-            if child.widget():
-                child.widget().setParent(None)
-        
-        # Очищаємо список активних віджетів
-        self._active_widgets.clear()
-        
-        print("✅ Лейаут очищено")
+    def _get_list_item(self, client_data):
+        """Елемент списку з кешу; перестворюється лише при зміні даних клієнта"""
+        client_id = client_data.get('id')
+        list_item = self._list_items.get(client_id)
+        if list_item is not None and list_item.client_data is client_data:
+            return list_item
+        
+        new_item = ListItemWidget(client_data, self.cards_container)
+        new_item.clicked.connect(lambda cid=client_id: self.open_client(cid))
+        new_item.edit_requested.connect(lambda cid=client_id: self.edit_client(cid))
+        new_item.delete_requested.connect(lambda cid=client_id: self.delete_client(cid))
+        new_item.hide()
+        
+        if list_item is not None:
+            # Замінюємо застарілий елемент на тому ж місці
+            index = self.list_layout.indexOf(list_item)
+            if index >= 0:
+                self.list_layout.insertWidget(index, new_item)
+                new_item.show()
+            self._drop_list_item(client_id)
+        
+        self._list_items[client_id] = new_item
+        return new_item
     
-    def resizeEvent(self, event: QResizeEvent):
-        """Обробка зміни розміру вікна"""
-        super().resizeEvent(event)
-        self.resize_timer.start()  # Перезапускаємо таймер
+    def _drop_list_item(self, client_id: str):
+        """Видаляє елемент списку з лейауту та кешу"""
+        list_item = self._list_items.pop(client_id, None)
+        if list_item is not None:
+            self.list_layout.removeWidget(list_item)
+            list_item.deleteLater()
     
     def _switch_to_grid_view(self):
         """Перемикання на вид сітки"""
@@ -297,14 +417,57 @@ class ClientsPage(QWidget):
     
     def _add_client_card(self, client_data):
         """Додати нову картку клієнта"""
-        card = PhotoCard(client_data, self)
-        card.clicked.connect(lambda: self.open_client(client_data.get('id')))
-        card.edit_requested.connect(lambda: self.edit_client(client_data.get('id')))
-        card.delete_requested.connect(lambda: self.delete_client(client_data.get('id')))
-        card.swap_requested.connect(self._handle_card_swap)
+        self.clients.append(client_data)
+        if self._search_ids is not None:
+            self._refresh_search_ids()
+        self._update_display()
+    
+    def update_client(self, client_data):
+        """Оновлює дані клієнта на картці (без перебудови сітки)"""
+        client_id = client_data.get('id')
+        for i, existing in enumerate(self.clients):
+            if existing.get('id') == client_id:
+                self.clients[i] = client_data
+                break
+        
+        # Результати пошуку могли змінитися після редагування
+        if self._search_ids is not None:
+            self._refresh_search_ids()
+        self._update_display()
+    
+    def remove_client(self, client_id: str):
+        """Прибирає картку клієнта з інтерфейсу"""
+        self.clients = [client_data for client_data in self.clients if client_data.get('id') != client_id]
+        if self._search_ids is not None:
+            self._search_ids = [cid for cid in self._search_ids if cid != client_id]
+        
+        self._drop_list_item(client_id)
+        if client_id in self._list_order:
+            self._list_order.remove(client_id)
+        self._update_display()
+    
+    def move_client(self, source_id: str, target_id: str) -> bool:
+        """Переносить клієнта на місце цільової картки. False — когось не знайдено
+        
+        У БД змінюється лише ключ перенесеного клієнта, у сітці переміщується один рядок.
+        """
+        ids = [client_data.get('id') for client_data in self.clients]
+        if source_id not in ids or target_id not in ids:
+            return False
+        
+        # Після вилучення джерела вставка за старим індексом цілі ставить його
+        # перед ціллю (перенесення вгору) або після неї (перенесення вниз)
+        target_index = ids.index(target_id)
+        client_data = self.clients.pop(ids.index(source_id))
+        self.clients.insert(target_index, client_data)
+        
+        after_id = self.clients[target_index - 1].get('id') if target_index > 0 else None
+        before_id = self.clients[target_index + 1].get('id') if target_index + 1 < len(self.clients) else None
+        get_client_repository().move(source_id, after_id, before_id)
         
-        self.client_cards.append(card)
+        # Порядок результатів пошуку визначається релевантністю
         self._update_display()
+        return True
     
     def add_client(self):
         """Додати нового клієнта"""
@@ -361,7 +524,7 @@ class ClientsPage(QWidget):
         main_window = self.parent()
         while main_window and not hasattr(main_window, 'delete_client'):
             main_window = main_window.parent()
-            
+        
         if main_window and hasattr(main_window, 'delete_client'):
             main_window.delete_client(client_id)
     
@@ -371,7 +534,7 @@ class ClientsPage(QWidget):
         main_window = self.parent()
         while main_window and not hasattr(main_window, '_handle_card_swap'):
             main_window = main_window.parent()
-            
+        
         if main_window and hasattr(main_window, '_handle_card_swap'):
             main_window._handle_card_swap(source_id, target_id)
 
@@ -526,11 +689,10 @@ class MainWindow(FluentWindow):
         # Отримуємо сторінку клієнтів
         clients_page = self.stackedWidget.widget(0)  # Перша сторінка - це сторінка клієнтів
         
-        if hasattr(clients_page, 'client_cards'):
+        if hasattr(clients_page, 'clients'):
             # Перезавантажуємо всіх клієнтів
-            clients_page.client_cards.clear()
             clients_page._load_clients_from_files()
-            clients_page._update_display()
+            clients_page._apply_search()
         
         InfoBar.success(
             title='Оновлено',
@@ -541,29 +703,12 @@ class MainWindow(FluentWindow):
             duration=2000,
             parent=self
         )
-
+    
     def edit_client(self, client_id: str):
         """Редагувати клієнта"""
         try:
-            import os
-            import json
-            
-            # Знайдемо дані клієнта по ID
-            client_data = None
-            clients_dir = "data/clients"
-            
-            if os.path.exists(clients_dir):
-                for filename in os.listdir(clients_dir):
-                    if filename.endswith('.json'):
-                        filepath = os.path.join(clients_dir, filename)
-                        try:
-                            with open(filepath, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            if data.get('id') == client_id:
-                                client_data = data
-                                break
-                        except Exception:
-                            continue
+            # Знайдемо дані клієнта по ID в індексі репозиторію
+            client_data = get_client_repository().get(client_id)
             
             if not client_data:
                 InfoBar.error(
@@ -584,7 +729,7 @@ class MainWindow(FluentWindow):
             if dialog.exec() == QDialog.Accepted:
                 # Діалог закрито з результатом "Прийнято"
                 pass
-                
+        
         except Exception as e:
             InfoBar.error(
                 title='Помилка',
@@ -601,17 +746,9 @@ class MainWindow(FluentWindow):
         # Отримуємо сторінку клієнтів
         clients_page = self.stackedWidget.widget(0)  # Перша сторінка - це сторінка клієнтів
         
-        if hasattr(clients_page, 'client_cards'):
-            # Знайдемо картку клієнта і оновимо її
-            client_id = client_data.get('id')
-            for card in clients_page.client_cards:
-                if hasattr(card, 'client_data') and card.client_data.get('id') == client_id:
-                    # Оновлюємо дані картки
-                    card.client_data = client_data
-                    # Повністю перезавантажуємо картку з новими даними
-                    if hasattr(card, 'updateCardData'):
-                        card.updateCardData(client_data)
-                    break
+        if hasattr(clients_page, 'update_client'):
+            # Оновлюємо лише картку цього клієнта
+            clients_page.update_client(client_data)
         
         InfoBar.success(
             title='Збережено',
@@ -622,34 +759,15 @@ class MainWindow(FluentWindow):
             duration=2000,
             parent=self
         )
-
+    
     def delete_client(self, client_id: str):
         """Видалити клієнта"""
         try:
-            import os
-            import json
-            import shutil
-            from datetime import datetime
             from qfluentwidgets import MessageBox
             
-            # Знайдемо дані клієнта
-            client_data = None
-            clients_dir = "data/clients"
-            filepath = None
-            
-            if os.path.exists(clients_dir):
-                for filename in os.listdir(clients_dir):
-                    if filename.endswith('.json'):
-                        temp_filepath = os.path.join(clients_dir, filename)
-                        try:
-                            with open(temp_filepath, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            if data.get('id') == client_id:
-                                client_data = data
-                                filepath = temp_filepath
-                                break
-                        except Exception:
-                            continue
+            # Знайдемо дані клієнта в індексі репозиторію
+            repository = get_client_repository()
+            client_data = repository.get(client_id)
             
             if not client_data:
                 InfoBar.error(
@@ -676,36 +794,12 @@ class MainWindow(FluentWindow):
             
             if result == 1:  # 1 означає "Так" в QFluentWidgets
                 # Переміщуємо клієнта в корзину
-                if filepath and os.path.exists(filepath):
-                    # Створюємо папку корзини
-                    trash_dir = "data/trash"
-                    os.makedirs(trash_dir, exist_ok=True)
-                    
-                    # Створюємо унікальну папку для клієнта в корзині
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    safe_name = "".join(c for c in display_name if c.isalnum() or c in ' -_').strip().replace(' ', '_')[:20]
-                    client_trash_dir = os.path.join(trash_dir, f"{safe_name}_{timestamp}")
-                    os.makedirs(client_trash_dir, exist_ok=True)
-                    
-                    # Переміщуємо JSON файл
-                    filename = os.path.basename(filepath)
-                    trash_filepath = os.path.join(client_trash_dir, filename)
-                    shutil.move(filepath, trash_filepath)
+                repository.move_to_trash(client_id)
                 
                 # Видаляємо картку з інтерфейсу
                 clients_page = self.stackedWidget.widget(0)
-                if hasattr(clients_page, 'client_cards'):
-                    for i, card in enumerate(clients_page.client_cards):
-                        if card.client_data.get('id') == client_id:
-                            # Видаляємо з лейауту
-                            clients_page.cards_grid_layout.removeWidget(card)
-                            card.setParent(None)
-                            # Видаляємо зі списку
-                            clients_page.client_cards.pop(i)
-                            break
-                    
-                    # Оновлюємо розкладку
-                    clients_page._update_display()
+                if hasattr(clients_page, 'remove_client'):
+                    clients_page.remove_client(client_id)
                 
                 InfoBar.success(
                     title='Успіх',
@@ -716,7 +810,7 @@ class MainWindow(FluentWindow):
                     duration=3000,
                     parent=self
                 )
-                
+        
         except Exception as e:
             InfoBar.error(
                 title='Помилка',
@@ -727,30 +821,13 @@ class MainWindow(FluentWindow):
                 duration=3000,
                 parent=self
             )
-
+    
     def _handle_card_swap(self, source_id: str, target_id: str):
         """Обробляє зміну порядку карток"""
         try:
             clients_page = self.stackedWidget.widget(0)
-            if hasattr(clients_page, 'client_cards'):
-                # Знаходимо індекси карток
-                source_index = -1
-                target_index = -1
-                
-                for i, card in enumerate(clients_page.client_cards):
-                    if card.client_data.get('id') == source_id:
-                        source_index = i
-                    elif card.client_data.get('id') == target_id:
-                        target_index = i
-                
-                if source_index != -1 and target_index != -1:
-                    # Міняємо місцями картки в списку
-                    clients_page.client_cards[source_index], clients_page.client_cards[target_index] = \
-                        clients_page.client_cards[target_index], clients_page.client_cards[source_index]
-                    
-                    # Оновлюємо розкладку
-                    clients_page._update_display()
-                    
+            if hasattr(clients_page, 'move_client'):
+                if clients_page.move_client(source_id, target_id):
                     InfoBar.success(
                         title='Успіх',
                         content="Порядок клієнтів змінено",
@@ -760,7 +837,7 @@ class MainWindow(FluentWindow):
                         duration=2000,
                         parent=self
                     )
-                    
+        
         except Exception as e:
             InfoBar.error(
                 title='Помилка',
@@ -11,6 +11,7 @@ from qfluentwidgets import (
 from qfluentwidgets import FluentIcon as FIF
 from ui.widgets.photo_card import PhotoCard
 from ui.dialogs.edit_client.main_dialog import EditClientDialog
+from models.client_repository import get_client_repository
 import sys
 
 
@@ -119,34 +120,18 @@ class ClientsPage(QWidget):
         self._update_display()
     
     def _load_clients_from_files(self):
-        """Завантажує клієнтів з JSON файлів"""
-        import os
-        import json
-        
-        clients_dir = "data/clients"
-        if not os.path.exists(clients_dir):
-            return
-        
+        """Завантажує клієнтів з репозиторію (файли зчитуються лише один раз)"""
         self.client_cards = []
         
-        for filename in os.listdir(clients_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(clients_dir, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        client_data = json.load(f)
-                    
-                    # Створюємо картку клієнта
-                    card = PhotoCard(client_data, self)
-                    card.clicked.connect(lambda cid=client_data.get('id'): self.open_client(cid))
-                    card.edit_requested.connect(lambda cid=client_data.get('id'): self.edit_client(cid))
-                    card.delete_requested.connect(lambda cid=client_data.get('id'): self.delete_client(cid))
-                    card.swap_requested.connect(self._handle_card_swap)
-                    
-                    self.client_cards.append(card)
-                    
-                except Exception as e:
-                    print(f"Помилка завантаження клієнта з файлу {filename}: {e}")
+        for client_data in get_client_repository().all():
+            # Створюємо картку клієнта
+            card = PhotoCard(client_data, self)
+            card.clicked.connect(lambda cid=client_data.get('id'): self.open_client(cid))
+            card.edit_requested.connect(lambda cid=client_data.get('id'): self.edit_client(cid))
+            card.delete_requested.connect(lambda cid=client_data.get('id'): self.delete_client(cid))
+            card.swap_requested.connect(self._handle_card_swap)
+            
+            self.client_cards.append(card)
     
     def _update_display(self):
         """Оновлення відображення карток"""
@@ -402,25 +387,8 @@ class MainWindow(FluentWindow):
     def edit_client(self, client_id: str):
         """Редагувати клієнта"""
         try:
-            import os
-            import json
-            
-            # Знайдемо дані клієнта по ID
-            client_data = None
-            clients_dir = "data/clients"
-            
-            if os.path.exists(clients_dir):
-                for filename in os.listdir(clients_dir):
-                    if filename.endswith('.json'):
-                        filepath = os.path.join(clients_dir, filename)
-                        try:
-                            with open(filepath, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            if data.get('id') == client_id:
-                                client_data = data
-                                break
-                        except Exception:
-                            continue
+            # Знайдемо дані клієнта по ID в індексі репозиторію
+            client_data = get_client_repository().get(client_id)
             
             if not client_data:
                 InfoBar.error(
@@ -483,30 +451,11 @@ class MainWindow(FluentWindow):
     def delete_client(self, client_id: str):
         """Видалити клієнта"""
         try:
-            import os
-            import json
-            import shutil
-            from datetime import datetime
             from qfluentwidgets import MessageBox
             
-            # Знайдемо дані клієнта
-            client_data = None
-            clients_dir = "data/clients"
-            filepath = None
-            
-            if os.path.exists(clients_dir):
-                for filename in os.listdir(clients_dir):
-                    if filename.endswith('.json'):
-                        temp_filepath = os.path.join(clients_dir, filename)
-                        try:
-                            with open(temp_filepath, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            if data.get('id') == client_id:
-                                client_data = data
-                                filepath = temp_filepath
-                                break
-                        except Exception:
-                            continue
+            # Знайдемо дані клієнта в індексі репозиторію
+            repository = get_client_repository()
+            client_data = repository.get(client_id)
             
             if not client_data:
                 InfoBar.error(
@@ -533,21 +482,7 @@ class MainWindow(FluentWindow):
             
             if result == 1:  # 1 означає "Так" в QFluentWidgets
                 # Переміщуємо клієнта в корзину
-                if filepath and os.path.exists(filepath):
-                    # Створюємо папку корзини
-                    trash_dir = "data/trash"
-                    os.makedirs(trash_dir, exist_ok=True)
-                    
-                    # Створюємо унікальну папку для клієнта в корзині
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    safe_name = "".join(c for c in display_name if c.isalnum() or c in ' -_').strip().replace(' ', '_')[:20]
-                    client_trash_dir = os.path.join(trash_dir, f"{safe_name}_{timestamp}")
-                    os.makedirs(client_trash_dir, exist_ok=True)
-                    
-                    # Переміщуємо JSON файл
-                    filename = os.path.basename(filepath)
-                    trash_filepath = os.path.join(client_trash_dir, filename)
-                    shutil.move(filepath, trash_filepath)
+                repository.move_to_trash(client_id)
                 
                 # Видаляємо картку з інтерфейсу
                 clients_page = self.stackedWidget.widget(0)
@@ -0,0 +1,146 @@
+# ui/widgets/card_shadow.py
+"""Кешовані тіні карток: nine-patch замість QGraphicsDropShadowEffect.
+
+Тінь для кожного стану (спокій / наведення) розмиваємо лише один раз у маленьку
+заготовку, а в paintEvent картки вона розтягується дев'ятьма шматками —
+без рендеру картки в окремий буфер та розмиття на кожну перемальовку.
+"""
+import math
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import QMargins, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+
+from utils.image_processor import array_to_qimage
+
+
+# Перемикач для порівняння з QGraphicsDropShadowEffect (benchmarks/bench_card_shadows.py)
+USE_CACHED_SHADOWS = True
+
+
+class ShadowSpec(NamedTuple):
+    """Параметри тіні — ті самі, що задавались QGraphicsDropShadowEffect"""
+    blur: int      # радіус розмиття, px
+    offset_y: int  # зсув вниз, px
+    alpha: int     # непрозорість кольору тіні (0-255)
+    radius: int    # радіус заокруглення картки, px
+
+
+CARD_SHADOW = ShadowSpec(blur=25, offset_y=6, alpha=40, radius=16)
+CARD_SHADOW_HOVER = ShadowSpec(blur=30, offset_y=8, alpha=40, radius=16)
+
+
+def shadow_margins(*specs: ShadowSpec) -> QMargins:
+    """Скільки місця навколо картки потрібно, щоб тінь (будь-яка з specs) не обрізалась"""
+    left = top = bottom = 0
+    for spec in specs:
+        left = max(left, spec.blur)
+        top = max(top, spec.blur - spec.offset_y)
+        bottom = max(bottom, spec.blur + spec.offset_y)
+    return QMargins(left, top, left, bottom)
+
+
+def _blur_kernel(blur: int) -> np.ndarray:
+    """Гаусове ядро, що згасає на відстані blur (≈ 3σ)"""
+    sigma = max(blur / 3.0, 0.5)
+    x = np.arange(-blur, blur + 1, dtype=np.float32)
+    kernel = np.exp(-(x * x) / (2 * sigma * sigma))
+    return kernel / kernel.sum()
+
+
+class CardShadowRenderer:
+    """Спільний рендерер тіней: одна заготовка nine-patch на (параметри, масштаб екрана)"""
+    
+    def __init__(self):
+        self._tiles: Dict[Tuple[ShadowSpec, float], Tuple[QPixmap, int]] = {}
+    
+    def tile(self, spec: ShadowSpec, device_ratio: float = 1.0) -> Tuple[QPixmap, int]:
+        """Заготовка тіні та розмір її кута (у логічних px).
+        
+        Заготовка — тінь квадратної картки, у якої між заокругленнями лишається
+        рівна ділянка ширшою за розмиття, тож середній рядок/стовпець можна
+        розтягувати на будь-яку довжину без спотворень.
+        """
+        key = (spec, device_ratio)
+        cached = self._tiles.get(key)
+        if cached is not None:
+            return cached
+        
+        corner = 2 * spec.blur + spec.radius
+        side = 2 * corner + 1
+        pixel_side = math.ceil(side * device_ratio)
+        
+        # Маска картки: біле заокруглене тіло на прозорому фоні
+        mask = QImage(pixel_side, pixel_side, QImage.Format.Format_Grayscale8)
+        mask.fill(0)
+        painter = QPainter(mask)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.scale(device_ratio, device_ratio)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(255, 255, 255))
+        body = QRectF(spec.blur, spec.blur, side - 2 * spec.blur, side - 2 * spec.blur)
+        painter.drawRoundedRect(body, spec.radius, spec.radius)
+        painter.end()
+        
+        # Розділюване розмиття: спершу рядки, потім стовпці
+        alpha = np.frombuffer(mask.constBits(), dtype=np.uint8).reshape(
+            pixel_side, mask.bytesPerLine())[:, :pixel_side].astype(np.float32)
+        kernel = _blur_kernel(max(1, round(spec.blur * device_ratio)))
+        alpha = np.apply_along_axis(np.convolve, 1, alpha, kernel, 'same')
+        alpha = np.apply_along_axis(np.convolve, 0, alpha, kernel, 'same')
+        alpha *= spec.alpha / 255.0
+        
+        # Чорна тінь з розмитою прозорістю
+        pixels = np.zeros((pixel_side, pixel_side, 4), dtype=np.uint8)
+        pixels[..., 3] = np.clip(alpha + 0.5, 0, 255)
+        pixmap = QPixmap.fromImage(array_to_qimage(pixels))
+        pixmap.setDevicePixelRatio(device_ratio)
+        
+        self._tiles[key] = (pixmap, corner)
+        return pixmap, corner
+    
+    def paint(self, painter: QPainter, body_rect: QRect, spec: ShadowSpec):
+        """Малює тінь під тілом картки body_rect (саме тіло малює картка)"""
+        device = painter.device()
+        device_ratio = device.devicePixelRatioF() if device is not None else 1.0
+        pixmap, corner = self.tile(spec, device_ratio)
+        
+        target = QRectF(body_rect).translated(0, spec.offset_y).adjusted(
+            -spec.blur, -spec.blur, spec.blur, spec.blur)
+        # Для дуже малих карток кути зменшуються, щоб не перекриватись
+        corner_w = min(corner, target.width() / 2)
+        corner_h = min(corner, target.height() / 2)
+        side = 2 * corner + 1
+        
+        # Межі шматків: кут | розтягнута середина (1 px заготовки) | кут
+        src_x = (0, corner, corner + 1, side)
+        src_y = src_x
+        dst_x = (target.left(), target.left() + corner_w, target.right() - corner_w, target.right())
+        dst_y = (target.top(), target.top() + corner_h, target.bottom() - corner_h, target.bottom())
+        
+        for row in range(3):
+            for col in range(3):
+                source = QRectF(src_x[col] * device_ratio, src_y[row] * device_ratio,
+                                (src_x[col + 1] - src_x[col]) * device_ratio,
+                                (src_y[row + 1] - src_y[row]) * device_ratio)
+                dest = QRectF(dst_x[col], dst_y[row],
+                              dst_x[col + 1] - dst_x[col], dst_y[row + 1] - dst_y[row])
+                if dest.width() > 0 and dest.height() > 0:
+                    painter.drawPixmap(dest, pixmap, source)
+    
+    def clear(self):
+        """Скидає заготовки (наприклад, після зміни теми)"""
+        self._tiles.clear()
+
+
+# Глобальний рендерер
+_shadow_renderer: Optional[CardShadowRenderer] = None
+
+
+def get_shadow_renderer() -> CardShadowRenderer:
+    """Спільний рендерер тіней карток"""
+    global _shadow_renderer
+    if _shadow_renderer is None:
+        _shadow_renderer = CardShadowRenderer()
+    return _shadow_renderer
@@ -0,0 +1,425 @@
+# ui/widgets/client_grid.py
+"""Віртуалізована сітка клієнтів: модель + делегат + QListView"""
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import (Qt, Signal, QAbstractListModel, QModelIndex, QPersistentModelIndex,
+                            QRect, QSize, QEvent)
+from PySide6.QtGui import QPainter, QPixmap, QColor, QFont, QPen, QPainterPath
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView, QFrame
+
+from ui.styles import COLORS
+from ui.widgets.photo_card import PhotoCard, create_photo_placeholder
+from utils.image_loader import get_image_loader
+from utils.thumbnail_cache import get_thumbnail_cache
+
+
+# Ролі моделі
+ClientIdRole = Qt.UserRole + 1
+ClientDataRole = Qt.UserRole + 2
+
+# Розмір картки та положення секцій мають збігатися з розкладкою PhotoCard
+CARD_SIZE = QSize(320, 620)
+PHOTO_RECT = QRect(25, 15, 270, 350)
+NAME_RECT = QRect(25, 371, 270, 48)
+PHONE_RECT = QRect(25, 431, 270, 42)
+BUTTONS_TOP = 493
+BUTTON_STEP = 40
+
+# Скільки вставок/видалень/переміщень модель застосовує поштучно, перш ніж просто скинутись
+MAX_INCREMENTAL_CHANGES = 64
+
+
+def client_display_name(client_data: dict) -> str:
+    """Повне ім'я клієнта для картки"""
+    first_name = client_data.get('first_name', '')
+    surname = client_data.get('surname', '')
+    return f"{first_name} {surname}".strip() or 'Без імені'
+
+
+class ClientListModel(QAbstractListModel):
+    """Модель списку клієнтів (дані — словники з репозиторію)"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._clients: List[dict] = []
+        self._rows: Dict[str, int] = {}  # id → номер рядка
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._clients)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._clients):
+            return None
+        
+        client_data = self._clients[index.row()]
+        if role == Qt.DisplayRole:
+            return client_display_name(client_data)
+        if role == ClientIdRole:
+            return client_data.get('id')
+        if role == ClientDataRole:
+            return client_data
+        if role == Qt.SizeHintRole:
+            return CARD_SIZE
+        return None
+    
+    def set_clients(self, clients: List[dict]):
+        """Повністю замінює список клієнтів"""
+        self.beginResetModel()
+        self._clients = list(clients)
+        self._reindex()
+        self.endResetModel()
+    
+    def apply_clients(self, clients: List[dict]):
+        """Приводить модель до нового списку мінімальними змінами (видалення, вставки, переміщення)"""
+        wanted = {client_data.get('id'): row for row, client_data in enumerate(clients)}
+        kept = [client_data.get('id') for client_data in self._clients if client_data.get('id') in wanted]
+        stable = longest_ordered_subset(kept, wanted)
+        
+        # Масові зміни (перше завантаження, скидання пошуку) дешевше зробити одним скиданням
+        changes = len(self._clients) - len(kept) + len(clients) - len(stable)
+        if changes > MAX_INCREMENTAL_CHANGES:
+            self.set_clients(clients)
+            return
+        
+        # Видаляємо відсутніх (з кінця, щоб не зсувати індекси)
+        for row in range(len(self._clients) - 1, -1, -1):
+            if self._clients[row].get('id') not in wanted:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._clients[row]
+                self.endRemoveRows()
+        self._reindex()
+        
+        # Вставляємо нові та переносимо ті, що не входять у найдовшу впорядковану підпослідовність:
+        # кожен ставиться одразу після свого попередника в новому порядку
+        for target_row, client_data in enumerate(clients):
+            client_id = client_data.get('id')
+            if client_id in stable:
+                continue
+            
+            after = self._rows[clients[target_row - 1].get('id')] + 1 if target_row else 0
+            source_row = self._rows.get(client_id, -1)
+            if source_row < 0:
+                self.beginInsertRows(QModelIndex(), after, after)
+                self._clients.insert(after, client_data)
+                self.endInsertRows()
+            elif source_row != after:
+                self.beginMoveRows(QModelIndex(), source_row, source_row, QModelIndex(), after)
+                del self._clients[source_row]
+                self._clients.insert(after if after < source_row else after - 1, client_data)
+                self.endMoveRows()
+            self._reindex()
+        
+        # Оновлюємо дані, що змінилися на місці
+        for row, client_data in enumerate(clients):
+            if self._clients[row] is not client_data:
+                self._clients[row] = client_data
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+    
+    def insert_clients(self, row: int, clients: List[dict]):
+        """Вставляє блок клієнтів одним сигналом (порційне завантаження при старті)"""
+        if not clients:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(clients) - 1)
+        self._clients[row:row] = clients
+        self._reindex()
+        self.endInsertRows()
+    
+    def clients(self) -> List[dict]:
+        """Клієнти в порядку відображення"""
+        return list(self._clients)
+    
+    def client_at(self, row: int) -> Optional[dict]:
+        """Клієнт у рядку"""
+        if 0 <= row < len(self._clients):
+            return self._clients[row]
+        return None
+    
+    def row_of(self, client_id: str) -> int:
+        """Номер рядка клієнта або -1"""
+        return self._rows.get(client_id, -1)
+    
+    def update_client(self, client_data: dict) -> bool:
+        """Оновлює дані одного клієнта (перемальовується лише його картка)"""
+        row = self.row_of(client_data.get('id'))
+        if row < 0:
+            return False
+        
+        self._clients[row] = client_data
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+    
+    def _reindex(self):
+        """Перебудовує словник id → рядок"""
+        self._rows = {client_data.get('id'): row for row, client_data in enumerate(self._clients)}
+
+
+def longest_ordered_subset(ids: List[str], target_rows: Dict[str, int]) -> set:
+    """ID, що вже стоять у правильному відносному порядку (найдовша зростаюча підпослідовність)"""
+    tails: List[int] = []  # Індекс в ids останнього елемента підпослідовності довжини k+1
+    previous: List[int] = [-1] * len(ids)
+    for i, client_id in enumerate(ids):
+        row = target_rows[client_id]
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if target_rows[ids[tails[mid]]] < row:
+                lo = mid + 1
+            else:
+                hi = mid
+        previous[i] = tails[lo - 1] if lo else -1
+        if lo == len(tails):
+            tails.append(i)
+        else:
+            tails[lo] = i
+    
+    result = set()
+    i = tails[-1] if tails else -1
+    while i >= 0:
+        result.add(ids[i])
+        i = previous[i]
+    return result
+
+
+class ClientCardDelegate(QStyledItemDelegate):
+    """Малює статичну картку клієнта (як PhotoCard) без створення віджетів"""
+    
+    def sizeHint(self, option, index) -> QSize:
+        return CARD_SIZE
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        client_data = index.data(ClientDataRole)
+        if client_data is None:
+            return
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        card = QRect(option.rect.topLeft(), CARD_SIZE)
+        
+        # Фон картки з легкою тінню
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 18))
+        painter.drawRoundedRect(card.adjusted(1, 4, 1, 4), 16, 16)
+        painter.setBrush(QColor("#ffffff"))
+        painter.setPen(QPen(QColor(0, 0, 0, 20), 1))
+        painter.drawRoundedRect(card.adjusted(0, 0, -1, -1), 16, 16)
+        
+        # ===== ФОТО (270x350) =====
+        photo_rect = PHOTO_RECT.translated(card.topLeft())
+        clip = QPainterPath()
+        clip.addRoundedRect(photo_rect, 12, 12)
+        painter.save()
+        painter.setClipPath(clip)
+        painter.drawPixmap(photo_rect, self.parent().card_pixmap(client_data.get('photo_path'), index))
+        painter.restore()
+        painter.setBrush(Qt.NoBrush)
+        painter.setPen(QPen(QColor("#e9ecef"), 2))
+        painter.drawRoundedRect(photo_rect.adjusted(1, 1, -1, -1), 12, 12)
+        
+        # ===== ІМ'Я ТА ТЕЛЕФОН =====
+        name_rect = NAME_RECT.translated(card.topLeft())
+        phone_rect = PHONE_RECT.translated(card.topLeft())
+        self._draw_text_box(painter, name_rect, client_display_name(client_data), 18, QFont.DemiBold, "#111827")
+        self._draw_text_box(painter, phone_rect, client_data.get('phone', 'Телефон не вказано'),
+                            15, QFont.Medium, "#374151")
+        
+        # ===== КНОПКИ ДІЙ =====
+        button_y = card.y() + BUTTONS_TOP
+        for text, color in (("📊 ВЕДЕННЯ", COLORS['primary']),
+                            ("💬 ПОВІДОМЛЕННЯ", COLORS['secondary']),
+                            ("🤖 АІ ПОМІЧНИК", COLORS['info'])):
+            button_rect = QRect(card.x() + 25, button_y, 270, 36)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(button_rect, 8, 8)
+            self._draw_text(painter, button_rect, text, 14, QFont.DemiBold, "#ffffff")
+            button_y += BUTTON_STEP
+        
+        painter.restore()
+    
+    def _draw_text_box(self, painter: QPainter, rect: QRect, text: str, size: int, weight, color: str):
+        """Біла рамка з текстом по центру"""
+        painter.setBrush(QColor("#ffffff"))
+        painter.setPen(QPen(QColor("#e5e7eb"), 1))
+        painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 8, 8)
+        self._draw_text(painter, rect.adjusted(12, 0, -12, 0), text, size, weight, color)
+    
+    @staticmethod
+    def _draw_text(painter: QPainter, rect: QRect, text: str, size: int, weight, color: str):
+        """Текст по центру з обрізанням за шириною"""
+        font = QFont(painter.font())
+        font.setPixelSize(size)
+        font.setWeight(weight)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        elided = painter.fontMetrics().elidedText(text, Qt.ElideRight, rect.width())
+        painter.drawText(rect, Qt.AlignCenter, elided)
+
+
+class ClientGridView(QListView):
+    """Сітка карток: малюються лише видимі картки, живий PhotoCard — тільки під курсором"""
+    
+    clicked_client = Signal(str)  # Клік по картці (ID клієнта)
+    edit_requested = Signal(str)  # Редагування
+    delete_requested = Signal(str)  # Видалення
+    swap_requested = Signal(str, str)  # Зміна порядку (source_id, target_id)
+    
+    def __init__(self, spacing: int = 25, parent=None):
+        super().__init__(parent)
+        self.hover_card: Optional[PhotoCard] = None  # Один інтерактивний віджет на всю сітку
+        self._hover_row = -1
+        self._photo_requests: Dict[str, tuple] = {}  # шлях фото → (номер запиту, індекс картки)
+        self._failed_photos = set()  # Фото, які не вдалося декодувати
+        
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setSpacing(spacing)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(40)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setMouseTracking(True)
+        self.setAcceptDrops(True)
+        self.setDragDropMode(QAbstractItemView.DropOnly)
+        self.setItemDelegate(ClientCardDelegate(self))
+        self.setStyleSheet("""
+            QListView {
+                background-color: #f8f9fa;
+                border: none;
+            }
+        """)
+    
+    def setModel(self, model):
+        super().setModel(model)
+        model.modelReset.connect(self._hide_hover_card)
+        model.modelReset.connect(self._cancel_hidden_photos)
+        model.rowsRemoved.connect(self._cancel_hidden_photos)
+        model.rowsRemoved.connect(self._hide_hover_card)
+        model.rowsMoved.connect(self._hide_hover_card)
+        model.dataChanged.connect(self._on_data_changed)
+    
+    # ===== ФОТО КАРТОК (ФОНОВЕ ДЕКОДУВАННЯ) =====
+    
+    def card_pixmap(self, photo_path: Optional[str], index: QModelIndex) -> QPixmap:
+        """Мініатюра для делегата: з кешу, інакше заглушка, а фото декодується у фоні"""
+        pixmap = get_thumbnail_cache().cached_pixmap(photo_path, 'card')
+        if pixmap is not None:
+            return pixmap
+        
+        if photo_path and photo_path not in self._photo_requests and photo_path not in self._failed_photos:
+            token = get_thumbnail_cache().request_pixmap(
+                photo_path, 'card', lambda loaded, path=photo_path: self._on_photo_loaded(path, loaded), owner=self)
+            if token is not None:
+                self._photo_requests[photo_path] = (token, QPersistentModelIndex(index))
+        return create_photo_placeholder()
+    
+    def _on_photo_loaded(self, photo_path: str, pixmap: Optional[QPixmap]):
+        """Перемальовує картки, коли мініатюра готова"""
+        self._photo_requests.pop(photo_path, None)
+        if pixmap is None:
+            self._failed_photos.add(photo_path)
+            return
+        self.viewport().update()
+    
+    def _cancel_hidden_photos(self, *args):
+        """Скасовує декодування фото карток, які прокрутили за межі екрана або видалили"""
+        viewport_rect = self.viewport().rect()
+        for photo_path, (token, index) in list(self._photo_requests.items()):
+            if not index.isValid() or not self.visualRect(QModelIndex(index)).intersects(viewport_rect):
+                get_image_loader().cancel(token)
+                del self._photo_requests[photo_path]
+    
+    # ===== ІНТЕРАКТИВНА КАРТКА ПІД КУРСОРОМ =====
+    
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        self._show_hover_card(self.indexAt(event.position().toPoint()))
+    
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        if self.hover_card is not None and not self.hover_card.underMouse():
+            self._hide_hover_card()
+    
+    def scrollContentsBy(self, dx: int, dy: int):
+        super().scrollContentsBy(dx, dy)
+        self._hide_hover_card()
+        self._cancel_hidden_photos()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._hide_hover_card()
+    
+    def eventFilter(self, obj, event):
+        """Ховаємо PhotoCard, коли курсор покидає її (крім перетягування)"""
+        if obj is self.hover_card and event.type() == QEvent.Leave and not self.hover_card._is_dragging:
+            self._hide_hover_card()
+        return super().eventFilter(obj, event)
+    
+    def _show_hover_card(self, index: QModelIndex):
+        """Розміщує живу PhotoCard над карткою під курсором"""
+        if not index.isValid():
+            self._hide_hover_card()
+            return
+        
+        if self.hover_card is not None and self.hover_card.isVisible() and self._hover_row == index.row():
+            return
+        
+        client_data = index.data(ClientDataRole)
+        if self.hover_card is None:
+            self.hover_card = PhotoCard(client_data, self.viewport())
+            self.hover_card.clicked.connect(self.clicked_client)
+            self.hover_card.edit_requested.connect(self.edit_requested)
+            self.hover_card.delete_requested.connect(self.delete_requested)
+            self.hover_card.swap_requested.connect(self.swap_requested)
+            self.hover_card.installEventFilter(self)
+        elif self.hover_card.client_data is not client_data:
+            self.hover_card.updateCardData(client_data)
+        
+        self._hover_row = index.row()
+        # Тінь картки малюється в її полях, тому віджет ширший за саму картку
+        card_rect = QRect(self.visualRect(index).topLeft(), CARD_SIZE)
+        self.hover_card.setGeometry(card_rect.marginsAdded(self.hover_card.shadow_margins()))
+        self.hover_card.show()
+        self.hover_card.raise_()
+    
+    def _hide_hover_card(self, *args):
+        """Ховає інтерактивну картку"""
+        self._hover_row = -1
+        if self.hover_card is not None and not self.hover_card._is_dragging:
+            self.hover_card.hide()
+    
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()):
+        """Оновлює PhotoCard, якщо змінились дані клієнта під курсором"""
+        if self.hover_card is None or not top_left.row() <= self._hover_row <= bottom_right.row():
+            return
+        self.hover_card.updateCardData(self.model().index(self._hover_row).data(ClientDataRole))
+    
+    # ===== DRAG & DROP (зміна порядку) =====
+    
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasText():
+            event.acceptProposedAction()
+    
+    def dragMoveEvent(self, event):
+        if event.mimeData().hasText() and self.indexAt(event.position().toPoint()).isValid():
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+    
+    def dropEvent(self, event):
+        index = self.indexAt(event.position().toPoint())
+        if not event.mimeData().hasText() or not index.isValid():
+            event.ignore()
+            return
+        
+        source_id = event.mimeData().text()
+        target_id = index.data(ClientIdRole)
+        if source_id != target_id:
+            self.swap_requested.emit(source_id, target_id)
+        event.acceptProposedAction()
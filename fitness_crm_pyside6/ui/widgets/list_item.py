@@ -2,11 +2,10 @@
 """Віджет елемента списку клієнтів"""
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QMessageBox
-from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor, QFont
+from PySide6.QtGui import QColor, QFont
 from qfluentwidgets import CardWidget, ImageLabel, BodyLabel, StrongBodyLabel, TransparentToolButton
 from qfluentwidgets import FluentIcon as FIF
-import os
-import webbrowser
+from utils.thumbnail_cache import get_thumbnail_cache
 
 
 class ListItemWidget(CardWidget):
@@ -25,6 +24,7 @@ class ListItemWidget(CardWidget):
         self.setFixedHeight(140)  # Ще більша висота для кнопок 120x120
         self.setCursor(Qt.PointingHandCursor)
         self.setBorderRadius(8)
+        self._avatar_request = None  # Номер запиту фонового декодування аватара
         
         self._init_ui()
         
@@ -165,34 +165,37 @@ class ListItemWidget(CardWidget):
         main_layout.addLayout(actions_layout)
         
     def _load_avatar(self):
-        """Завантажує аватар клієнта"""
+        """Показує аватар з кешу мініатюр, інакше — заглушку до завершення фонового декодування"""
+        cache = get_thumbnail_cache()
         photo_path = self.client_data.get('photo_path')
         
-        if photo_path and os.path.exists(photo_path):
-            # Завантажуємо реальне фото
-            pixmap = QPixmap(photo_path)
-            if not pixmap.isNull():
-                # Обрізаємо в коло
-                scaled_pixmap = pixmap.scaled(60, 60, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                
-                # Створюємо кругову маску
-                rounded_pixmap = QPixmap(60, 60)
-                rounded_pixmap.fill(Qt.transparent)
-                
-                painter = QPainter(rounded_pixmap)
-                painter.setRenderHint(QPainter.Antialiasing)
-                
-                path = QPainterPath()
-                path.addRoundedRect(0, 0, 60, 60, 30, 30)
-                painter.setClipPath(path)
-                
-                painter.drawPixmap(0, 0, scaled_pixmap)
-                painter.end()
-                
-                self.avatar.setPixmap(rounded_pixmap)
-                return
-        
-        # Заглушка з іконкою користувача
+        # Кругла мініатюра 60x60 (оригінал декодується лише один раз)
+        rounded_pixmap = cache.cached_pixmap(photo_path, 'avatar')
+        if rounded_pixmap is not None:
+            self.avatar.setPixmap(rounded_pixmap)
+            return
+        
+        self._show_avatar_placeholder()
+        self._avatar_request = cache.request_pixmap(photo_path, 'avatar', self._on_avatar_loaded, owner=self)
+    
+    def _on_avatar_loaded(self, rounded_pixmap):
+        """Підміняє заглушку готовим аватаром"""
+        self._avatar_request = None
+        if rounded_pixmap is None:
+            return
+        
+        self.avatar.setText("")
+        self.avatar.setStyleSheet("""
+            QLabel {
+                background-color: #f1f3f4;
+                border: 2px solid #e5e7eb;
+                border-radius: 30px;
+            }
+        """)
+        self.avatar.setPixmap(rounded_pixmap)
+    
+    def _show_avatar_placeholder(self):
+        """Заглушка з іконкою користувача"""
         self.avatar.setText("👤")
         self.avatar.setStyleSheet("""
             QLabel {
@@ -212,6 +215,7 @@ class ListItemWidget(CardWidget):
         if ai_url:
             # Якщо посилання збережено - відкриваємо браузер
             try:
+                import webbrowser  # Імпорт за потреби: модуль не потрібен для відображення картки
                 webbrowser.open(ai_url)
             except Exception as e:
                 QMessageBox.warning(
@@ -1,14 +1,65 @@
 # ui/widgets/photo_card.py
 """Красива фотокартка клієнта з детальним дизайном"""
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QRect, QSize
+from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QRect, QRectF, QSize, QMargins
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QGraphicsDropShadowEffect, QPushButton, QFrame, QApplication, QMessageBox)
-from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor, QFont, QLinearGradient
+from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor, QFont, QLinearGradient, QPixmapCache
 from qfluentwidgets import CardWidget, ImageLabel, CaptionLabel, BodyLabel, StrongBodyLabel
-from qfluentwidgets import TransparentToolButton, FluentIcon as FIF, PrimaryPushButton
+from qfluentwidgets import TransparentToolButton, FluentIcon as FIF, PrimaryPushButton, isDarkTheme
 from ui.styles import COLORS
-import os
-import webbrowser
+from ui.widgets import card_shadow
+from ui.widgets.card_shadow import (CARD_SHADOW, CARD_SHADOW_HOVER, ShadowSpec,
+                                    get_shadow_renderer, shadow_margins)
+from utils.image_loader import get_image_loader
+from utils.thumbnail_cache import get_thumbnail_cache
+
+
+# Розмір самої картки (без полів під тінь)
+CARD_BODY_SIZE = QSize(320, 620)
+
+# Розміри фото на картці
+CARD_PHOTO_WIDTH = 270
+CARD_PHOTO_HEIGHT = 350
+
+
+def create_photo_placeholder() -> QPixmap:
+    """Створює стильну заглушку з іконкою камери в бізнес-стилі"""
+    cached = QPixmapCache.find("photo_card:placeholder")
+    if cached is not None and not cached.isNull():
+        return cached
+    
+    pixmap = QPixmap(CARD_PHOTO_WIDTH, CARD_PHOTO_HEIGHT)
+    pixmap.fill(QColor("#f8f9fa"))
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    
+    # Сірий напівпрозорий фон у бізнес-стилі
+    gradient = QLinearGradient(0, 0, 270, 350)
+    gradient.setColorAt(0, QColor("#e5e7eb"))  # Світло-сірий
+    gradient.setColorAt(1, QColor("#d1d5db"))  # Трохи темніший сірий
+    
+    # Малюємо сірий градієнт
+    painter.fillRect(0, 0, 270, 350, gradient)
+    
+    # Додаємо іконку камери (сірий колір для бізнес-стилю)
+    painter.setPen(QColor("#6b7280"))  # Темно-сірий колір
+    font = QFont()
+    font.setPixelSize(60)
+    painter.setFont(font)
+    
+    painter.drawText(0, 0, 270, 350, Qt.AlignCenter, "📷")
+    
+    # Додаємо текст "Фото відсутнє" (темно-сірий)
+    painter.setPen(QColor("#4b5563"))  # Ще темніший сірий для тексту
+    font.setPixelSize(16)
+    font.setWeight(QFont.Weight.Medium)  # Трохи жирніший шрифт
+    painter.setFont(font)
+    painter.drawText(0, 300, 270, 40, Qt.AlignCenter, "Фото відсутнє")
+    
+    painter.end()
+    QPixmapCache.insert("photo_card:placeholder", pixmap)
+    return pixmap
 
 
 class PhotoCard(CardWidget):
@@ -30,7 +81,7 @@ class PhotoCard(CardWidget):
         client_id = client_data.get('id', 'NO_ID')
         print(f"🔍 PhotoCard створена з ID: {client_id}")
         
-        self.setFixedSize(320, 620)  # Новий розмір відповідно до вимог
+        self.setFixedSize(CARD_BODY_SIZE)  # Новий розмір відповідно до вимог
         self.setCursor(Qt.PointingHandCursor)
         
         # Налаштування картки
@@ -40,13 +91,23 @@ class PhotoCard(CardWidget):
         self.setAcceptDrops(True)
         self._drag_start_position = None
         self._is_dragging = False
-        
-        # Створюємо тінь
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(25)
-        self.shadow.setColor(QColor(0, 0, 0, 40))
-        self.shadow.setOffset(0, 6)
-        self.setGraphicsEffect(self.shadow)
+        self._photo_request = None  # Номер запиту фонового декодування фото
+        
+        # Створюємо тінь: кешований nine-patch (малюється в paintEvent) або QGraphicsDropShadowEffect
+        self._cached_shadow = card_shadow.USE_CACHED_SHADOWS
+        self._shadow_spec = CARD_SHADOW
+        if self._cached_shadow:
+            # Тінь малюється в межах віджета, тож картка більша на поля тіні
+            self.shadow = None
+            self._shadow_margins = shadow_margins(CARD_SHADOW, CARD_SHADOW_HOVER)
+            self.setFixedSize(CARD_BODY_SIZE.grownBy(self._shadow_margins))
+        else:
+            self._shadow_margins = QMargins()
+            self.shadow = QGraphicsDropShadowEffect(self)
+            self.shadow.setBlurRadius(CARD_SHADOW.blur)
+            self.shadow.setColor(QColor(0, 0, 0, CARD_SHADOW.alpha))
+            self.shadow.setOffset(0, CARD_SHADOW.offset_y)
+            self.setGraphicsEffect(self.shadow)
         
         # Ініціалізуємо UI
         self._init_ui()
@@ -61,7 +122,7 @@ class PhotoCard(CardWidget):
     def _init_ui(self):
         """Створює інтерфейс картки з новим дизайном"""
         main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(15, 15, 15, 15)
+        main_layout.setContentsMargins(QMargins(15, 15, 15, 15) + self._shadow_margins)
         main_layout.setSpacing(12)
         
         # ===== СЕКЦІЯ ФОТОГРАФІЇ (270x350px) =====
@@ -301,6 +362,7 @@ class PhotoCard(CardWidget):
         if ai_url:
             # Якщо посилання збережено - відкриваємо браузер
             try:
+                import webbrowser  # Імпорт за потреби: модуль не потрібен для відображення картки
                 webbrowser.open(ai_url)
             except Exception as e:
                 QMessageBox.warning(
@@ -334,64 +396,29 @@ class PhotoCard(CardWidget):
         )
     
     def _load_photo(self):
-        """Завантажує фото клієнта або встановлює заглушку"""
+        """Показує фото з кешу мініатюр, інакше — заглушку до завершення фонового декодування"""
+        cache = get_thumbnail_cache()
+        get_image_loader().cancel(self._photo_request)
+        self._photo_request = None
+        
         photo_path = self.client_data.get('photo_path')
+        pixmap = cache.cached_pixmap(photo_path, 'card')
+        if pixmap is not None:
+            self.photo_widget.setPixmap(pixmap)
+            return
         
-        if photo_path and os.path.exists(photo_path):
-            # Завантажуємо реальне фото
-            pixmap = QPixmap(photo_path)
-            
-            # Масштабуємо зображення до розміру з збереженням пропорцій
-            scaled_pixmap = pixmap.scaled(
-                270, 350, 
-                Qt.KeepAspectRatioByExpanding, 
-                Qt.SmoothTransformation
-            )
-            
-            # Обрізаємо зображення по центру, якщо воно більше за розмір
-            if scaled_pixmap.width() > 270 or scaled_pixmap.height() > 350:
-                x = (scaled_pixmap.width() - 270) // 2
-                y = (scaled_pixmap.height() - 350) // 2
-                scaled_pixmap = scaled_pixmap.copy(x, y, 270, 350)
-                
-            self.photo_widget.setPixmap(scaled_pixmap)
-        else:
-            # Створюємо красиву заглушку
-            self._create_photo_placeholder()
+        self._create_photo_placeholder()
+        self._photo_request = cache.request_pixmap(photo_path, 'card', self._on_photo_loaded, owner=self)
+    
+    def _on_photo_loaded(self, pixmap):
+        """Підміняє заглушку готовою мініатюрою"""
+        self._photo_request = None
+        if pixmap is not None:
+            self.photo_widget.setPixmap(pixmap)
             
     def _create_photo_placeholder(self):
         """Створює стильну заглушку з іконкою камери в бізнес-стилі"""
-        pixmap = QPixmap(270, 350)
-        pixmap.fill(QColor("#f8f9fa"))
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Сірий напівпрозорий фон у бізнес-стилі
-        gradient = QLinearGradient(0, 0, 270, 350)
-        gradient.setColorAt(0, QColor("#e5e7eb"))  # Світло-сірий
-        gradient.setColorAt(1, QColor("#d1d5db"))  # Трохи темніший сірий
-        
-        # Малюємо сірий градієнт
-        painter.fillRect(0, 0, 270, 350, gradient)
-        
-        # Додаємо іконку камери (сірий колір для бізнес-стилю)
-        painter.setPen(QColor("#6b7280"))  # Темно-сірий колір
-        font = QFont()
-        font.setPixelSize(60)
-        painter.setFont(font)
-        
-        painter.drawText(0, 0, 270, 350, Qt.AlignCenter, "📷")
-        
-        # Додаємо текст "Фото відсутнє" (темно-сірий)
-        painter.setPen(QColor("#4b5563"))  # Ще темніший сірий для тексту
-        font.setPixelSize(16)
-        font.setWeight(QFont.Weight.Medium)  # Трохи жирніший шрифт
-        painter.setFont(font)
-        painter.drawText(0, 300, 270, 40, Qt.AlignCenter, "Фото відсутнє")
-        
-        painter.end()
-        self.photo_widget.setPixmap(pixmap)
+        self.photo_widget.setPixmap(create_photo_placeholder())
     
     def _init_animations(self):
         """Ініціалізує анімації"""
@@ -405,8 +432,7 @@ class PhotoCard(CardWidget):
         super().enterEvent(event)
         
         # Збільшуємо тінь (менш інтенсивно)
-        self.shadow.setBlurRadius(30)  # Менше blur
-        self.shadow.setOffset(0, 8)    # Менший зсув
+        self._set_shadow_spec(CARD_SHADOW_HOVER)
         
         # Легка анімація підйому (менший масштаб)
         current_rect = self.geometry()
@@ -425,8 +451,7 @@ class PhotoCard(CardWidget):
         super().leaveEvent(event)
         
         # Зменшуємо тінь
-        self.shadow.setBlurRadius(25)
-        self.shadow.setOffset(0, 6)
+        self._set_shadow_spec(CARD_SHADOW)
         
         # Повертаємо розмір (менший зсув)
         current_rect = self.geometry()
@@ -440,8 +465,58 @@ class PhotoCard(CardWidget):
         self.scale_animation.setEndValue(new_rect)
         self.scale_animation.start()
     
+    def _set_shadow_spec(self, spec: ShadowSpec):
+        """Перемикає тінь між станом спокою та наведення"""
+        self._shadow_spec = spec
+        if self.shadow is not None:
+            self.shadow.setBlurRadius(spec.blur)
+            self.shadow.setOffset(0, spec.offset_y)
+        else:
+            self.update()
+    
+    def body_rect(self) -> QRect:
+        """Прямокутник самої картки (без полів під тінь)"""
+        return self.rect().marginsRemoved(self._shadow_margins)
+    
+    def shadow_margins(self) -> QMargins:
+        """Поля навколо тіла картки, зайняті тінню (нульові для QGraphicsDropShadowEffect)"""
+        return QMargins(self._shadow_margins)
+    
+    def paintEvent(self, event):
+        """Кешована тінь + тіло картки в межах body_rect"""
+        if not self._cached_shadow:
+            super().paintEvent(event)
+            return
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        body = self.body_rect()
+        r = self.borderRadius
+        
+        # Тінь лише навколо картки: під напівпрозорим фоном її не видно, як і з ефектом
+        outside = QPainterPath()
+        outside.addRect(QRectF(self.rect()))
+        inside = QPainterPath()
+        inside.addRoundedRect(QRectF(body).adjusted(1, 1, -1, -1), r, r)
+        painter.setClipPath(outside.subtracted(inside))
+        get_shadow_renderer().paint(painter, body, self._shadow_spec)
+        painter.setClipping(False)
+        
+        # Тіло як у CardWidget: фон за станом наведення та тонка рамка
+        if isDarkTheme():
+            painter.setPen(QColor(255, 255, 255, 13 if self.isHover else 8))
+        else:
+            painter.setPen(QColor(0, 0, 0, 27 if self.isHover and not self.isPressed else 15))
+        painter.setBrush(self.backgroundColor)
+        painter.drawRoundedRect(QRectF(body).adjusted(1, 1, -1, -1), r, r)
+    
     def mousePressEvent(self, event):
         """При кліку на картку"""
+        # Клік по полю тіні — не по картці, віддаємо його батьківському віджету
+        if not self.body_rect().contains(event.position().toPoint()):
+            event.ignore()
+            return
+        
         if event.button() == Qt.LeftButton:
             self._drag_start_position = event.position()
             self.clicked.emit(self.client_data.get('id', ''))
@@ -483,6 +558,7 @@ class PhotoCard(CardWidget):
         
         # Створюємо превью для перетягування
         pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.transparent)
         self.render(pixmap)
         
         # Робимо превью напівпрозорим
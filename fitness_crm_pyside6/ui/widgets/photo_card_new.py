@@ -7,7 +7,8 @@ from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor, QFont, QLinea
 from qfluentwidgets import CardWidget, ImageLabel, CaptionLabel, BodyLabel, StrongBodyLabel
 from qfluentwidgets import TransparentToolButton, FluentIcon as FIF, PrimaryPushButton
 from ui.styles import COLORS, get_button_style
-import os
+from utils.image_loader import get_image_loader
+from utils.thumbnail_cache import get_thumbnail_cache
 
 
 class PhotoCard(CardWidget):
@@ -27,6 +28,7 @@ class PhotoCard(CardWidget):
         
         # Налаштування картки
         self.setBorderRadius(16)
+        self._photo_request = None  # Номер запиту фонового декодування фото
         
         # Створюємо тінь
         self.shadow = QGraphicsDropShadowEffect(self)
@@ -284,30 +286,26 @@ class PhotoCard(CardWidget):
         )
     
     def _load_photo(self):
-        """Завантажує фото клієнта або встановлює заглушку"""
-        photo_path = self.client_data.get('photo_path')
+        """Показує фото з кешу мініатюр, інакше — заглушку до завершення фонового декодування"""
+        cache = get_thumbnail_cache()
+        get_image_loader().cancel(self._photo_request)
+        self._photo_request = None
         
-        if photo_path and os.path.exists(photo_path):
-            # Завантажуємо реальне фото
-            pixmap = QPixmap(photo_path)
-            
-            # Масштабуємо зображення до розміру з збереженням пропорцій
-            scaled_pixmap = pixmap.scaled(
-                270, 350, 
-                Qt.KeepAspectRatioByExpanding, 
-                Qt.SmoothTransformation
-            )
-            
-            # Обрізаємо зображення по центру, якщо воно більше за розмір
-            if scaled_pixmap.width() > 270 or scaled_pixmap.height() > 350:
-                x = (scaled_pixmap.width() - 270) // 2
-                y = (scaled_pixmap.height() - 350) // 2
-                scaled_pixmap = scaled_pixmap.copy(x, y, 270, 350)
-                
-            self.photo_widget.setPixmap(scaled_pixmap)
-        else:
-            # Створюємо красиву заглушку
-            self._create_photo_placeholder()
+        photo_path = self.client_data.get('photo_path')
+        pixmap = cache.cached_pixmap(photo_path, 'card')
+        if pixmap is not None:
+            self.photo_widget.setPixmap(pixmap)
+            return
+        
+        # Створюємо красиву заглушку, фото підставиться після декодування
+        self._create_photo_placeholder()
+        self._photo_request = cache.request_pixmap(photo_path, 'card', self._on_photo_loaded, owner=self)
+    
+    def _on_photo_loaded(self, pixmap):
+        """Підміняє заглушку готовою мініатюрою"""
+        self._photo_request = None
+        if pixmap is not None:
+            self.photo_widget.setPixmap(pixmap)
             
     def _create_photo_placeholder(self):
         """Створює красиву заглушку з іконкою камери"""
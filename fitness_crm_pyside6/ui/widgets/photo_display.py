@@ -1,11 +1,12 @@
 # ui/widgets/photo_display.py
 """Віджет для відображення та корекції фотографій"""
 import os
-from PIL import Image, ImageEnhance
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QSlider, QPushButton, QFrame)
-from PySide6.QtCore import Qt, Signal, QTimer, QPointF
+from PySide6.QtCore import Qt, Signal, QTimer, QPointF, QRect, QRectF
 from PySide6.QtGui import QPixmap, QWheelEvent, QMouseEvent, QPainter, QTransform
+from utils.image_processor import adjust_rgb, array_to_qimage
+from utils.image_pyramid import TILE_SIZE, get_pyramid_cache
 
 
 # Мінімальний стиль для слайдерів
@@ -34,12 +35,21 @@ QSlider::sub-page:horizontal {
 """
 
 
+# Розмір, до якого вписується фото, не менший за цей масштаб (захист від порожнього віджета)
+MIN_FIT_SCALE = 0.01
+
+
 class PhotoDisplayWidget(QLabel):
-    """Віджет для відображення фото з зумом, панорамуванням та корекцією"""
+    """Віджет для відображення фото з зумом, панорамуванням та корекцією.
+    
+    Фото береться зі спільного кешу пірамід (utils.image_pyramid): на екран потрапляє
+    лише видимий тайл рівня, що відповідає масштабу, і корекції рахуються тільки для нього.
+    """
     
     # Сигнали
     drag_started = Signal(int)  # індекс фото
     drop_accepted = Signal(int, int)  # з_індексу, в_індекс
+    view_changed = Signal()  # користувач змінив зум або пан (синхронізація панелей порівняння)
     
     def __init__(self, photo_path, index=0, parent=None):
         super().__init__(parent)
@@ -54,20 +64,31 @@ class PhotoDisplayWidget(QLabel):
         self._contrast = 100  # 0 до 200
         self._saturation = 100  # 0 до 200
         self._sharpness = 100  # 0 до 400
+        self._fitted = True  # Масштаб вибрано автоматично — при зміні розміру фото вписується знову
         
-        # Оригінальне зображення
-        self._original_image = None
+        # Піраміда фото зі спільного кешу
+        self._pyramid = None
         self._current_pixmap = None
         
+        # Скоригований тайл: (рівень + корекції, прямокутник у пікселях рівня, QPixmap).
+        # Пан і зум у межах тайла не повторюють корекції
+        self._tile = None
+        self._preview = False
+        
         # Перетягування
         self._dragging = False
         self._drag_start_pos = QPointF()
         self._is_drag_drop_mode = False
         
-        # Таймер для корекції
+        # Таймер для корекції (попередній перегляд на рівні піраміди вдвічі меншому)
         self._adjustment_timer = QTimer()
         self._adjustment_timer.setSingleShot(True)
-        self._adjustment_timer.timeout.connect(self._apply_adjustments)
+        self._adjustment_timer.timeout.connect(self._apply_preview_adjustments)
+        
+        # Таймер повної роздільності (об'єднує кілька викликів в одну перерисовку)
+        self._full_render_timer = QTimer()
+        self._full_render_timer.setSingleShot(True)
+        self._full_render_timer.timeout.connect(self._apply_adjustments)
         
         self._init_ui()
         self._load_image()
@@ -89,101 +110,177 @@ class PhotoDisplayWidget(QLabel):
         self.setAcceptDrops(True)
     
     def _load_image(self):
-        """Завантажує оригінальне зображення"""
+        """Бере піраміду фото з кешу або чекає на її фонову побудову (GUI не блокується)"""
+        self._pyramid = None
+        self._tile = None
+        
         if not os.path.exists(self.photo_path):
             self.setText("📷\nФото не знайдено")
             return
         
-        try:
-            self._original_image = Image.open(self.photo_path).convert('RGB')
-            self._auto_fit_photo()
-        except Exception as e:
-            self.setText(f"📷\nПомилка: {str(e)}")
+        self.setText("📷\nЗавантаження...")
+        photo_path = self.photo_path
+        get_pyramid_cache().request(
+            photo_path,
+            lambda pyramid, error: self._on_image_loaded(photo_path, pyramid, error),
+            owner=self
+        )
+    
+    def _on_image_loaded(self, photo_path, pyramid, error):
+        """Отримує піраміду (з кешу — одразу, інакше з робочого потоку)"""
+        if photo_path != self.photo_path:
+            return  # Тим часом панель переключили на інше фото
+        if pyramid is None:
+            self.setText(f"📷\nПомилка: {error}")
+            return
+        
+        self._pyramid = pyramid
+        self._auto_fit_photo()
+    
+    def _fit_scale(self):
+        """Масштаб, при якому фото вписується у віджет (не більше оригіналу)"""
+        scale_x = (self.width() - 20) / self._pyramid.width
+        scale_y = (self.height() - 20) / self._pyramid.height
+        return max(min(scale_x, scale_y, 1.0), MIN_FIT_SCALE)  # Не збільшуємо більше оригіналу
     
     def _auto_fit_photo(self):
         """Автоматично вписує фото в віджет"""
-        if not self._original_image:
+        if self._pyramid is None:
             return
         
-        # Розраховуємо оптимальний масштаб
-        widget_size = self.size()
-        img_size = self._original_image.size
-        
-        scale_x = (widget_size.width() - 20) / img_size[0]
-        scale_y = (widget_size.height() - 20) / img_size[1]
-        self._scale = min(scale_x, scale_y, 1.0)  # Не збільшуємо більше оригіналу
+        self._scale = self._fit_scale()
+        self._fitted = True
         
         # Центруємо зображення
         self._offset = QPointF(0, 0)
         
         self._apply_adjustments()
     
-    def _apply_adjustments(self):
-        """Застосовує всі корекції до зображення"""
-        if not self._original_image:
+    def _apply_preview_adjustments(self):
+        """Корекції на вдвічі меншому рівні піраміди — під час руху слайдера"""
+        self._apply_adjustments(preview=True)
+    
+    def _apply_adjustments(self, preview=False):
+        """Перемальовує видиму частину фото з усіма корекціями"""
+        if self._pyramid is None:
             return
         
-        # Копіюємо оригінальне зображення
-        img = self._original_image.copy()
-        
-        # Застосовуємо корекції
-        if self._brightness != 0:
-            brightness_factor = 1.0 + (self._brightness / 100.0)
-            img = ImageEnhance.Brightness(img).enhance(brightness_factor)
-        
-        if self._contrast != 100:
-            contrast_factor = self._contrast / 100.0
-            img = ImageEnhance.Contrast(img).enhance(contrast_factor)
-        
-        if self._saturation != 100:
-            saturation_factor = self._saturation / 100.0
-            img = ImageEnhance.Color(img).enhance(saturation_factor)
-        
-        if self._sharpness != 100:
-            sharpness_factor = self._sharpness / 100.0
-            img = ImageEnhance.Sharpness(img).enhance(sharpness_factor)
-        
-        # Конвертуємо в QPixmap
-        img_qt = img.convert('RGB')
-        width, height = img_qt.size
-        img_data = img_qt.tobytes('raw', 'RGB')
-        
-        from PySide6.QtGui import QImage
-        qimg = QImage(img_data, width, height, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(qimg)
-        
-        # Застосовуємо масштаб та зміщення
-        if self._scale != 1.0 or self._offset != QPointF(0, 0):
-            scaled_pixmap = pixmap.scaled(
-                int(pixmap.width() * self._scale),
-                int(pixmap.height() * self._scale),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        self._preview = preview
+        self._update_view()
+    
+    def _adjust_factors(self):
+        """Коефіцієнти корекцій для adjust_rgb (1.0 — без змін)"""
+        return {
+            'brightness': 1.0 + (self._brightness / 100.0),
+            'contrast': self._contrast / 100.0,
+            'saturation': self._saturation / 100.0,
+            'sharpness': self._sharpness / 100.0,
+        }
+    
+    def _get_tile(self, level, needed):
+        """Скоригований тайл рівня, що покриває needed (пікселі рівня); готовий перевикористовується"""
+        level_image = self._pyramid.levels[level]
+        needed = needed.toAlignedRect().intersected(QRect(0, 0, level_image.width(), level_image.height()))
+        key = (level, self._brightness, self._contrast, self._saturation, self._sharpness)
+        if self._tile is not None:
+            tile_key, tile_rect, tile_pixmap = self._tile
+            if tile_key == key and tile_rect.contains(needed):
+                return tile_rect, tile_pixmap
+        
+        # Вирівнюємо по сітці TILE_SIZE із запасом в одну клітинку з кожного боку
+        left = max(0, (needed.left() // TILE_SIZE - 1) * TILE_SIZE)
+        top = max(0, (needed.top() // TILE_SIZE - 1) * TILE_SIZE)
+        right = min(level_image.width(), (needed.right() // TILE_SIZE + 2) * TILE_SIZE)
+        bottom = min(level_image.height(), (needed.bottom() // TILE_SIZE + 2) * TILE_SIZE)
+        tile_rect = QRect(left, top, right - left, bottom - top)
+        
+        # Контраст тягнеться до середньої яскравості всього фото, а не тайла — інакше він мінявся б при пані
+        factors = self._adjust_factors()
+        mean = self._pyramid.mean_luma(factors['brightness']) if factors['contrast'] != 1.0 else None
+        pixels = adjust_rgb(self._pyramid.array(level)[top:bottom, left:right], mean=mean, **factors)
+        tile_pixmap = QPixmap.fromImage(array_to_qimage(pixels))
+        
+        self._tile = (key, tile_rect, tile_pixmap)
+        return tile_rect, tile_pixmap
+    
+    def _update_view(self):
+        """Малює видиму частину фото з рівня піраміди, найближчого до масштабу"""
+        pyramid = self._pyramid
+        if pyramid is None:
+            return
+        
+        # Прямокутник фото у віджеті: центр + зміщення
+        image_rect = QRectF(0, 0, pyramid.width * self._scale, pyramid.height * self._scale)
+        image_rect.moveCenter(QPointF(self.width() / 2, self.height() / 2) + self._offset)
+        visible = image_rect.intersected(QRectF(self.rect()))
+        
+        final_pixmap = QPixmap(self.size())
+        final_pixmap.fill(Qt.GlobalColor.transparent)
+        
+        if not visible.isEmpty():
+            level = pyramid.level_for(self._scale)
+            if self._preview:
+                level = min(level + 1, len(pyramid.levels) - 1)
             
-            # Створюємо фінальний pixmap з врахуванням зміщення
-            final_pixmap = QPixmap(self.size())
-            final_pixmap.fill(Qt.GlobalColor.transparent)
+            # Координати віджета → пікселі рівня
+            level_image = pyramid.levels[level]
+            ratio_x = level_image.width() / image_rect.width()
+            ratio_y = level_image.height() / image_rect.height()
+            tile_rect, tile_pixmap = self._get_tile(level, QRectF(
+                (visible.left() - image_rect.left()) * ratio_x,
+                (visible.top() - image_rect.top()) * ratio_y,
+                visible.width() * ratio_x,
+                visible.height() * ratio_y
+            ))
             
+            # Тайл малюється туди, де його пікселі лежать у віджеті
+            target = QRectF(
+                image_rect.left() + tile_rect.left() / ratio_x,
+                image_rect.top() + tile_rect.top() / ratio_y,
+                tile_rect.width() / ratio_x,
+                tile_rect.height() / ratio_y
+            )
             painter = QPainter(final_pixmap)
             painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-            
-            # Розраховуємо позицію для центрування + зміщення
-            x = (self.width() - scaled_pixmap.width()) // 2 + int(self._offset.x())
-            y = (self.height() - scaled_pixmap.height()) // 2 + int(self._offset.y())
-            
-            painter.drawPixmap(x, y, scaled_pixmap)
+            painter.drawPixmap(target, tile_pixmap, QRectF(tile_pixmap.rect()))
             painter.end()
-            
-            self._current_pixmap = final_pixmap
-        else:
-            self._current_pixmap = pixmap
         
+        self._current_pixmap = final_pixmap
         self.setPixmap(self._current_pixmap)
     
+    def resizeEvent(self, event):
+        """Вписане фото вписується в новий розмір, інакше видима частина лише перемальовується"""
+        super().resizeEvent(event)
+        if self._fitted:
+            self._auto_fit_photo()
+        else:
+            self._update_view()
+    
+    def view_state(self):
+        """Зум відносно вписаного масштабу та зміщення в частках розміру фото на екрані"""
+        if self._pyramid is None:
+            return None
+        width = self._pyramid.width * self._scale
+        height = self._pyramid.height * self._scale
+        return self._scale / self._fit_scale(), self._offset.x() / width, self._offset.y() / height
+    
+    def set_view_state(self, state):
+        """Показує той самий кадр, що й інша панель (див. view_state), незалежно від роздільності фото"""
+        if self._pyramid is None or state is None:
+            return
+        
+        zoom, offset_x, offset_y = state
+        self._scale = self._fit_scale() * zoom
+        self._offset = QPointF(
+            offset_x * self._pyramid.width * self._scale,
+            offset_y * self._pyramid.height * self._scale
+        )
+        self._fitted = False
+        self._apply_adjustments()
+    
     def wheelEvent(self, event: QWheelEvent):
         """Обробляє прокрутку миші для зуму"""
-        if not self._original_image:
+        if self._pyramid is None:
             return
         
         # Зум
@@ -191,8 +288,10 @@ class PhotoDisplayWidget(QLabel):
         zoom_factor = 1.1 if delta > 0 else 0.9
         
         old_scale = self._scale
-        self._scale *= zoom_factor
-        self._scale = max(0.1, min(5.0, self._scale))  # Обмежуємо масштаб
+        new_scale = old_scale * zoom_factor
+        # Обмежуємо масштаб; вписане велике фото буває дрібнішим за 0.1 — наближення не блокуємо
+        if new_scale <= 5.0 and (new_scale >= 0.1 or zoom_factor > 1):
+            self._scale = new_scale
         
         # Корекція зміщення для зуму відносно позиції миші
         if old_scale != self._scale:
@@ -206,7 +305,9 @@ class PhotoDisplayWidget(QLabel):
             scale_ratio = self._scale / old_scale
             self._offset = (self._offset - relative_pos) * scale_ratio + relative_pos
         
+        self._fitted = False
         self._apply_adjustments()
+        self.view_changed.emit()
     
     def mousePressEvent(self, event: QMouseEvent):
         """Обробляє натискання миші"""
@@ -235,7 +336,9 @@ class PhotoDisplayWidget(QLabel):
             delta = event.position() - self._drag_start_pos
             self._offset += delta
             self._drag_start_pos = event.position()
+            self._fitted = False
             self._apply_adjustments()
+            self.view_changed.emit()
     
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Обробляє відпускання миші"""
@@ -317,8 +420,20 @@ class PhotoDisplayWidget(QLabel):
         self._contrast = params.get('contrast', 100)
         self._saturation = params.get('saturation', 100)
         self._sharpness = params.get('sharpness', 100)
+        self._fitted = False
         self._apply_adjustments()
     
+    def finish_adjustments(self):
+        """Перемальовує у повній роздільності (слайдер відпущено)"""
+        self._adjustment_timer.stop()
+        self._full_render_timer.stop()
+        self._apply_adjustments()
+    
+    def schedule_full_render(self):
+        """Відкладена перерисовка у повній роздільності (кілька змін поспіль — одна перерисовка)"""
+        self._adjustment_timer.stop()
+        self._full_render_timer.start(0)
+    
     def set_brightness(self, value):
         """Встановлює яскравість"""
         self._brightness = value
@@ -350,6 +465,7 @@ class PhotoDisplayWidget(QLabel):
     def center_photo(self):
         """Центрує фото"""
         self._auto_fit_photo()
+        self.view_changed.emit()
 
 
 class PhotoControlPanel(QWidget):
@@ -515,6 +631,16 @@ class PhotoControlPanel(QWidget):
         sharpness_slider = self.sharpness_slider.itemAt(1).widget()
         sharpness_slider.valueChanged.connect(self.photo_widget.set_sharpness)
         sharpness_slider.valueChanged.connect(lambda v: sharpness_slider.value_label.setText(str(v)))
+        
+        # Під час перетягування — проксі, повна роздільність — після відпускання
+        for slider in (brightness_slider, contrast_slider, saturation_slider, sharpness_slider):
+            slider.sliderReleased.connect(self.photo_widget.finish_adjustments)
+            slider.valueChanged.connect(lambda v, s=slider: self._on_slider_value_changed(s))
+    
+    def _on_slider_value_changed(self, slider):
+        """Зміни без перетягування (клавіатура, клік по шкалі, скидання) одразу в повній роздільності"""
+        if not slider.isSliderDown():
+            self.photo_widget.schedule_full_render()
     
     def _reset_adjustments(self):
         """Скидає всі корекції"""
@@ -4,7 +4,8 @@ import os
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QCheckBox, QFrame)
 from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QPixmap, QFont
+from PySide6.QtGui import QFont
+from utils.thumbnail_cache import get_thumbnail_cache
 
 
 class TestingPhotoCard(QWidget):
@@ -188,14 +189,20 @@ class TestingPhotoCard(QWidget):
             """)
             return
         
-        pixmap = QPixmap(self.photo_path)
-        if not pixmap.isNull():
-            # Масштабуємо зображення зберігаючи пропорції
-            scaled_pixmap = pixmap.scaled(
-                238, 238,  # -2px для рамки
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        # Мініатюра 238x238 (-2px для рамки) з кешу, оригінал декодується лише один раз
+        cache = get_thumbnail_cache()
+        scaled_pixmap = cache.cached_pixmap(self.photo_path, 'testing')
+        if scaled_pixmap is not None:
+            self.photo_label.setPixmap(scaled_pixmap)
+            return
+        
+        # Декодуємо у фоні, поки що показуємо заглушку
+        self.photo_label.setText("📷\nЗавантаження...")
+        cache.request_pixmap(self.photo_path, 'testing', self._on_photo_loaded, owner=self)
+    
+    def _on_photo_loaded(self, scaled_pixmap):
+        """Підміняє заглушку готовою мініатюрою"""
+        if scaled_pixmap is not None:
             self.photo_label.setPixmap(scaled_pixmap)
         else:
             self.photo_label.setText("📷\nПомилка завантаження")
@@ -1,10 +1,25 @@
 # utils/ai_helper.py
 """Помічник для роботи з АІ"""
 from datetime import datetime
+from utils.calculations import client_metric_inputs, get_metric_graph
+
+
+def _calculated_metrics(client_data):
+    """Розраховані показники клієнта (той самий граф, що й у вкладці фізичних параметрів)"""
+    metrics = get_metric_graph().evaluate_many(
+        ('bmi', 'bmr', 'daily_calories', 'body_fat_percentage', 'muscle_mass', 'body_type'),
+        client_metric_inputs(client_data)
+    )
+    if metrics['muscle_mass']:
+        metrics['muscle_mass'] = metrics['muscle_mass']['mass_kg']
+    if metrics['body_type']:
+        metrics['body_type'] = metrics['body_type']['type']
+    return {name: value for name, value in metrics.items() if value is not None}
 
 
 def generate_ai_prompt(client_data):
     """Генерує детальний промт для АІ на основі даних клієнта"""
+    client_data = {**client_data, **_calculated_metrics(client_data)}
     
     client_name = client_data.get('full_name', 'Клієнт')
     trainer_name = "Денис Мельниченко"  # Можна винести в конфіг
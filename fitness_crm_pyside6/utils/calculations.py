@@ -1,14 +1,475 @@
 """
 Модуль для автоматичних розрахунків фізичних показників клієнта.
 Всі обчислення виконуються в режимі реального часу.
+
+Показники описані декларативним графом (METRICS): кожен оголошує свої входи —
+сирі дані клієнта або інші показники. MetricGraph обчислює лише залежності
+запитаного показника і запам'ятовує результат для кожного набору входів, тож
+спільні проміжні значення (ІМТ, BMR) рахуються один раз. Вкладка фізичних
+параметрів, промт для АІ та FitnessCalculator користуються одним графом.
 """
 
 import math
-from typing import Dict, Any, Optional
+from datetime import date
+from typing import Dict, Any, Optional, Callable, FrozenSet, Iterable, Tuple
+
+
+# Сирі входи графа; все інше в METRICS — похідні показники
+RAW_INPUTS = ('weight', 'height', 'age', 'gender', 'activity_level', 'hr_rest')
+
+# Скільки наборів входів пам'ятати для кожного показника
+METRIC_CACHE_SIZE = 256
+
+ACTIVITY_MULTIPLIERS = {
+    "sedentary": 1.2,       # Сидячий спосіб життя
+    "lightly_active": 1.375, # Легка активність 1-3 дні/тиждень
+    "moderately_active": 1.55, # Помірна активність 3-5 днів/тиждень
+    "very_active": 1.725,   # Інтенсивна активність 6-7 днів/тиждень
+    "extra_active": 1.9     # Дуже інтенсивна активність
+}
+
+# Рівні активності з вкладки способу життя → ключі ACTIVITY_MULTIPLIERS
+ACTIVITY_LEVELS = {
+    "Сидячий спосіб життя": "sedentary",
+    "Малоактивний": "lightly_active",
+    "Помірно активний": "moderately_active",
+    "Активний": "very_active",
+    "Дуже активний": "extra_active",
+}
+
+
+def _is_male(gender: str) -> bool:
+    return gender.lower() in ['чоловік', 'male', 'м']
+
+
+# ===== ФОРМУЛИ (вузли графа) =====
+
+def _bmi(weight: Optional[float], height: Optional[float]) -> Optional[float]:
+    """BMI = вага(кг) / (зріст(м))²"""
+    if not weight or not height or weight <= 0 or height <= 0:
+        return None
+    
+    height_m = height / 100  # Конвертуємо см в метри
+    return round(weight / (height_m ** 2), 1)
+
+
+def _bmi_category(bmi: Optional[float]) -> str:
+    """Категорія BMI"""
+    if not bmi:
+        return "Не визначено"
+    
+    if bmi < 18.5:
+        return "Недостатня вага"
+    elif 18.5 <= bmi < 25:
+        return "Нормальна вага"
+    elif 25 <= bmi < 30:
+        return "Надмірна вага"
+    else:
+        return "Ожиріння"
+
+
+def _body_fat_percentage(bmi: Optional[float], age: Optional[int], gender: Optional[str]) -> Optional[float]:
+    """Відсоток жиру в тілі за формулою Deurenberg (з уже обчисленого ІМТ)"""
+    if not bmi or not age or not gender or age <= 0:
+        return None
+    
+    # Формула Deurenberg
+    if _is_male(gender):
+        body_fat = (1.20 * bmi) + (0.23 * age) - 16.2
+    else:  # жінка
+        body_fat = (1.20 * bmi) + (0.23 * age) - 5.4
+    
+    return max(0, round(body_fat, 1))
+
+
+def _ideal_weight(height: Optional[float], gender: Optional[str]) -> Optional[float]:
+    """Ідеальна вага за формулою Devine"""
+    if not height or not gender or height <= 0:
+        return None
+    
+    height_inches = height / 2.54  # Конвертуємо см в дюйми
+    
+    if _is_male(gender):
+        # Чоловіки: 50 кг + 2.3 кг на кожен дюйм понад 5 футів
+        ideal_weight = 50 + 2.3 * max(0, height_inches - 60)
+    else:  # жінка
+        # Жінки: 45.5 кг + 2.3 кг на кожен дюйм понад 5 футів
+        ideal_weight = 45.5 + 2.3 * max(0, height_inches - 60)
+    
+    return round(ideal_weight, 1)
+
+
+def _bmr(weight: Optional[float], height: Optional[float], age: Optional[int],
+         gender: Optional[str]) -> Optional[float]:
+    """Базальний метаболізм (BMR) за формулою Harris-Benedict"""
+    if not all([weight, height, age, gender]) or weight <= 0 or height <= 0 or age <= 0:
+        return None
+    
+    if _is_male(gender):
+        bmr = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
+    else:  # жінка
+        bmr = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
+    
+    return round(bmr, 0)
+
+
+def _daily_calories(bmr: Optional[float], activity_level: Optional[str]) -> Optional[float]:
+    """Денні калорії з урахуванням активності"""
+    if not bmr:
+        return None
+    
+    multiplier = ACTIVITY_MULTIPLIERS.get(activity_level, 1.2)
+    return round(bmr * multiplier, 0)
+
+
+def _daily_calories_detailed(daily_calories: Optional[float], bmr: Optional[float],
+                             activity_level: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Денні калорії з варіантами для різних цілей"""
+    if not daily_calories:
+        return None
+    
+    # Для різних цілей
+    weight_loss = round(daily_calories * 0.8, 0)  # -20%
+    weight_gain = round(daily_calories * 1.2, 0)  # +20%
+    
+    return {
+        'maintenance': int(daily_calories),
+        'weight_loss': int(weight_loss),
+        'weight_gain': int(weight_gain),
+        'activity_level': activity_level,
+        'bmr': int(bmr)
+    }
+
+
+def _water_intake(weight: Optional[float]) -> Optional[float]:
+    """Денна норма води (літри): 35 мл на кг ваги"""
+    if not weight or weight <= 0:
+        return None
+    
+    water_ml = weight * 35
+    return round(water_ml / 1000, 1)  # Конвертуємо в літри
+
+
+def _muscle_mass(weight: Optional[float], height: Optional[float], age: Optional[int],
+                 gender: Optional[str]) -> Optional[Dict[str, Any]]:
+    """М'язова маса за формулою Janssen"""
+    if not all([weight, height, age, gender]) or weight <= 0 or height <= 0 or age <= 0:
+        return None
+    
+    # Формула Janssen
+    if _is_male(gender):
+        muscle_mass = (0.407 * weight) + (0.267 * height) - (0.049 * age) + 2.513
+    else:  # жінка
+        muscle_mass = (0.252 * weight) + (0.473 * height) - (0.048 * age) + 2.513
+    
+    muscle_mass = max(0, round(muscle_mass, 1))
+    muscle_percentage = round((muscle_mass / weight) * 100, 1) if weight > 0 else 0
+    
+    # Категорії м'язової маси
+    if _is_male(gender):
+        if muscle_percentage < 38:
+            category = "Низький"
+            color = "#EF4444"
+        elif muscle_percentage < 44:
+            category = "Нормальний"
+            color = "#10B981"
+        else:
+            category = "Високий"
+            color = "#3B82F6"
+    else:  # жінка
+        if muscle_percentage < 31:
+            category = "Низький"
+            color = "#EF4444"
+        elif muscle_percentage < 36:
+            category = "Нормальний"
+            color = "#10B981"
+        else:
+            category = "Високий"
+            color = "#3B82F6"
+    
+    return {
+        'mass_kg': muscle_mass,
+        'percentage': muscle_percentage,
+        'category': category,
+        'color': color
+    }
+
+
+def _body_type(bmi: Optional[float], body_fat: Optional[float]) -> Optional[Dict[str, Any]]:
+    """Тип тілобудови (соматотип) на основі ІМТ та жирового відсотка"""
+    if not bmi:
+        return None
+    
+    if bmi < 22 and (not body_fat or body_fat < 15):
+        somatotype = "Ектоморф"
+        description = "Тонке, худе тіло з вузькими кістками та низьким рівнем жиру. Метаболізм швидкий, важко набирати вагу, особливо м'язову масу."
+        color = "#3B82F6"  # Блакитний
+    elif 22 <= bmi <= 26 and (not body_fat or 15 <= body_fat <= 20):
+        somatotype = "Мезоморф"
+        description = "Атлетичне, мускулисте тіло з широкими плечима і вузькою талією. Метаболізм середній, легко нарощують м'язи, баланс між м'язовою масою і жиром."
+        color = "#10B981"  # Зелений
+    else:
+        somatotype = "Ендоморф"
+        description = "Широка кісткова структура, схильність до набору жиру. Метаболізм повільний, легко набирають вагу, мають труднощі з її втратою."
+        color = "#EF4444"  # Червоний
+    
+    return {
+        'type': somatotype,
+        'description': description,
+        'color': color
+    }
+
+
+def _heart_rate_status(hr_rest: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Оцінка статусу ЧСС у спокої (загальні норми)"""
+    if not hr_rest or hr_rest <= 0:
+        return None
+    
+    if hr_rest < 50:
+        status = "❄️ Занадто низький"
+        color = "#EF4444"
+        description = "Може вимагати консультації лікаря"
+    elif hr_rest < 60:
+        status = "📉 Низький"
+        color = "#F59E0B"
+        description = "Часто у добре тренованих людей"
+    elif hr_rest <= 80:
+        status = "✅ Оптимальний"
+        color = "#10B981"
+        description = "Найкращі показники для здоров'я та фітнесу"
+    elif hr_rest <= 90:
+        status = "📈 Підвищений"
+        color = "#F59E0B"
+        description = "Може вказувати на низьку фізичну активність або стрес"
+    else:
+        status = "🔥 Високий"
+        color = "#EF4444"
+        description = "Ризик для здоров'я, може вимагати консультації лікаря"
+    
+    return {
+        'status': status,
+        'color': color,
+        'description': description,
+        'value': hr_rest
+    }
+
+
+def _heart_rate_zones(age: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Пульсові зони тренувань"""
+    if not age or age <= 0:
+        return None
+    
+    max_hr = 220 - age
+    
+    return {
+        'max_hr': max_hr,
+        'recovery': {
+            'name': '😌 ВІДНОВЛЕННЯ',
+            'percentage': '40-50%',
+            'range': f"{int(max_hr * 0.4)} - {int(max_hr * 0.5)}",
+            'color': '#10B981'
+        },
+        'fat_burn': {
+            'name': '🔥 ЖИРОСПАЛЮВАННЯ',
+            'percentage': '60-70%',
+            'range': f"{int(max_hr * 0.6)} - {int(max_hr * 0.7)}",
+            'color': '#F59E0B'
+        },
+        'aerobic': {
+            'name': '🏃 АЕРОБНА',
+            'percentage': '70-80%',
+            'range': f"{int(max_hr * 0.7)} - {int(max_hr * 0.8)}",
+            'color': '#3B82F6'
+        },
+        'anaerobic': {
+            'name': '⚡ АНАЕРОБНА',
+            'percentage': '80-90%',
+            'range': f"{int(max_hr * 0.8)} - {int(max_hr * 0.9)}",
+            'color': '#8B5CF6'
+        },
+        'maximum': {
+            'name': '🔥 МАКСИМАЛЬНА',
+            'percentage': '90-100%',
+            'range': f"{int(max_hr * 0.9)} - {max_hr}",
+            'color': '#EF4444'
+        }
+    }
+
+
+# Показник → (входи в порядку аргументів формули, формула). Вхід — сире значення з RAW_INPUTS або інший показник
+METRICS: Dict[str, Tuple[Tuple[str, ...], Callable]] = {
+    'bmi': (('weight', 'height'), _bmi),
+    'bmi_category': (('bmi',), _bmi_category),
+    'body_fat_percentage': (('bmi', 'age', 'gender'), _body_fat_percentage),
+    'ideal_weight': (('height', 'gender'), _ideal_weight),
+    'bmr': (('weight', 'height', 'age', 'gender'), _bmr),
+    'daily_calories': (('bmr', 'activity_level'), _daily_calories),
+    'daily_calories_detailed': (('daily_calories', 'bmr', 'activity_level'), _daily_calories_detailed),
+    'water_intake': (('weight',), _water_intake),
+    'muscle_mass': (('weight', 'height', 'age', 'gender'), _muscle_mass),
+    'body_type': (('bmi', 'body_fat_percentage'), _body_type),
+    'hr_status': (('hr_rest',), _heart_rate_status),
+    'hr_zones': (('age',), _heart_rate_zones),
+}
+
+
+class MetricGraph:
+    """Обчислення показників за графом залежностей з пам'яттю результатів.
+    
+    Результат кожного показника запам'ятовується для кортежу значень його входів
+    (до METRIC_CACHE_SIZE записів, найстаріші витісняються), тож повторний запит
+    з тими самими даними не виконує формул. Запам'ятовані словники (muscle_mass,
+    hr_zones, ...) спільні для всіх викликів — їх не можна змінювати.
+    
+    У inputs можна передати і готове значення похідного показника (наприклад, 'bmr') —
+    тоді його формула не виконується.
+    """
+    
+    def __init__(self, metrics: Dict[str, Tuple[Tuple[str, ...], Callable]] = METRICS,
+                 cache_size: int = METRIC_CACHE_SIZE):
+        self.metrics = metrics
+        self.cache_size = cache_size
+        self._caches = {name: {} for name in metrics}
+        self._plans = {}
+        self._inputs_of = {}
+        self.evaluations = 0  # Скільки разів виконувались формули (для бенчмарків)
+    
+    def dependencies(self, name: str) -> Tuple[str, ...]:
+        """Безпосередні входи показника"""
+        return self.metrics[name][0]
+    
+    def inputs_of(self, *names: str) -> FrozenSet[str]:
+        """Сирі входи, від яких (транзитивно) залежать показники"""
+        result = set()
+        for name in names:
+            if name not in self._inputs_of:
+                if name not in self.metrics:
+                    self._inputs_of[name] = frozenset((name,))
+                else:
+                    self._inputs_of[name] = frozenset().union(
+                        *(self.inputs_of(dependency) for dependency in self.dependencies(name)))
+            result |= self._inputs_of[name]
+        return frozenset(result)
+    
+    def evaluate(self, name: str, inputs: Dict[str, Any]) -> Any:
+        """Значення одного показника; виконуються лише формули його залежностей"""
+        return self._run((name,), inputs)[name]
+    
+    def evaluate_many(self, names: Iterable[str], inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Значення кількох показників зі спільними проміжними результатами"""
+        names = tuple(names)
+        values = self._run(names, inputs)
+        return {name: values.get(name) for name in names}
+    
+    def clear(self):
+        """Очищає пам'ять результатів"""
+        for cache in self._caches.values():
+            cache.clear()
+    
+    def _plan(self, names: Tuple[str, ...]):
+        """Потрібні показники в порядку залежностей (топологічне сортування, запам'ятовується)"""
+        plan = self._plans.get(names)
+        if plan is None:
+            plan = []
+            
+            def visit(name):
+                if name not in self.metrics or name in plan:
+                    return
+                for dependency in self.dependencies(name):
+                    visit(dependency)
+                plan.append(name)
+            
+            for name in names:
+                visit(name)
+            plan = self._plans[names] = tuple((name, *self.metrics[name], self._caches[name]) for name in plan)
+        return plan
+    
+    def _run(self, names: Tuple[str, ...], inputs: Dict[str, Any]) -> Dict[str, Any]:
+        values = dict(inputs)
+        for name, depends_on, formula, cache in self._plan(names):
+            if name in inputs:
+                continue
+            
+            arguments = tuple([values.get(dependency) for dependency in depends_on])
+            try:
+                value = cache.get(arguments, _MISSING)
+            except TypeError:  # Нехешовані входи — рахуємо без пам'яті
+                value = formula(*arguments)
+                self.evaluations += 1
+            else:
+                if value is _MISSING:
+                    value = formula(*arguments)
+                    self.evaluations += 1
+                    if len(cache) >= self.cache_size:
+                        del cache[next(iter(cache))]
+                    cache[arguments] = value
+            values[name] = value
+        return values
+
+
+_MISSING = object()
+
+
+_metric_graph: Optional[MetricGraph] = None
+
+
+def get_metric_graph() -> MetricGraph:
+    """Спільний граф показників програми"""
+    global _metric_graph
+    if _metric_graph is None:
+        _metric_graph = MetricGraph()
+    return _metric_graph
+
+
+def normalize_inputs(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Сирі входи графа з довільного словника (перетворення в правильні типи)"""
+    weight = data.get('weight')
+    height = data.get('height')
+    age = data.get('age')
+    hr_rest = data.get('hr_rest')
+    
+    try:
+        weight = float(weight) if weight else None
+        height = float(height) if height else None
+        age = int(age) if age else None
+        hr_rest = int(hr_rest) if hr_rest else None
+    except (ValueError, TypeError):
+        weight = height = age = hr_rest = None
+    
+    return {
+        'weight': weight,
+        'height': height,
+        'age': age,
+        'gender': data.get('gender'),
+        'activity_level': data.get('activity_level', 'sedentary'),
+        'hr_rest': hr_rest,
+    }
+
+
+def client_metric_inputs(client_data: Dict[str, Any], today: Optional[date] = None) -> Dict[str, Any]:
+    """Входи графа зі збереженого запису клієнта (поля вкладок редагування)"""
+    age = None
+    birth_date = client_data.get('birth_date') or ''
+    if birth_date and birth_date != "1900-01-01":  # 1900-01-01 — дата не введена
+        try:
+            born = date.fromisoformat(birth_date)
+            today = today or date.today()
+            age = today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+        except ValueError:
+            pass
+    
+    return normalize_inputs({
+        'weight': client_data.get('weight'),
+        'height': client_data.get('height'),
+        'age': age,
+        'gender': client_data.get('gender') or None,
+        'activity_level': ACTIVITY_LEVELS.get(client_data.get('activity_level'), 'sedentary'),
+        'hr_rest': client_data.get('heart_rate'),
+    })
 
 
 class FitnessCalculator:
-    """Клас для автоматичних обчислень фітнес-показників"""
+    """Клас для автоматичних обчислень фітнес-показників (обгортки над графом показників)"""
     
     @staticmethod
     def calculate_bmi(weight: Optional[float], height: Optional[float]) -> Optional[float]:
@@ -16,109 +477,52 @@ class FitnessCalculator:
         Розрахунок індексу маси тіла (BMI)
         BMI = вага(кг) / (зріст(м))²
         """
-        if not weight or not height or weight <= 0 or height <= 0:
-            return None
-        
-        height_m = height / 100  # Конвертуємо см в метри
-        return round(weight / (height_m ** 2), 1)
+        return get_metric_graph().evaluate('bmi', {'weight': weight, 'height': height})
     
     @staticmethod
     def get_bmi_category(bmi: Optional[float]) -> str:
         """Категорія BMI"""
-        if not bmi:
-            return "Не визначено"
-        
-        if bmi < 18.5:
-            return "Недостатня вага"
-        elif 18.5 <= bmi < 25:
-            return "Нормальна вага"
-        elif 25 <= bmi < 30:
-            return "Надмірна вага"
-        else:
-            return "Ожиріння"
+        return get_metric_graph().evaluate('bmi_category', {'bmi': bmi})
     
     @staticmethod
     def calculate_body_fat_percentage(
-        weight: Optional[float], 
-        height: Optional[float], 
-        age: Optional[int], 
+        weight: Optional[float],
+        height: Optional[float],
+        age: Optional[int],
         gender: Optional[str]
     ) -> Optional[float]:
         """
         Розрахунок відсотка жиру в тілі за формулою Deurenberg
         """
-        if not all([weight, height, age, gender]) or weight <= 0 or height <= 0 or age <= 0:
-            return None
-        
-        bmi = FitnessCalculator.calculate_bmi(weight, height)
-        if not bmi:
-            return None
-        
-        # Формула Deurenberg
-        if gender.lower() in ['чоловік', 'male', 'м']:
-            body_fat = (1.20 * bmi) + (0.23 * age) - 16.2
-        else:  # жінка
-            body_fat = (1.20 * bmi) + (0.23 * age) - 5.4
-        
-        return max(0, round(body_fat, 1))
+        return get_metric_graph().evaluate(
+            'body_fat_percentage', {'weight': weight, 'height': height, 'age': age, 'gender': gender})
     
     @staticmethod
     def calculate_ideal_weight(height: Optional[float], gender: Optional[str]) -> Optional[float]:
         """
         Розрахунок ідеальної ваги за формулою Devine
         """
-        if not height or not gender or height <= 0:
-            return None
-        
-        height_inches = height / 2.54  # Конвертуємо см в дюйми
-        
-        if gender.lower() in ['чоловік', 'male', 'м']:
-            # Чоловіки: 50 кг + 2.3 кг на кожен дюйм понад 5 футів
-            ideal_weight = 50 + 2.3 * max(0, height_inches - 60)
-        else:  # жінка
-            # Жінки: 45.5 кг + 2.3 кг на кожен дюйм понад 5 футів
-            ideal_weight = 45.5 + 2.3 * max(0, height_inches - 60)
-        
-        return round(ideal_weight, 1)
+        return get_metric_graph().evaluate('ideal_weight', {'height': height, 'gender': gender})
     
     @staticmethod
     def calculate_bmr(
-        weight: Optional[float], 
-        height: Optional[float], 
-        age: Optional[int], 
+        weight: Optional[float],
+        height: Optional[float],
+        age: Optional[int],
         gender: Optional[str]
     ) -> Optional[float]:
         """
         Базальний метаболізм (BMR) за формулою Harris-Benedict
         """
-        if not all([weight, height, age, gender]) or weight <= 0 or height <= 0 or age <= 0:
-            return None
-        
-        if gender.lower() in ['чоловік', 'male', 'м']:
-            bmr = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
-        else:  # жінка
-            bmr = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
-        
-        return round(bmr, 0)
+        return get_metric_graph().evaluate(
+            'bmr', {'weight': weight, 'height': height, 'age': age, 'gender': gender})
     
     @staticmethod
     def calculate_daily_calories(bmr: Optional[float], activity_level: str = "sedentary") -> Optional[float]:
         """
         Розрахунок денних калорій з урахуванням активності
         """
-        if not bmr:
-            return None
-        
-        activity_multipliers = {
-            "sedentary": 1.2,       # Сидячий спосіб життя
-            "lightly_active": 1.375, # Легка активність 1-3 дні/тиждень
-            "moderately_active": 1.55, # Помірна активність 3-5 днів/тиждень
-            "very_active": 1.725,   # Інтенсивна активність 6-7 днів/тиждень
-            "extra_active": 1.9     # Дуже інтенсивна активність
-        }
-        
-        multiplier = activity_multipliers.get(activity_level, 1.2)
-        return round(bmr * multiplier, 0)
+        return get_metric_graph().evaluate('daily_calories', {'bmr': bmr, 'activity_level': activity_level})
     
     @staticmethod
     def calculate_water_intake(weight: Optional[float]) -> Optional[float]:
@@ -126,272 +530,73 @@ class FitnessCalculator:
         Розрахунок денної норми води (літри)
         Формула: 35 мл на кг ваги
         """
-        if not weight or weight <= 0:
-            return None
-        
-        water_ml = weight * 35
-        return round(water_ml / 1000, 1)  # Конвертуємо в літри
+        return get_metric_graph().evaluate('water_intake', {'weight': weight})
     
     @staticmethod
     def calculate_muscle_mass(
-        weight: Optional[float], 
-        height: Optional[float], 
-        age: Optional[int], 
+        weight: Optional[float],
+        height: Optional[float],
+        age: Optional[int],
         gender: Optional[str]
     ) -> Optional[Dict[str, Any]]:
         """
         Розрахунок м'язової маси за формулою Janssen
         """
-        if not all([weight, height, age, gender]) or weight <= 0 or height <= 0 or age <= 0:
-            return None
-        
-        height_m = height / 100
-        
-        # Формула Janssen
-        if gender.lower() in ['чоловік', 'male', 'м']:
-            muscle_mass = (0.407 * weight) + (0.267 * height) - (0.049 * age) + 2.513
-        else:  # жінка
-            muscle_mass = (0.252 * weight) + (0.473 * height) - (0.048 * age) + 2.513
-        
-        muscle_mass = max(0, round(muscle_mass, 1))
-        muscle_percentage = round((muscle_mass / weight) * 100, 1) if weight > 0 else 0
-        
-        # Категорії м'язової маси
-        if gender.lower() in ['чоловік', 'male', 'м']:
-            if muscle_percentage < 38:
-                category = "Низький"
-                color = "#EF4444"
-            elif muscle_percentage < 44:
-                category = "Нормальний" 
-                color = "#10B981"
-            else:
-                category = "Високий"
-                color = "#3B82F6"
-        else:  # жінка
-            if muscle_percentage < 31:
-                category = "Низький"
-                color = "#EF4444"
-            elif muscle_percentage < 36:
-                category = "Нормальний"
-                color = "#10B981"
-            else:
-                category = "Високий"
-                color = "#3B82F6"
-        
-        return {
-            'mass_kg': muscle_mass,
-            'percentage': muscle_percentage,
-            'category': category,
-            'color': color
-        }
+        return get_metric_graph().evaluate(
+            'muscle_mass', {'weight': weight, 'height': height, 'age': age, 'gender': gender})
     
     @staticmethod
     def calculate_body_type(
-        weight: Optional[float], 
-        height: Optional[float], 
-        age: Optional[int], 
+        weight: Optional[float],
+        height: Optional[float],
+        age: Optional[int],
         gender: Optional[str]
     ) -> Optional[Dict[str, Any]]:
         """
         Визначення типу тілобудови (соматотип)
         """
-        if not all([weight, height]) or weight <= 0 or height <= 0:
-            return None
-        
-        bmi = FitnessCalculator.calculate_bmi(weight, height)
-        if not bmi:
-            return None
-        
-        body_fat = FitnessCalculator.calculate_body_fat_percentage(weight, height, age, gender)
-        
-        # Визначення соматотипу на основі ІМТ та жирового відсотка
-        if bmi < 22 and (not body_fat or body_fat < 15):
-            somatotype = "Ектоморф"
-            description = "Тонке, худе тіло з вузькими кістками та низьким рівнем жиру. Метаболізм швидкий, важко набирати вагу, особливо м'язову масу."
-            color = "#3B82F6"  # Блакитний
-        elif 22 <= bmi <= 26 and (not body_fat or 15 <= body_fat <= 20):
-            somatotype = "Мезоморф"
-            description = "Атлетичне, мускулисте тіло з широкими плечима і вузькою талією. Метаболізм середній, легко нарощують м'язи, баланс між м'язовою масою і жиром."
-            color = "#10B981"  # Зелений
-        else:
-            somatotype = "Ендоморф"
-            description = "Широка кісткова структура, схильність до набору жиру. Метаболізм повільний, легко набирають вагу, мають труднощі з її втратою."
-            color = "#EF4444"  # Червоний
-        
-        return {
-            'type': somatotype,
-            'description': description,
-            'color': color
-        }
+        return get_metric_graph().evaluate(
+            'body_type', {'weight': weight, 'height': height, 'age': age, 'gender': gender})
     
     @staticmethod
     def calculate_heart_rate_status(hr_rest: Optional[int], age: Optional[int]) -> Optional[Dict[str, Any]]:
         """
         Оцінка статусу ЧСС у спокої
         """
-        if not hr_rest or hr_rest <= 0:
-            return None
-        
-        # Загальні норми ЧСС у спокої
-        if hr_rest < 50:
-            status = "❄️ Занадто низький"
-            color = "#EF4444"
-            description = "Може вимагати консультації лікаря"
-        elif hr_rest < 60:
-            status = "📉 Низький"
-            color = "#F59E0B"
-            description = "Часто у добре тренованих людей"
-        elif hr_rest <= 80:
-            status = "✅ Оптимальний"
-            color = "#10B981"
-            description = "Найкращі показники для здоров'я та фітнесу"
-        elif hr_rest <= 90:
-            status = "📈 Підвищений"
-            color = "#F59E0B"
-            description = "Може вказувати на низьку фізичну активність або стрес"
-        else:
-            status = "🔥 Високий"
-            color = "#EF4444"
-            description = "Ризик для здоров'я, може вимагати консультації лікаря"
-        
-        return {
-            'status': status,
-            'color': color,
-            'description': description,
-            'value': hr_rest
-        }
+        return get_metric_graph().evaluate('hr_status', {'hr_rest': hr_rest, 'age': age})
     
     @staticmethod
     def calculate_heart_rate_zones(age: Optional[int]) -> Optional[Dict[str, Any]]:
         """
         Розрахунок пульсових зон тренувань
         """
-        if not age or age <= 0:
-            return None
-        
-        max_hr = 220 - age
-        
-        zones = {
-            'max_hr': max_hr,
-            'recovery': {
-                'name': '😌 ВІДНОВЛЕННЯ',
-                'percentage': '40-50%',
-                'range': f"{int(max_hr * 0.4)} - {int(max_hr * 0.5)}",
-                'color': '#10B981'
-            },
-            'fat_burn': {
-                'name': '🔥 ЖИРОСПАЛЮВАННЯ',
-                'percentage': '60-70%',
-                'range': f"{int(max_hr * 0.6)} - {int(max_hr * 0.7)}",
-                'color': '#F59E0B'
-            },
-            'aerobic': {
-                'name': '🏃 АЕРОБНА',
-                'percentage': '70-80%',
-                'range': f"{int(max_hr * 0.7)} - {int(max_hr * 0.8)}",
-                'color': '#3B82F6'
-            },
-            'anaerobic': {
-                'name': '⚡ АНАЕРОБНА', 
-                'percentage': '80-90%',
-                'range': f"{int(max_hr * 0.8)} - {int(max_hr * 0.9)}",
-                'color': '#8B5CF6'
-            },
-            'maximum': {
-                'name': '🔥 МАКСИМАЛЬНА',
-                'percentage': '90-100%',
-                'range': f"{int(max_hr * 0.9)} - {max_hr}",
-                'color': '#EF4444'
-            }
-        }
-        
-        return zones
+        return get_metric_graph().evaluate('hr_zones', {'age': age})
     
     @staticmethod
     def calculate_daily_calories_detailed(
-        bmr: Optional[float], 
+        bmr: Optional[float],
         activity_level: str = "sedentary"
     ) -> Optional[Dict[str, Any]]:
         """
         Детальний розрахунок денних калорій з варіантами для різних цілей
         """
-        if not bmr:
-            return None
-        
-        activity_multipliers = {
-            "sedentary": 1.2,
-            "lightly_active": 1.375,
-            "moderately_active": 1.55,
-            "very_active": 1.725,
-            "extra_active": 1.9
-        }
-        
-        multiplier = activity_multipliers.get(activity_level, 1.2)
-        maintenance = round(bmr * multiplier, 0)
-        
-        # Для різних цілей
-        weight_loss = round(maintenance * 0.8, 0)  # -20%
-        weight_gain = round(maintenance * 1.2, 0)  # +20%
-        
-        return {
-            'maintenance': int(maintenance),
-            'weight_loss': int(weight_loss),
-            'weight_gain': int(weight_gain),
-            'activity_level': activity_level,
-            'bmr': int(bmr)
-        }
+        return get_metric_graph().evaluate(
+            'daily_calories_detailed', {'bmr': bmr, 'activity_level': activity_level})
     
     @staticmethod
     def calculate_all_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Розрахунок всіх показників одночасно
         """
-        weight = data.get('weight')
-        height = data.get('height')
-        age = data.get('age')
-        gender = data.get('gender')
-        activity_level = data.get('activity_level', 'sedentary')
-        hr_rest = data.get('hr_rest')
-        
-        # Перетворюємо значення в правильні типи
-        try:
-            weight = float(weight) if weight else None
-            height = float(height) if height else None
-            age = int(age) if age else None
-            hr_rest = int(hr_rest) if hr_rest else None
-        except (ValueError, TypeError):
-            weight = height = age = hr_rest = None
-        
-        # Основні розрахунки
-        bmi = FitnessCalculator.calculate_bmi(weight, height)
-        bmi_category = FitnessCalculator.get_bmi_category(bmi)
-        body_fat = FitnessCalculator.calculate_body_fat_percentage(weight, height, age, gender)
-        ideal_weight = FitnessCalculator.calculate_ideal_weight(height, gender)
-        bmr = FitnessCalculator.calculate_bmr(weight, height, age, gender)
-        daily_calories = FitnessCalculator.calculate_daily_calories(bmr, activity_level)
-        daily_calories_detailed = FitnessCalculator.calculate_daily_calories_detailed(bmr, activity_level)
-        water_intake = FitnessCalculator.calculate_water_intake(weight)
-        
-        # Додаткові розрахунки
-        muscle_mass = FitnessCalculator.calculate_muscle_mass(weight, height, age, gender)
-        body_type = FitnessCalculator.calculate_body_type(weight, height, age, gender)
-        hr_status = FitnessCalculator.calculate_heart_rate_status(hr_rest, age)
-        hr_zones = FitnessCalculator.calculate_heart_rate_zones(age)
-        
-        return {
-            'bmi': bmi,
-            'bmi_category': bmi_category,
-            'body_fat_percentage': body_fat,
-            'ideal_weight': ideal_weight,
-            'bmr': bmr,
-            'daily_calories': daily_calories,
-            'daily_calories_detailed': daily_calories_detailed,
-            'water_intake': water_intake,
-            'muscle_mass': muscle_mass,
-            'body_type': body_type,
-            'hr_status': hr_status,
-            'hr_zones': hr_zones
-        }
+        return get_metric_graph().evaluate_many(METRICS, normalize_inputs(data))
+    
+    @staticmethod
+    def calculate_all_metrics_batch(data, categories: bool = False):
+        """
+        Векторизований розрахунок числових показників для стовпців (словник масивів або DataFrame)
+        """
+        from utils.metrics_batch import calculate_metrics_batch  # NumPy лише за потреби
+        return calculate_metrics_batch(data, categories)
 
 
 # Функції для зворотної сумісності
@@ -406,9 +611,9 @@ def get_bmi_category(bmi: Optional[float]) -> str:
 
 
 def calculate_body_fat_percentage(
-    weight: Optional[float], 
-    height: Optional[float], 
-    age: Optional[int], 
+    weight: Optional[float],
+    height: Optional[float],
+    age: Optional[int],
     gender: Optional[str]
 ) -> Optional[float]:
     """Обгортка для статичного методу"""
@@ -421,9 +626,9 @@ def calculate_ideal_weight(height: Optional[float], gender: Optional[str]) -> Op
 
 
 def calculate_bmr(
-    weight: Optional[float], 
-    height: Optional[float], 
-    age: Optional[int], 
+    weight: Optional[float],
+    height: Optional[float],
+    age: Optional[int],
     gender: Optional[str]
 ) -> Optional[float]:
     """Обгортка для статичного методу"""
@@ -0,0 +1,47 @@
+# utils/file_utils.py
+"""Безпечний запис файлів: тимчасовий файл поруч та атомарна заміна"""
+import json
+import os
+import tempfile
+from typing import Any
+
+
+def atomic_write_bytes(path: str, data: bytes, fsync: bool = True):
+    """Записує файл так, що після збою на диску лишається або старий, або новий вміст.
+
+    Дані пишуться у тимчасовий файл у тій самій папці й підміняють ціль через os.replace.
+    fsync=False — без примусового скидання на диск (для масових записів, де втрата
+    останніх файлів при збої живлення не критична).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(prefix='.tmp-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    if fsync and hasattr(os, 'O_DIRECTORY'):
+        # Запис про перейменування теж має потрапити на диск (POSIX)
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def atomic_write_json(path: str, data: Any, fsync: bool = True, **dump_kwargs):
+    """json.dump у файл з атомарною заміною (див. atomic_write_bytes)"""
+    dump_kwargs.setdefault('ensure_ascii', False)
+    text = json.dumps(data, **dump_kwargs)
+    atomic_write_bytes(path, text.encode('utf-8'), fsync)
@@ -0,0 +1,148 @@
+# utils/image_loader.py
+"""Асинхронне декодування фото у QThreadPool з доставкою результату в GUI-потік"""
+import itertools
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import shiboken6
+from PySide6.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader
+
+
+def decode_image(photo_path: str, max_size: Optional[QSize] = None) -> Optional[QImage]:
+    """Декодує файл у QImage (безпечно поза GUI-потоком).
+
+    max_size — вписати у розмір; JPEG декодується одразу зменшеним.
+    """
+    reader = QImageReader(photo_path)
+    if max_size is not None:
+        source_size = reader.size()
+        if source_size.isValid():
+            scaled_size = source_size.scaled(max_size, Qt.KeepAspectRatio)
+            if scaled_size.width() < source_size.width():
+                reader.setScaledSize(scaled_size)
+
+    image = reader.read()
+    return None if image.isNull() else image
+
+
+class _LoadSignals(QObject):
+    """Живе в GUI-потоці, тому результат з робочого потоку приходить через чергу подій"""
+    finished = Signal(int, object)  # (номер запиту, результат або None)
+
+
+class _LoadTask(QRunnable):
+    """Одне декодування у робочому потоці"""
+
+    def __init__(self, token: int, decode: Callable[[], Any], cancelled: threading.Event,
+                 signals: _LoadSignals):
+        super().__init__()
+        self.token = token
+        self.decode = decode
+        self.cancelled = cancelled
+        self.signals = signals
+
+    def run(self):
+        # Скасований запит (картку закрито або прокручено) навіть не декодується
+        if self.cancelled.is_set():
+            return
+
+        try:
+            result = self.decode()
+        except Exception as e:
+            print(f"❌ Помилка декодування фото: {e}")
+            result = None
+
+        if not self.cancelled.is_set():
+            self.signals.finished.emit(self.token, result)
+
+
+class _Request:
+    """Активний запит: колбек, власник та прапорець скасування"""
+    __slots__ = ('callback', 'owner', 'cancelled', 'connection')
+
+    def __init__(self, callback, owner, cancelled, connection):
+        self.callback = callback
+        self.owner = owner
+        self.cancelled = cancelled
+        self.connection = connection
+
+
+class AsyncImageLoader(QObject):
+    """Декодує зображення у пулі потоків і викликає колбек у GUI-потоці.
+
+    Запит скасовується явно (cancel) або автоматично, коли знищено його власника.
+    """
+
+    def __init__(self, max_threads: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        # Один потік лишаємо для фонових мініатюр та GUI
+        self._pool.setMaxThreadCount(max_threads or max(2, (os.cpu_count() or 2) - 1))
+        self._signals = _LoadSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._requests: Dict[int, _Request] = {}
+        self._tokens = itertools.count(1)
+
+    def load(self, decode: Callable[[], Any], callback: Callable[[Any], None],
+             owner: Optional[QObject] = None) -> int:
+        """Запускає decode() у робочому потоці; callback(результат) викликається в GUI-потоці.
+
+        Повертає номер запиту для cancel().
+        """
+        token = next(self._tokens)
+        cancelled = threading.Event()
+        connection = None
+        if owner is not None:
+            connection = owner.destroyed.connect(lambda *_, t=token: self.cancel(t))
+
+        self._requests[token] = _Request(callback, owner, cancelled, connection)
+        self._pool.start(_LoadTask(token, decode, cancelled, self._signals))
+        return token
+
+    def load_image(self, photo_path: str, callback: Callable[[Optional[QImage]], None],
+                   owner: Optional[QObject] = None, max_size: Optional[QSize] = None) -> int:
+        """Асинхронно декодує файл у QImage (див. decode_image)"""
+        return self.load(lambda: decode_image(photo_path, max_size), callback, owner)
+
+    def cancel(self, token: Optional[int]):
+        """Скасовує запит: ще не запущене декодування пропускається, результат не доставляється"""
+        request = self._requests.pop(token, None) if token else None
+        if request is None:
+            return
+
+        request.cancelled.set()
+        self._disconnect_owner(request)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Чекає завершення всіх декодувань (для тестів та закриття програми)"""
+        return self._pool.waitForDone(msecs)
+
+    def _on_finished(self, token: int, result):
+        """Доставляє результат у GUI-потоці, якщо запит не скасовано"""
+        request = self._requests.pop(token, None)
+        if request is None or request.cancelled.is_set():
+            return
+
+        if request.owner is not None and not shiboken6.isValid(request.owner):
+            return
+        self._disconnect_owner(request)
+        request.callback(result)
+
+    @staticmethod
+    def _disconnect_owner(request: _Request):
+        if request.connection is not None and shiboken6.isValid(request.owner):
+            request.owner.disconnect(request.connection)
+
+
+# Глобальний завантажувач
+_image_loader: Optional[AsyncImageLoader] = None
+
+
+def get_image_loader() -> AsyncImageLoader:
+    """Спільний асинхронний завантажувач зображень"""
+    global _image_loader
+    if _image_loader is None:
+        _image_loader = AsyncImageLoader()
+    return _image_loader
@@ -0,0 +1,196 @@
+# utils/image_processor.py
+"""Обробка фото: корекції одним проходом NumPy та обмін буферами NumPy/PIL ↔ QImage без зайвих копій"""
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+if TYPE_CHECKING:  # PIL потрібен лише для pil_to_qimage, не імпортуємо його при старті
+    from PIL import Image
+
+
+# Ваги яскравості ITU-R 601-2 (як у PIL convert('L'))
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# Скільки рядків обробляється за раз (смуга вміщується в кеш процесора)
+STRIP_ROWS = 64
+
+# Ядро PIL ImageFilter.SMOOTH: центр 5, сусіди 1, ділиться на 13
+_SMOOTH_CENTER = 5.0 / 13.0
+_SMOOTH_NEIGHBOR = 1.0 / 13.0
+
+
+def is_identity(brightness: float = 1.0, contrast: float = 1.0,
+                saturation: float = 1.0, sharpness: float = 1.0) -> bool:
+    """Чи не змінюють коефіцієнти зображення"""
+    return brightness == 1.0 and contrast == 1.0 and saturation == 1.0 and sharpness == 1.0
+
+
+def image_mean_luma(rgb: np.ndarray, brightness: float = 1.0, step: int = 4) -> int:
+    """Середня яскравість (0-255) після корекції яскравості — опорна точка контрасту.
+
+    Рахується по кожному step-му пікселю: для середнього цього досить.
+    """
+    sample = rgb[::step, ::step].astype(np.float32)
+    luma = sample @ LUMA_WEIGHTS
+    if brightness != 1.0:
+        luma *= brightness
+        np.clip(luma, 0, 255, out=luma)
+    return int(luma.mean() + 0.5)
+
+
+def adjust_rgb(rgb: np.ndarray, brightness: float = 1.0, contrast: float = 1.0,
+               saturation: float = 1.0, sharpness: float = 1.0,
+               out: Optional[np.ndarray] = None, mean: Optional[int] = None) -> np.ndarray:
+    """Застосовує корекції до RGB-зображення uint8 (H, W, 3) за один прохід смугами.
+
+    Коефіцієнти мають той самий зміст, що й у PIL ImageEnhance (1.0 — без змін).
+    Яскравість, контраст і насиченість зводяться до одного афінного перетворення
+    пікселя, різкість — одна згортка 3x3 над результатом. Результат пишеться в out
+    (суцільний буфер uint8, придатний для QImage.Format_RGB888). mean — опорна яскравість
+    контрасту (image_mean_luma); задається, коли rgb — лише частина зображення.
+    """
+    if rgb.dtype != np.uint8 or rgb.ndim != 3 or rgb.shape[2] != 3:
+        raise ValueError("Очікується масив uint8 форми (H, W, 3)")
+
+    height, width = rgb.shape[:2]
+    if out is None:
+        out = np.empty((height, width, 3), dtype=np.uint8)
+
+    if is_identity(brightness, contrast, saturation, sharpness):
+        np.copyto(out, rgb)
+        return out
+
+    # x' = scale * (s * x + (1 - s) * L) + offset, де L — яскравість пікселя
+    if contrast == 1.0:
+        mean = 0
+    elif mean is None:
+        mean = image_mean_luma(rgb, brightness)
+    scale = brightness * contrast
+    offset = mean * (1.0 - contrast)
+
+    if sharpness == 1.0 or height < 3 or width < 3:
+        for y0 in range(0, height, STRIP_ROWS):
+            y1 = min(y0 + STRIP_ROWS, height)
+            _store(_color_strip(rgb[y0:y1], scale, offset, saturation), out[y0:y1])
+        return out
+
+    # Різкість: x'' = f * x' + (1 - f) * smooth(x'), краї залишаються без згортки (як у PIL)
+    center = sharpness + (1.0 - sharpness) * _SMOOTH_CENTER
+    neighbor = (1.0 - sharpness) * _SMOOTH_NEIGHBOR
+
+    for y0 in range(0, height, STRIP_ROWS):
+        y1 = min(y0 + STRIP_ROWS, height)
+        # Смуга з одним рядком запасу зверху та знизу для згортки
+        top, bottom = max(y0 - 1, 0), min(y1 + 1, height)
+        color = _color_strip(rgb[top:bottom], scale, offset, saturation)
+
+        # Сума 3x3 (центр включно): спершу по рядках, потім по стовпцях
+        rows = np.add(color[:-2], color[1:-1])
+        rows += color[2:]
+        box = np.add(rows[:, :-2], rows[:, 1:-1])
+        box += rows[:, 2:]
+        box *= neighbor
+
+        # Внутрішні пікселі змінюються на місці, краї смуги лишаються як є
+        inner = color[1:-1, 1:-1]
+        inner *= center - neighbor
+        inner += box
+
+        _store(color[y0 - top:y0 - top + (y1 - y0)], out[y0:y1])
+
+    return out
+
+
+def _color_strip(strip: np.ndarray, scale: float, offset: float, saturation: float) -> np.ndarray:
+    """Яскравість, контраст і насиченість для смуги (float32)"""
+    pixels = strip.astype(np.float32)
+    if saturation != 1.0:
+        luma = pixels @ LUMA_WEIGHTS
+        luma *= (1.0 - saturation) * scale
+        luma += offset
+        pixels *= saturation * scale
+        pixels += luma[..., None]
+    else:
+        pixels *= scale
+        pixels += offset
+    return pixels
+
+
+def _store(pixels: np.ndarray, target: np.ndarray):
+    """Округлення та обрізання до 0-255 з записом у буфер uint8"""
+    pixels += 0.5
+    np.clip(pixels, 0, 255, out=pixels)
+    target[...] = pixels
+
+
+# ===== NumPy / PIL ↔ QImage =====
+
+# Кількість каналів → формат QImage з тим самим порядком байтів
+_CHANNEL_FORMATS = {
+    1: QImage.Format.Format_Grayscale8,
+    3: QImage.Format.Format_RGB888,
+    4: QImage.Format.Format_RGBA8888,
+}
+_FORMAT_CHANNELS = {image_format: channels for channels, image_format in _CHANNEL_FORMATS.items()}
+
+
+def array_to_qimage(pixels: np.ndarray) -> QImage:
+    """Обгортає масив uint8 (H, W), (H, W, 3) або (H, W, 4) як QImage без копіювання.
+
+    QImage тримає посилання на масив, тому буфер живе стільки ж, скільки об'єкт QImage.
+    QPixmap.fromImage() або image.copy() — якщо пікселі потрібні довше за сам QImage.
+    """
+    if pixels.dtype != np.uint8:
+        raise ValueError("Очікується масив uint8")
+
+    channels = 1 if pixels.ndim == 2 else pixels.shape[2]
+    image_format = _CHANNEL_FORMATS.get(channels)
+    if image_format is None:
+        raise ValueError(f"Непідтримувана кількість каналів: {channels}")
+
+    # Рядки можуть мати будь-який крок, але пікселі в рядку мають іти суцільно
+    if not pixels.flags.c_contiguous:
+        pixels = np.ascontiguousarray(pixels)
+
+    height, width = pixels.shape[:2]
+    return QImage(pixels, width, height, pixels.strides[0], image_format)
+
+
+class _QImageMemory:
+    """Тримає QImage живим, поки на його пікселі посилається масив NumPy"""
+
+    def __init__(self, image: QImage, channels: int):
+        self.image = image
+        address = np.frombuffer(image.constBits(), dtype=np.uint8).ctypes.data
+        shape = (image.height(), image.width()) + ((channels,) if channels > 1 else ())
+        strides = (image.bytesPerLine(), channels) + ((1,) if channels > 1 else ())
+        self.__array_interface__ = {
+            'version': 3,
+            'shape': shape,
+            'typestr': '|u1',
+            'data': (address, True),
+            'strides': strides,
+        }
+
+
+def qimage_to_array(image: QImage) -> np.ndarray:
+    """Масив NumPy (лише для читання) поверх пікселів QImage без копіювання.
+
+    Grayscale8, RGB888 та RGBA8888 читаються напряму, інші формати спершу
+    конвертуються в RGB888 (або RGBA8888, якщо є прозорість).
+    """
+    channels = _FORMAT_CHANNELS.get(image.format())
+    if channels is None:
+        image_format = QImage.Format.Format_RGBA8888 if image.hasAlphaChannel() else QImage.Format.Format_RGB888
+        image = image.convertToFormat(image_format)
+        channels = _FORMAT_CHANNELS[image_format]
+    return np.asarray(_QImageMemory(image, channels))
+
+
+def pil_to_qimage(image: 'Image.Image') -> QImage:
+    """PIL → QImage однією копією (PIL не зберігає пікселі суцільним буфером)"""
+    if image.mode not in ('L', 'RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    return array_to_qimage(np.asarray(image))
+
@@ -0,0 +1,177 @@
+# utils/image_pyramid.py
+"""Піраміда зображення (mip-map) та спільний кеш декодованих фото.
+
+Рівень 0 — оригінал, кожен наступний удвічі менший. Перегляд бере найменший рівень,
+якого ще досить для поточного масштабу, і коригує лише видиму частину цього рівня (тайл),
+тож зум, пан і слайдери не обробляють повнорозмірне фото. Кілька панелей з тим самим
+фото (та повторне відкриття порівняння) користуються однією пірамідою з кешу.
+"""
+import math
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import shiboken6
+from PySide6.QtCore import QObject, Qt
+from PySide6.QtGui import QImage, QImageReader
+
+from utils.image_loader import get_image_loader
+from utils.image_processor import image_mean_luma, qimage_to_array
+
+
+# Рівні зменшуються, поки довша сторона більша за цей розмір
+MIN_LEVEL_SIDE = 256
+
+# Тайл вирівнюється по сітці з таким кроком (пікселі рівня) і має запас в одну клітинку,
+# тож невеликий пан лише зсуває вже готовий тайл
+TILE_SIZE = 256
+
+# Ліміт пам'яті кешу пірамід (байти): вміщує шість пірамід 12 Мп фото (по ~48 МБ);
+# піраміди відкритих панелей живуть і поза ним
+CACHE_LIMIT = 320 * 1024 * 1024
+
+
+class ImagePyramid:
+    """Рівні RGB888 одного фото: levels[k] зменшено приблизно в 2**k разів"""
+
+    def __init__(self, levels: List[QImage]):
+        self.levels = levels
+        self._arrays: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def from_image(cls, image: QImage) -> 'ImagePyramid':
+        """Будує рівні з декодованого оригіналу (безпечно поза GUI-потоком)"""
+        levels = [image.convertToFormat(QImage.Format.Format_RGB888)]
+        while max(levels[-1].width(), levels[-1].height()) > MIN_LEVEL_SIDE:
+            previous = levels[-1]
+            levels.append(previous.scaled(
+                max(1, previous.width() // 2),
+                max(1, previous.height() // 2),
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            ))
+        return cls(levels)
+
+    @property
+    def width(self) -> int:
+        return self.levels[0].width()
+
+    @property
+    def height(self) -> int:
+        return self.levels[0].height()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(level.sizeInBytes() for level in self.levels)
+
+    def level_for(self, scale: float) -> int:
+        """Найменший рівень, роздільності якого ще досить для масштабу scale (екран / оригінал)"""
+        if scale >= 1.0:
+            return 0
+        return min(int(math.log2(1.0 / scale)), len(self.levels) - 1)
+
+    def array(self, level: int) -> np.ndarray:
+        """Пікселі рівня як масив uint8 (H, W, 3) — вид на QImage без копіювання"""
+        pixels = self._arrays.get(level)
+        if pixels is None:
+            pixels = self._arrays[level] = qimage_to_array(self.levels[level])
+        return pixels
+
+    def mean_luma(self, brightness: float = 1.0) -> int:
+        """Середня яскравість всього фото (за найменшим рівнем) — спільна опорна точка контрасту для тайлів"""
+        return image_mean_luma(self.array(len(self.levels) - 1), brightness, step=1)
+
+
+def decode_pyramid(photo_path: str) -> Tuple[Optional[ImagePyramid], Optional[str]]:
+    """Декодує фото та будує піраміду (виконується у робочому потоці). Повертає (піраміда, помилка)"""
+    reader = QImageReader(photo_path)
+    image = reader.read()
+    if image.isNull():
+        return None, reader.errorString()
+    return ImagePyramid.from_image(image), None
+
+
+class PyramidCache:
+    """Спільний LRU-кеш пірамід: одне декодування на файл, скільки б панелей його не показували"""
+
+    def __init__(self, limit: int = CACHE_LIMIT):
+        self.limit = limit
+        self._pyramids: 'OrderedDict[tuple, ImagePyramid]' = OrderedDict()
+        self._bytes = 0
+        # Файли, що зараз декодуються → очікувачі (колбек, власник)
+        self._waiting: Dict[tuple, List[Tuple[Callable, Optional[QObject]]]] = {}
+
+    @staticmethod
+    def _key(photo_path: str) -> tuple:
+        """Ключ: шлях + mtime + розмір (змінений файл декодується заново)"""
+        stat = os.stat(photo_path)
+        return os.path.abspath(photo_path), stat.st_mtime_ns, stat.st_size
+
+    def cached(self, photo_path: str) -> Optional[ImagePyramid]:
+        """Готова піраміда з кешу або None"""
+        try:
+            key = self._key(photo_path)
+        except OSError:
+            return None
+        pyramid = self._pyramids.get(key)
+        if pyramid is not None:
+            self._pyramids.move_to_end(key)
+        return pyramid
+
+    def request(self, photo_path: str, callback: Callable[[Optional[ImagePyramid], Optional[str]], None],
+                owner: Optional[QObject] = None):
+        """callback(піраміда, помилка) у GUI-потоці; з кешу — одразу.
+
+        Одночасні запити того самого файлу чекають на одне декодування.
+        Колбек не викликається, якщо власника вже знищено.
+        """
+        try:
+            key = self._key(photo_path)
+        except OSError as e:
+            callback(None, str(e))
+            return
+
+        pyramid = self._pyramids.get(key)
+        if pyramid is not None:
+            self._pyramids.move_to_end(key)
+            callback(pyramid, None)
+            return
+
+        waiting = self._waiting.get(key)
+        if waiting is not None:
+            waiting.append((callback, owner))
+            return
+
+        self._waiting[key] = [(callback, owner)]
+        get_image_loader().load(lambda: decode_pyramid(photo_path),
+                                lambda result, k=key: self._on_decoded(k, result))
+
+    def _on_decoded(self, key: tuple, result):
+        pyramid, error = result if result is not None else (None, "невідома помилка")
+        if pyramid is not None:
+            self._store(key, pyramid)
+
+        for callback, owner in self._waiting.pop(key, []):
+            if owner is None or shiboken6.isValid(owner):
+                callback(pyramid, error)
+
+    def _store(self, key: tuple, pyramid: ImagePyramid):
+        self._pyramids[key] = pyramid
+        self._bytes += pyramid.nbytes
+        # Найдавніші витісняються; останню піраміду лишаємо, навіть якщо вона більша за ліміт
+        while self._bytes > self.limit and len(self._pyramids) > 1:
+            _, evicted = self._pyramids.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+
+# Глобальний кеш пірамід
+_pyramid_cache: Optional[PyramidCache] = None
+
+
+def get_pyramid_cache() -> PyramidCache:
+    """Спільний кеш пірамід для панелей перегляду фото"""
+    global _pyramid_cache
+    if _pyramid_cache is None:
+        _pyramid_cache = PyramidCache()
+    return _pyramid_cache
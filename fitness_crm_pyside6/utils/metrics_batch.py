@@ -0,0 +1,206 @@
+# utils/metrics_batch.py
+"""
+Векторизовані фітнес-показники для цілих вибірок (всі клієнти, вся історія вимірювань).
+
+Ті самі формули, що й у графі utils.calculations, але над стовпцями NumPy:
+один прохід на показник замість виклику Python-функції на кожен рядок.
+Відсутні або некоректні входи (None, NaN, <= 0) дають NaN у результаті —
+там, де скалярний FitnessCalculator повертає None.
+
+Округлення повторює Python round(), тож результати збігаються зі скалярними до біта.
+"""
+from typing import Any, Dict, Iterable, Mapping
+
+import numpy as np
+
+from utils.calculations import ACTIVITY_MULTIPLIERS, RAW_INPUTS, _is_male, client_metric_inputs
+
+
+# Пульсові зони: назва → (нижня, верхня) частка максимального пульсу
+HR_ZONES = {
+    'recovery': (0.4, 0.5),
+    'fat_burn': (0.6, 0.7),
+    'aerobic': (0.7, 0.8),
+    'anaerobic': (0.8, 0.9),
+    'maximum': (0.9, 1.0),
+}
+
+BMI_CATEGORIES = ("Недостатня вага", "Нормальна вага", "Надмірна вага", "Ожиріння")
+BMI_THRESHOLDS = (18.5, 25, 30)
+
+# Коди статі після перетворення стовпця gender
+GENDER_UNKNOWN, GENDER_FEMALE, GENDER_MALE = -1, 0, 1
+
+
+def _gender_code(gender: Any) -> int:
+    if not gender:
+        return GENDER_UNKNOWN
+    try:
+        return GENDER_MALE if _is_male(gender) else GENDER_FEMALE
+    except AttributeError:  # Не рядок
+        return GENDER_UNKNOWN
+
+
+def _map_values(values: Any, size: int, mapping, dtype) -> np.ndarray:
+    """Значення стовпця → масив через mapping (обчислюється один раз на унікальне значення)"""
+    if values is None or np.isscalar(values):
+        return np.full(size, mapping(values), dtype=dtype)
+
+    items = np.asarray(values, dtype=object).tolist()
+    try:
+        lookup = {value: mapping(value) for value in set(items)}
+    except TypeError:  # Нехешовані значення — по одному
+        return np.fromiter(map(mapping, items), dtype=dtype, count=len(items))
+    return np.fromiter(map(lookup.__getitem__, items), dtype=dtype, count=len(items))
+
+
+def _round(values: np.ndarray, digits: int = 0) -> np.ndarray:
+    """Округлення як у Python round(): половина — до парного, але за точним двійковим значенням.
+
+    np.round множить на 10**digits з округленням добутку, тож 0.15 (насправді 0.1499...)
+    дає 0.2 замість 0.1. Точна похибка множення (розщеплення Veltkamp) вирішує такі межові випадки.
+    """
+    scale = 10.0 ** digits
+    scaled = values * scale
+    rounded = np.rint(scaled)
+    if not digits:
+        return rounded
+
+    ties = np.flatnonzero(np.abs(scaled - np.trunc(scaled)) == 0.5)
+    if ties.size:
+        tie_values, tie_scaled = values[ties], scaled[ties]
+        split = tie_values * 134217729.0  # 2**27 + 1
+        high = split - (split - tie_values)
+        error = (high * scale - tie_scaled) + (tie_values - high) * scale  # values * scale == scaled + error точно
+        rounded[ties] = np.where(error > 0, np.ceil(tie_scaled), np.where(error < 0, np.floor(tie_scaled), rounded[ties]))
+    return rounded / scale
+
+
+def _numeric(values: Any, size: int, integer: bool = False) -> np.ndarray:
+    """Числовий стовпець float64; пропуски та значення <= 0 → NaN (як `if not value` у скалярних формулах)"""
+    if values is None:
+        return np.full(size, np.nan)
+    try:
+        column = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        column = np.array([_to_float(value) for value in np.asarray(values, dtype=object).ravel()])
+    column = np.broadcast_to(column, (size,)).astype(np.float64)
+    if integer:
+        column = np.trunc(column)  # int(age) у скалярному коді
+    column[~(column > 0)] = np.nan
+    return column
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value) if value else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _column_size(data: Mapping[str, Any]) -> int:
+    for name in RAW_INPUTS:
+        values = data.get(name)
+        if values is not None and not np.isscalar(values):
+            return len(values)
+    raise ValueError("Потрібен хоча б один стовпець вхідних даних")
+
+
+def calculate_metrics_batch(data: Mapping[str, Any], categories: bool = False):
+    """
+    Всі числові показники для стовпців weight, height, age, gender, activity_level.
+
+    data — словник масивів/списків однакової довжини або pandas.DataFrame
+    (відсутні стовпці вважаються пропусками). Повертає словник NumPy-масивів
+    або DataFrame з тим самим індексом, якщо на вході був DataFrame.
+    categories=True додає текстову категорію ІМТ (стовпець bmi_category).
+    """
+    size = _column_size(data)
+    weight = _numeric(data.get('weight'), size)
+    height = _numeric(data.get('height'), size)
+    age = _numeric(data.get('age'), size, integer=True)
+    gender = _map_values(data.get('gender'), size, _gender_code, np.int8)
+    multiplier = _map_values(data.get('activity_level'), size,
+                             lambda level: ACTIVITY_MULTIPLIERS.get(level, 1.2), np.float64)
+
+    male = gender == GENDER_MALE
+    unknown = gender == GENDER_UNKNOWN
+    complete = unknown | np.isnan(weight) | np.isnan(height) | np.isnan(age)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # ІМТ
+        bmi = _round(weight / (height / 100) ** 2, 1)
+        bmi[~(bmi > 0)] = np.nan
+
+        # Жир (Deurenberg) з округленого ІМТ, як у графі показників
+        body_fat = np.maximum(0, _round(1.20 * bmi + 0.23 * age - np.where(male, 16.2, 5.4), 1))
+        body_fat[unknown] = np.nan
+
+        # Ідеальна вага (Devine)
+        ideal_weight = _round(np.where(male, 50, 45.5) + 2.3 * np.maximum(0, height / 2.54 - 60), 1)
+        ideal_weight[unknown] = np.nan
+
+        # BMR (Harris-Benedict) та денні калорії
+        bmr = _round(np.where(male,
+                                88.362 + 13.397 * weight + 4.799 * height - 5.677 * age,
+                                447.593 + 9.247 * weight + 3.098 * height - 4.330 * age), 0)
+        bmr[complete] = np.nan
+        daily_calories = _round(bmr * multiplier, 0)
+        daily_calories[bmr == 0] = np.nan
+
+        # Вода: 35 мл на кг ваги
+        water_intake = _round(weight * 35 / 1000, 1)
+
+        # М'язова маса (Janssen)
+        muscle_mass = np.maximum(0, _round(np.where(male,
+                                                      0.407 * weight + 0.267 * height - 0.049 * age,
+                                                      0.252 * weight + 0.473 * height - 0.048 * age) + 2.513, 1))
+        muscle_mass[complete] = np.nan
+        muscle_percentage = _round(muscle_mass / weight * 100, 1)
+
+    result = {
+        'bmi': bmi,
+        'body_fat_percentage': body_fat,
+        'ideal_weight': ideal_weight,
+        'bmr': bmr,
+        'daily_calories': daily_calories,
+        'daily_calories_weight_loss': np.trunc(_round(daily_calories * 0.8, 0)),
+        'daily_calories_weight_gain': np.trunc(_round(daily_calories * 1.2, 0)),
+        'water_intake': water_intake,
+        'muscle_mass_kg': muscle_mass,
+        'muscle_percentage': muscle_percentage,
+        'max_hr': 220 - age,
+    }
+    # Межі пульсових зон — int() у скалярному коді, тобто відкидання дробової частини
+    for zone, (low, high) in HR_ZONES.items():
+        result[f'hr_{zone}_low'] = np.trunc(result['max_hr'] * low)
+        result[f'hr_{zone}_high'] = np.trunc(result['max_hr'] * high)
+
+    if categories:
+        codes = np.searchsorted(BMI_THRESHOLDS, bmi, side='right')
+        labels = np.array(BMI_CATEGORIES + ("Не визначено",), dtype=object)
+        result['bmi_category'] = labels[np.where(np.isnan(bmi), len(BMI_CATEGORIES), codes)]
+
+    index = getattr(data, 'index', None)
+    if index is not None and hasattr(data, 'columns'):  # pandas.DataFrame
+        import pandas as pd
+        return pd.DataFrame(result, index=index)
+    return result
+
+
+def metric_columns(rows: Iterable[Mapping[str, Any]]) -> Dict[str, np.ndarray]:
+    """Рядки-словники з сирими входами (як для calculate_all_metrics) → стовпці для calculate_metrics_batch"""
+    rows = list(rows)
+    columns = {}
+    for name in RAW_INPUTS:
+        values = [row.get(name) for row in rows]
+        if name in ('gender', 'activity_level'):
+            columns[name] = np.array(values, dtype=object)
+        else:
+            columns[name] = np.array([np.nan if value is None else _to_float(value) for value in values])
+    return columns
+
+
+def client_metric_columns(clients: Iterable[Mapping[str, Any]], today=None) -> Dict[str, np.ndarray]:
+    """Записи клієнтів (поля вкладок редагування) → стовпці для calculate_metrics_batch"""
+    return metric_columns(client_metric_inputs(client, today) for client in clients)
@@ -0,0 +1,80 @@
+# utils/photo_import.py
+"""Пакетний імпорт фото тестування: підготовка кожного файлу в робочому потоці.
+
+Для кожного файлу: копія оригіналу в сховище медіафайлів, дата зйомки з EXIF,
+поворот за EXIF Orientation та робоча копія з обмеженою роздільністю (master) —
+її показують картки й порівняння замість повнорозмірного оригіналу.
+"""
+import io
+import os
+from datetime import datetime
+from typing import Optional
+
+from models.media_store import get_media_store
+from utils.image_loader import AsyncImageLoader
+
+
+# Найбільша сторона робочої копії; менші фото без повороту використовуються як є
+MASTER_MAX_SIDE = 2560
+MASTER_QUALITY = 90
+
+EXIF_ORIENTATION = 0x0112
+EXIF_DATETIME = 0x0132
+EXIF_IFD = 0x8769
+EXIF_DATETIME_ORIGINAL = 0x9003
+
+
+def read_exif_date(image) -> Optional[str]:
+    """Дата зйомки з EXIF у форматі картки (dd.MM.yyyy) або None"""
+    exif = image.getexif()
+    for value in (exif.get_ifd(EXIF_IFD).get(EXIF_DATETIME_ORIGINAL), exif.get(EXIF_DATETIME)):
+        try:
+            return datetime.strptime(str(value).strip('\x00 ')[:19], "%Y:%m:%d %H:%M:%S").strftime("%d.%m.%Y")
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def prepare_testing_photo(source_path: str, max_side: int = MASTER_MAX_SIDE) -> dict:
+    """Імпортує файл у сховище та готує робочу копію (виконується поза GUI-потоком).
+
+    Повертає {'path' (робоча копія), 'original_path', 'date_taken' (None — без EXIF), 'source'}.
+    """
+    from PIL import Image, ImageOps
+
+    media_store = get_media_store()
+    original_path = media_store.import_file(source_path)
+
+    with Image.open(original_path) as image:
+        date_taken = read_exif_date(image)
+        rotated = image.getexif().get(EXIF_ORIENTATION, 1) not in (0, 1)
+        if rotated or max(image.size) > max_side:
+            # JPEG одразу декодується зменшеним (кратно 2), далі — точне масштабування
+            image.draft('RGB', (max_side, max_side))
+            master = ImageOps.exif_transpose(image).convert('RGB')
+            master.thumbnail((max_side, max_side), Image.LANCZOS)
+
+            buffer = io.BytesIO()
+            master.save(buffer, 'JPEG', quality=MASTER_QUALITY, optimize=True)
+            master_path = media_store.import_bytes(buffer.getvalue(), '.jpg')
+        else:
+            master_path = original_path
+
+    return {
+        'path': master_path,
+        'original_path': original_path,
+        'date_taken': date_taken,
+        'source': os.path.basename(source_path),
+    }
+
+
+# Окремий пул, щоб імпорт не затримував мініатюри карток, які він же й додає
+_import_loader: Optional[AsyncImageLoader] = None
+
+
+def get_import_loader() -> AsyncImageLoader:
+    """Пул потоків для підготовки фото при імпорті"""
+    global _import_loader
+    if _import_loader is None:
+        _import_loader = AsyncImageLoader(max_threads=max(1, (os.cpu_count() or 2) // 2))
+    return _import_loader
@@ -0,0 +1,240 @@
+# utils/thumbnail_cache.py
+"""Кеш мініатюр фотографій: диск (за шляхом + mtime + розміром) та LRU QPixmap у пам'яті"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+
+from PySide6.QtCore import Qt, QObject, QRect, QRunnable, QSize, QThreadPool
+from PySide6.QtGui import QImage, QImageReader, QPainter, QPainterPath, QPixmap
+
+from utils.image_loader import get_image_loader
+
+
+CACHE_DIR = os.path.join("data", "cache", "thumbnails")
+
+# Ліміт пам'яті для QPixmap у LRU (байти)
+MEMORY_LIMIT = 64 * 1024 * 1024
+
+
+class ThumbnailSpec(NamedTuple):
+    """Розмір та спосіб вписування мініатюри"""
+    width: int
+    height: int
+    mode: str  # "crop" — заповнити та обрізати по центру, "fit" — вписати, "circle" — круглий аватар
+
+
+THUMBNAIL_SPECS: Dict[str, ThumbnailSpec] = {
+    'card': ThumbnailSpec(270, 350, 'crop'),  # Фото на картці клієнта
+    'avatar': ThumbnailSpec(60, 60, 'circle'),  # Аватар у списку клієнтів
+    'testing': ThumbnailSpec(238, 238, 'fit'),  # Фото на картці тестування
+}
+
+
+def render_thumbnail(photo_path: str, kind: str) -> Optional[QImage]:
+    """Декодує фото одразу в зменшеному розмірі та формує мініатюру (безпечно поза GUI-потоком)"""
+    spec = THUMBNAIL_SPECS[kind]
+    reader = QImageReader(photo_path)
+    source_size = reader.size()
+    target = QSize(spec.width, spec.height)
+
+    if source_size.isValid():
+        # JPEG та інші формати вміють декодувати одразу в меншому розмірі
+        aspect = Qt.KeepAspectRatio if spec.mode == 'fit' else Qt.KeepAspectRatioByExpanding
+        scaled_size = source_size.scaled(target, aspect)
+        if scaled_size.width() < source_size.width():
+            reader.setScaledSize(scaled_size)
+
+    image = reader.read()
+    if image.isNull():
+        return None
+
+    if spec.mode == 'fit':
+        return image.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    # Заповнюємо розмір і обрізаємо по центру
+    image = image.scaled(target, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    x = (image.width() - spec.width) // 2
+    y = (image.height() - spec.height) // 2
+    image = image.copy(x, y, spec.width, spec.height)
+
+    if spec.mode == 'circle':
+        rounded = QImage(target, QImage.Format_ARGB32_Premultiplied)
+        rounded.fill(Qt.transparent)
+        painter = QPainter(rounded)
+        painter.setRenderHint(QPainter.Antialiasing)
+        path = QPainterPath()
+        path.addEllipse(QRect(0, 0, spec.width, spec.height))
+        painter.setClipPath(path)
+        painter.drawImage(0, 0, image)
+        painter.end()
+        image = rounded
+
+    return image
+
+
+class _PrefetchTask(QRunnable):
+    """Фонова генерація мініатюр на диск"""
+
+    def __init__(self, cache: 'ThumbnailCache', photo_path: str, kind: str):
+        super().__init__()
+        self.cache = cache
+        self.photo_path = photo_path
+        self.kind = kind
+
+    def run(self):
+        try:
+            self.cache.ensure_on_disk(self.photo_path, self.kind)
+        except Exception as e:
+            print(f"⚠️ Не вдалося створити мініатюру {os.path.basename(self.photo_path)}: {e}")
+        finally:
+            self.cache._finish_prefetch(self.photo_path, self.kind)
+
+
+class ThumbnailCache:
+    """Генерує мініатюри один раз і віддає повторні завантаження без читання оригіналу"""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, memory_limit: int = MEMORY_LIMIT):
+        self.cache_dir = cache_dir
+        self.memory_limit = memory_limit
+        self._memory: 'OrderedDict[str, QPixmap]' = OrderedDict()  # ключ → QPixmap (LRU)
+        self._memory_bytes = 0
+        self._pending = set()  # (шлях, вид) у фоновій генерації
+        self._lock = threading.Lock()
+
+    # ===== КЛЮЧІ ТА ШЛЯХИ =====
+
+    @staticmethod
+    def cache_key(photo_path: str, kind: str) -> Optional[str]:
+        """Ключ кешу: абсолютний шлях + mtime + розмір файлу + вид мініатюри"""
+        try:
+            stat = os.stat(photo_path)
+        except OSError:
+            return None
+
+        spec = THUMBNAIL_SPECS[kind]
+        raw = f"{os.path.abspath(photo_path)}|{stat.st_mtime_ns}|{stat.st_size}|{kind}|{spec.width}x{spec.height}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def disk_path(self, key: str, kind: str) -> str:
+        """Шлях до файлу мініатюри (PNG для аватарів з прозорістю, JPEG для решти)"""
+        extension = 'png' if THUMBNAIL_SPECS[kind].mode == 'circle' else 'jpg'
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{extension}")
+
+    # ===== ОТРИМАННЯ МІНІАТЮР =====
+
+    def cached_pixmap(self, photo_path: str, kind: str) -> Optional[QPixmap]:
+        """Мініатюра лише з пам'яті (без звернення до диску)"""
+        key = self.cache_key(photo_path, kind) if photo_path else None
+        return self._memory_get(key) if key else None
+
+    def request_pixmap(self, photo_path: str, kind: str, callback: Callable[[Optional[QPixmap]], None],
+                       owner: Optional[QObject] = None) -> Optional[int]:
+        """Асинхронно готує мініатюру у робочому потоці; callback(QPixmap або None) — у GUI-потоці.
+
+        Повертає номер запиту для get_image_loader().cancel() або None, якщо файлу немає.
+        """
+        if not photo_path or not os.path.exists(photo_path):
+            return None
+
+        def deliver(image: Optional[QImage]):
+            callback(self.put_image(photo_path, kind, image) if image is not None else None)
+
+        return get_image_loader().load(lambda: self.load_image(photo_path, kind), deliver, owner)
+
+    def put_image(self, photo_path: str, kind: str, image: QImage) -> QPixmap:
+        """Перетворює готову мініатюру в QPixmap (GUI-потік) та кладе її в кеш у пам'яті"""
+        pixmap = QPixmap.fromImage(image)
+        key = self.cache_key(photo_path, kind)
+        if key is not None:
+            self._memory_put(key, pixmap)
+        return pixmap
+
+    def load_image(self, photo_path: str, kind: str, key: Optional[str] = None) -> Optional[QImage]:
+        """QImage мініатюри з диску або згенерована з оригіналу (безпечно поза GUI-потоком)"""
+        key = key or self.cache_key(photo_path, kind)
+        if key is None:
+            return None
+
+        thumbnail_path = self.disk_path(key, kind)
+        if os.path.exists(thumbnail_path):
+            image = QImage(thumbnail_path)
+            if not image.isNull():
+                return image
+
+        image = render_thumbnail(photo_path, kind)
+        if image is not None:
+            self._save(image, thumbnail_path)
+        return image
+
+    def ensure_on_disk(self, photo_path: str, kind: str):
+        """Створює мініатюру на диску, якщо її ще немає"""
+        key = self.cache_key(photo_path, kind)
+        if key is not None and not os.path.exists(self.disk_path(key, kind)):
+            self.load_image(photo_path, kind, key)
+
+    def prefetch(self, photo_paths: Iterable[str], kind: str):
+        """Фоново генерує мініатюри на диск (QThreadPool), щоб наступні завантаження були миттєвими"""
+        pool = QThreadPool.globalInstance()
+        for photo_path in photo_paths:
+            if not photo_path or not os.path.exists(photo_path):
+                continue
+
+            with self._lock:
+                if (photo_path, kind) in self._pending:
+                    continue
+                self._pending.add((photo_path, kind))
+            pool.start(_PrefetchTask(self, photo_path, kind))
+
+    # ===== ДОПОМІЖНІ МЕТОДИ =====
+
+    def _finish_prefetch(self, photo_path: str, kind: str):
+        with self._lock:
+            self._pending.discard((photo_path, kind))
+
+    @staticmethod
+    def _save(image: QImage, thumbnail_path: str):
+        """Атомарно записує мініатюру на диск"""
+        os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+        extension = os.path.splitext(thumbnail_path)[1]
+        temp_path = f"{thumbnail_path}.{threading.get_ident()}.tmp{extension}"
+        if image.save(temp_path, None, 90):
+            os.replace(temp_path, thumbnail_path)
+        elif os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    def _memory_get(self, key: str) -> Optional[QPixmap]:
+        pixmap = self._memory.get(key)
+        if pixmap is not None:
+            self._memory.move_to_end(key)
+        return pixmap
+
+    def _memory_put(self, key: str, pixmap: QPixmap):
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= self._pixmap_bytes(old)
+
+        self._memory[key] = pixmap
+        self._memory_bytes += self._pixmap_bytes(pixmap)
+
+        # Витісняємо найдавніші мініатюри
+        while self._memory_bytes > self.memory_limit and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= self._pixmap_bytes(evicted)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+# Глобальний екземпляр кешу мініатюр
+_thumbnail_cache: Optional[ThumbnailCache] = None
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    """Спільний кеш мініатюр для всіх карток"""
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        _thumbnail_cache = ThumbnailCache()
+    return _thumbnail_cache